@@ -0,0 +1,206 @@
+"""
+Pre-aggregated views of the long table for the dashboard charts.
+
+The Trends and Geographic pages used to show matplotlib PNGs of the
+notebooks, and the decade table was typed in by hand. They now draw Plotly
+charts from a handful of small frames computed here, once per data version:
+
+- ``yearly_stats``: global mean, std, min and max across countries per year,
+- ``decade_stats``: the same per decade, with the years each decade covers,
+- ``country_rankings``: the ``n`` highest and lowest warming countries,
+- ``case_study_series``: smoothed yearly series of the ``CASE_STUDIES``.
+
+The browser only receives these aggregates, never the long table. Line series
+are additionally thinned to ``max_points`` with Largest-Triangle-Three-Buckets
+(``lttb``), which keeps the visual shape (peaks and troughs) of a series with
+far fewer points, so payloads stay bounded once monthly or sub-national series
+are added.
+
+Offline the views come from the ``climate_long`` artifact
+(``load_trend_views``); in live mode ``src.db`` builds the same frames from the
+rollup tables of ``src.rollups``:
+
+    views = build_trend_views(df)
+    views['yearly'].tail()
+    decimate(views['case_studies'], 'year', 'value', 200, by='country')
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.artifacts import artifact_source, read_artifact
+from src.data_loader import load_cached
+
+TOP_N = 15
+MIN_YEARS = 40             # countries with fewer years are left out of the rankings
+SMOOTHING_WINDOW = 5       # years, centred moving average of the case studies
+
+CASE_STUDIES = {
+    'Elongated (North-South)': ['Chile', 'Argentina'],
+    'Very Large (East-West)': ['Russia', 'Canada', 'China, mainland'],
+    'Compact Medium': ['Spain', 'France', 'Germany'],
+    'Very Small': ['Monaco', 'Luxembourg', 'Singapore']
+}
+
+YEARLY_COLUMNS = ['year', 'mean', 'std', 'min', 'max', 'countries']
+DECADE_COLUMNS = ['decade', 'mean', 'std', 'min', 'max', 'observations', 'first_year', 'last_year']
+COUNTRY_COLUMNS = ['country', 'iso3', 'mean_temp', 'min_temp', 'max_temp', 'years_data']
+RANKING_COLUMNS = COUNTRY_COLUMNS + ['group', 'rank']
+CASE_STUDY_COLUMNS = ['category', 'country', 'year', 'value']
+
+
+# ============================================
+# Downsampling
+# ============================================
+
+def lttb(x, y, n_out):
+    """Indices of the ``n_out`` points kept by Largest-Triangle-Three-Buckets.
+
+    ``x`` must be sorted. The first and last points are always kept; every
+    bucket in between keeps the point forming the largest triangle with the
+    previously kept point and the mean of the next bucket. All indices are
+    returned when the series has ``n_out`` points or fewer.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    n_out = max(int(n_out), 3)
+    if n <= n_out:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)   # n_out - 2 buckets over [1, n - 1)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = x[hi:edges[i + 2]].mean(), y[hi:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs((x[a] - next_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def decimate(frame, x, y, max_points, by=None):
+    """Rows of ``frame`` kept by ``lttb`` on ``(x, y)``, per ``by`` group if given.
+
+    Rows with a missing ``y`` are dropped; each group is sorted by ``x``.
+    """
+    frame = frame[frame[y].notna()]
+    groups = [frame] if by is None else [group for _, group in frame.groupby(by, sort=False, observed=True)]
+    kept = []
+    for group in groups:
+        group = group.sort_values(x, kind='stable')
+        kept.append(group.iloc[lttb(group[x].to_numpy(), group[y].to_numpy(), max_points)])
+    if not kept:
+        return frame.iloc[:0]
+    return pd.concat(kept, ignore_index=True)
+
+
+# ============================================
+# Views
+# ============================================
+
+def std_from_sums(n, total, total_sq):
+    """Sample standard deviation from ``COUNT``, ``SUM`` and ``SUM`` of squares (NaN for n < 2)."""
+    n = np.asarray(n, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var = (np.asarray(total_sq, dtype=np.float64) - np.asarray(total, dtype=np.float64) ** 2 / n) / (n - 1)
+    return np.where(n > 1, np.sqrt(np.clip(var, 0, None)), np.nan)
+
+
+def _long(df):
+    return pd.DataFrame({
+        'country': df['country'].astype(str),
+        'iso3': df['iso3'].astype(str),
+        'year': df['year'].astype(np.int32),
+        'value': df['temperature_change'].astype(np.float64),
+    }).dropna(subset=['value'])
+
+
+def yearly_stats(df):
+    """One row per year: ``YEARLY_COLUMNS`` across countries."""
+    long = _long(df)
+    yearly = (long.groupby('year')['value']
+              .agg(['mean', 'std', 'min', 'max', 'count'])
+              .rename(columns={'count': 'countries'})
+              .reset_index())
+    return yearly[YEARLY_COLUMNS]
+
+
+def decade_stats(df):
+    """One row per decade: ``DECADE_COLUMNS`` over every (country, year) value."""
+    long = _long(df).assign(decade=lambda d: d['year'] // 10 * 10)
+    decades = long.groupby('decade').agg(
+        mean=('value', 'mean'), std=('value', 'std'), min=('value', 'min'), max=('value', 'max'),
+        observations=('value', 'count'), first_year=('year', 'min'), last_year=('year', 'max'),
+    ).reset_index()
+    return decades[DECADE_COLUMNS]
+
+
+def country_stats(df):
+    """One row per country: ``COUNTRY_COLUMNS``, warmest first (same as ``db.country_means``)."""
+    long = _long(df)
+    stats = long.groupby(['country', 'iso3']).agg(
+        mean_temp=('value', 'mean'), min_temp=('value', 'min'), max_temp=('value', 'max'),
+        years_data=('value', 'count'),
+    ).reset_index()
+    return stats.sort_values('mean_temp', ascending=False, kind='stable')[COUNTRY_COLUMNS]
+
+
+def country_rankings(stats, n=TOP_N, min_years=MIN_YEARS):
+    """The ``n`` highest and ``n`` lowest countries by ``mean_temp`` (``RANKING_COLUMNS``).
+
+    ``stats`` has ``COUNTRY_COLUMNS`` (``country_stats`` or ``db.country_means``).
+    ``rank`` is 1 for the warmest country of the 'highest' group and for the
+    coolest of the 'lowest' group.
+    """
+    stats = stats[stats['years_data'] >= min_years].sort_values('mean_temp', ascending=False, kind='stable')
+    highest = stats.head(n).assign(group='highest', rank=np.arange(1, min(n, len(stats)) + 1))
+    lowest = stats.tail(n).iloc[::-1]
+    lowest = lowest.assign(group='lowest', rank=np.arange(1, len(lowest) + 1))
+    return pd.concat([highest, lowest], ignore_index=True)[RANKING_COLUMNS]
+
+
+def case_study_series(df, case_studies=CASE_STUDIES, window=SMOOTHING_WINDOW):
+    """Centred ``window``-year moving average of every case-study country (``CASE_STUDY_COLUMNS``)."""
+    long = _long(df)
+    frames = []
+    for category, countries in case_studies.items():
+        for country in countries:
+            yearly = long[long['country'] == country].groupby('year')['value'].mean()
+            if len(yearly) == 0:
+                continue
+            smoothed = yearly.rolling(window=window, center=True).mean()
+            frames.append(pd.DataFrame({
+                'category': category, 'country': country,
+                'year': smoothed.index.to_numpy(), 'value': smoothed.to_numpy(),
+            }))
+    if not frames:
+        return pd.DataFrame(columns=CASE_STUDY_COLUMNS)
+    return pd.concat(frames, ignore_index=True)[CASE_STUDY_COLUMNS]
+
+
+def build_trend_views(df, n=TOP_N, min_years=MIN_YEARS):
+    """All views of the Trends and Geographic pages, from the long table."""
+    return {
+        'yearly': yearly_stats(df),
+        'decades': decade_stats(df),
+        'rankings': country_rankings(country_stats(df), n, min_years),
+        'case_studies': case_study_series(df),
+    }
+
+
+def load_trend_views():
+    """Views over the ``climate_long`` artifact, built once per file version (None if missing)."""
+    source = artifact_source('climate_long')
+    if source is None:
+        return None
+    return load_cached(
+        source,
+        lambda p: build_trend_views(read_artifact('climate_long')),
+        variant='trend_views',
+    )
@@ -0,0 +1,222 @@
+"""
+Typed columnar artifact store for ``reports/``.
+
+The notebooks used to write every result as a float-as-text CSV that the
+dashboard re-parsed and re-inferred on each load. Each artifact now has a
+declared schema and is written as Parquet (categorical identifiers, float32
+metrics, small integer years) next to a CSV export of the same data:
+
+    write_artifact(features_df, "clustering_results")
+    -> reports/clustering_results.parquet   (typed, read by the app)
+    -> reports/clustering_results.csv       (export, unchanged format)
+
+``read_artifact`` decodes only the requested columns from a memory-mapped
+Parquet file, and falls back to the CSV (cast to the same schema) when the
+Parquet file or ``pyarrow`` is missing.
+
+Convert the CSVs already in ``reports/`` with:
+
+    python -m src.artifacts
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from src.data_loader import REPORTS_DIR, load_cached, load_parquet
+
+_CLUSTER_METRICS = [
+    "mean_temp", "std_temp", "median_temp", "max_temp", "min_temp",
+    "warming_rate", "trend_r2", "early_mean", "early_std", "recent_mean",
+    "recent_std", "period_change", "acceleration",
+]
+
+# Declared column types of every artifact the dashboard consumes
+SCHEMAS = {
+    "climate_long": {
+        "country": "category",
+        "iso3": "category",
+        "year": "int16",
+        "temperature_change": "float32",
+    },
+    "clustering_results": {
+        "country": "category",
+        "iso3": "category",
+        **{col: "float32" for col in _CLUSTER_METRICS},
+        "years_data": "int16",
+        "cluster": "int8",
+    },
+    "clustering_results_named": {
+        "country": "category",
+        "iso3": "category",
+        **{col: "float32" for col in _CLUSTER_METRICS},
+        "years_data": "int16",
+        "cluster": "int8",
+        "cluster_name": "category",
+        "cluster_description": "category",
+    },
+    "temperature_projections_2030": {
+        "Year": "int16",
+        "Linear_Projection": "float32",
+        "Linear_CI_Lower": "float32",
+        "Linear_CI_Upper": "float32",
+        "Quadratic_Projection": "float32",
+        "Quadratic_CI_Lower": "float32",
+        "Quadratic_CI_Upper": "float32",
+    },
+    "country_projections": {
+        "country": "category",
+        "iso3": "category",
+        "model": "category",
+        "year": "int16",
+        "projection": "float32",
+        "pi_lower": "float32",
+        "pi_upper": "float32",
+    },
+    "country_uncertainty": {
+        "country": "category",
+        "iso3": "category",
+        "model": "category",
+        "method": "category",
+        "year": "int16",
+        "boot_lower": "float32",
+        "boot_median": "float32",
+        "boot_upper": "float32",
+    },
+    "model_zoo_forecasts": {
+        "country": "category",
+        "iso3": "category",
+        "model": "category",
+        "year": "int16",
+        "forecast": "float32",
+        "lower": "float32",
+        "upper": "float32",
+    },
+    "backtest_metrics": {
+        "model": "category",
+        "horizon": "int16",
+        "n": "int32",
+        "mae": "float32",
+        "rmse": "float32",
+        "bias": "float32",
+        "coverage": "float32",
+    },
+    "country_changepoints": {
+        "country": "category",
+        "iso3": "category",
+        "break_year": "int16",
+        "pre_slope": "float32",
+        "post_slope": "float32",
+        "slope_change": "float32",
+        "f_stat": "float32",
+        "p_value": "float32",
+        "significant": "bool",
+        "n_breaks": "int8",
+        "break_years": "category",
+    },
+    "country_exceedance": {
+        "country": "category",
+        "iso3": "category",
+        "threshold": "float32",
+        "crossing_year": "float32",
+        "boot_lower": "float32",
+        "boot_median": "float32",
+        "boot_upper": "float32",
+        "p_by_horizon": "float32",
+        "status": "category",
+    },
+}
+
+
+def _have_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def artifact_paths(name, reports_dir=REPORTS_DIR):
+    """Return ``(parquet_path, csv_path)`` for artifact ``name``."""
+    reports_dir = Path(reports_dir)
+    return reports_dir / f"{name}.parquet", reports_dir / f"{name}.csv"
+
+
+def apply_schema(df, name):
+    """Cast the columns of ``df`` to the declared schema of artifact ``name``.
+
+    Columns that are not part of the schema are kept as they are; schema
+    columns missing from ``df`` are ignored (column projection).
+    """
+    if name not in SCHEMAS:
+        raise KeyError(f"Unknown artifact '{name}'. Declared artifacts: {sorted(SCHEMAS)}")
+    casts = {col: dtype for col, dtype in SCHEMAS[name].items() if col in df.columns}
+    return df.astype(casts)
+
+
+def write_artifact(df, name, reports_dir=REPORTS_DIR, csv=True):
+    """Write ``df`` as a typed Parquet artifact, plus a CSV export.
+
+    The CSV is written from ``df`` as given, so its text format does not change
+    for downstream users of the exports. Returns the Parquet path.
+    """
+    parquet_path, csv_path = artifact_paths(name, reports_dir)
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+
+    apply_schema(df, name).to_parquet(parquet_path, index=False, engine="pyarrow")
+    if csv:
+        df.to_csv(csv_path, index=False)
+    return parquet_path
+
+
+def artifact_source(name, reports_dir=REPORTS_DIR):
+    """Path of the file ``read_artifact`` would decode for ``name`` (None if missing)."""
+    parquet_path, csv_path = artifact_paths(name, reports_dir)
+    if parquet_path.exists() and _have_pyarrow():
+        return parquet_path
+    if csv_path.exists():
+        return csv_path
+    return None
+
+
+def read_artifact(name, columns=None, reports_dir=REPORTS_DIR):
+    """Load artifact ``name`` with the declared dtypes.
+
+    Reads the memory-mapped Parquet file when available, decoding only
+    ``columns``; otherwise parses the CSV export. Both paths go through the
+    process-wide cache of ``src.data_loader``. Returns None if neither exists.
+    """
+    source = artifact_source(name, reports_dir)
+    if source is None:
+        return None
+    if source.suffix == ".parquet":
+        return load_parquet(source, columns=columns)
+
+    if columns is not None:
+        columns = list(columns)
+    return load_cached(
+        source,
+        lambda p: apply_schema(pd.read_csv(p, usecols=columns), name),
+        variant=("schema", columns),
+    )
+
+
+def convert_csv_artifacts(reports_dir=REPORTS_DIR):
+    """Write a Parquet file for every declared artifact that only exists as CSV.
+
+    Names that already have a Parquet file are skipped (delete it to convert
+    the CSV again).
+    """
+    written = []
+    for name in SCHEMAS:
+        parquet_path, csv_path = artifact_paths(name, reports_dir)
+        if csv_path.exists() and not parquet_path.exists():
+            df = pd.read_csv(csv_path)
+            apply_schema(df, name).to_parquet(parquet_path, index=False, engine="pyarrow")
+            written.append(parquet_path)
+    return written
+
+
+if __name__ == "__main__":
+    for path in convert_csv_artifacts():
+        print(f"✅ {path}")
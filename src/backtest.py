@@ -0,0 +1,362 @@
+"""
+Walk-forward backtesting of the projection and risk models.
+
+The Future Projections page validates its trend models on a single split
+(train 1961-2012, test 2013-2022). Here every model family is evaluated with
+an expanding window over every cutoff year and every country: fit on the
+years ``<= cutoff``, forecast ``cutoff + 1 ... cutoff + max_horizon`` and
+compare with what was observed.
+
+- ``linear`` / ``quadratic`` (``src.projections``): the normal equations of a
+  window are sums over its years, so cumulative sums of ``w·x·xᵀ``, ``w·x·y``,
+  ``w·y²`` and ``w`` along the year axis give the sufficient statistics of
+  every cutoff at once. Fits, prediction intervals and errors of all
+  (country, cutoff, horizon) folds are then batched array operations; nothing
+  is refitted from scratch.
+- ``logistic_risk`` (``src.risk``): one pooled classifier per (cutoff,
+  horizon). For horizon ``h`` the features of year ``t`` predict the outcome
+  of year ``t + h``, so a forecast made at a cutoff only reads data up to the
+  cutoff, and training uses the pairs whose outcome is known by then. The
+  scaler of each horizon is updated with ``partial_fit`` on the newly added
+  pairs only, and each fit warm-starts from the previous cutoff's
+  coefficients. Forecast errors are ``probability - outcome`` (so ``rmse`` is
+  the root Brier score) and there is no interval coverage.
+
+Countries (trend models) or blocks of cutoffs (risk model) can be spread
+over a process pool. ``metrics_cube`` turns the fold errors into MAE, RMSE,
+bias and interval coverage by model and horizon (or any other grouping):
+
+    errors = walk_forward(df)
+    cube = metrics_cube(errors)
+    write_artifact(cube, 'backtest_metrics')
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from src.features import MIN_YEARS
+from src.projections import CONFIDENCE, MODELS, country_year_matrix, design_matrix
+
+MAX_HORIZON = 10
+FIRST_CUTOFF = 1990
+FAMILIES = ('linear', 'quadratic', 'logistic_risk')
+
+ERROR_COLUMNS = [
+    'country', 'model', 'cutoff', 'horizon', 'year', 'forecast', 'actual', 'error', 'covered',
+]
+METRIC_COLUMNS = ['model', 'horizon', 'n', 'mae', 'rmse', 'bias', 'coverage']
+
+
+# ============================================
+# Trend models: cumulative sufficient statistics
+# ============================================
+
+def cumulative_statistics(years, values, degree, center):
+    """Normal-equation sums of every expanding window.
+
+    Entry ``k`` along axis 1 covers the years ``years[:k + 1]``. Returns a
+    dict with ``xtx`` (countries, years, p, p), ``xty`` (countries, years, p),
+    ``yty`` and ``n`` (countries, years).
+    """
+    X = design_matrix(years, degree, center)
+    observed = ~np.isnan(values)
+    y = np.where(observed, values, 0.0)
+    w = observed.astype(np.float64)
+    return {
+        'xtx': np.cumsum(np.einsum('cy,yi,yj->cyij', w, X, X), axis=1),
+        'xty': np.cumsum(y[..., None] * X[None], axis=1),
+        'yty': np.cumsum(y * y, axis=1),
+        'n': np.cumsum(w, axis=1),
+    }
+
+
+def trend_folds(years, values, degree, center, cutoffs, max_horizon=MAX_HORIZON,
+                confidence=CONFIDENCE, min_years=MIN_YEARS):
+    """Forecasts of every (country, cutoff, horizon) fold of one polynomial model.
+
+    ``cutoffs`` are indices into ``years``. Returns ``(forecast, actual,
+    covered)``, each ``(countries, cutoffs, max_horizon)``; ``actual`` is NaN
+    where the target year is missing or beyond the data, ``forecast`` is NaN
+    where the training window is too short.
+    """
+    sums = cumulative_statistics(years, values, degree, center)
+    p = degree + 1
+    xtx, xty = sums['xtx'][:, cutoffs], sums['xty'][:, cutoffs]
+    yty, n = sums['yty'][:, cutoffs], sums['n'][:, cutoffs]
+    dof = n - p
+    ok = (dof >= 1) & (n >= min_years)
+
+    xtx_inv = np.full(xtx.shape, np.nan)
+    xtx_inv[ok] = np.linalg.inv(xtx[ok])
+    beta = np.einsum('ckij,ckj->cki', xtx_inv, xty)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        s2 = np.maximum(yty - np.einsum('cki,cki->ck', beta, xty), 0) / dof
+
+    target = years[cutoffs][:, None] + np.arange(1, max_horizon + 1)   # (cutoffs, horizons)
+    X0 = design_matrix(target.ravel(), degree, center).reshape(*target.shape, p)
+    forecast = np.einsum('cki,khi->ckh', beta, X0)
+    leverage = np.einsum('khi,ckij,khj->ckh', X0, xtx_inv, X0)
+    t_crit = stats.t.ppf(0.5 + confidence / 2, np.where(ok, dof, np.nan))
+    half_width = t_crit[..., None] * np.sqrt(s2[..., None] * (1 + leverage))
+
+    # Observed value of each target year (NaN if the year is not in the table)
+    column = np.searchsorted(years, target)
+    in_table = (column < len(years)) & (years[np.minimum(column, len(years) - 1)] == target)
+    actual = np.where(in_table[None], values[:, np.minimum(column, len(years) - 1)], np.nan)
+
+    covered = np.abs(forecast - actual) <= half_width
+    return forecast, actual, covered
+
+
+_trend = None
+
+
+def _init_trend_worker(state):
+    global _trend
+    _trend = state
+
+
+def _run_trend_chunk(rows):
+    years, values, degree, center, cutoffs, options = _trend
+    return trend_folds(years, values[rows], degree, center, cutoffs, **options)
+
+
+def _chunks(n, n_jobs):
+    n_jobs = min(n_jobs or os.cpu_count() or 1, max(n, 1))
+    return n_jobs, [rows for rows in np.array_split(np.arange(n), n_jobs) if len(rows)]
+
+
+def backtest_trends(df, models=MODELS, first_cutoff=FIRST_CUTOFF, max_horizon=MAX_HORIZON,
+                    confidence=CONFIDENCE, min_years=MIN_YEARS, n_jobs=1):
+    """Walk-forward errors of the polynomial trend models (``ERROR_COLUMNS``).
+
+    Every year from ``first_cutoff`` to the second-to-last year is a cutoff.
+    ``n_jobs`` > 1 (or None for all cores) splits the countries over a
+    process pool.
+    """
+    countries, _, years, values = country_year_matrix(df)
+    cutoffs = np.flatnonzero((years >= first_cutoff) & (years < years.max()))
+    center = years.mean()
+    options = {'max_horizon': max_horizon, 'confidence': confidence, 'min_years': min_years}
+    if len(countries) == 0 or len(cutoffs) == 0:
+        return _finish([])
+
+    frames = []
+    for name, degree in models.items():
+        state = (years, values, degree, center, cutoffs, options)
+        n_jobs_used, chunks = _chunks(len(countries), n_jobs)
+        if n_jobs_used == 1:
+            _init_trend_worker(state)
+            try:
+                results = [_run_trend_chunk(rows) for rows in chunks]
+            finally:
+                _init_trend_worker(None)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs_used,
+                initializer=_init_trend_worker,
+                initargs=(state,),
+            ) as pool:
+                results = list(pool.map(_run_trend_chunk, chunks))
+        forecast, actual, covered = (np.concatenate(parts) for parts in zip(*results))
+        frames.append(_fold_frame(name, countries, years[cutoffs], forecast, actual, covered))
+    return _finish(frames)
+
+
+def _fold_frame(name, countries, cutoff_years, forecast, actual, covered):
+    n_countries, n_cutoffs, n_horizons = forecast.shape
+    horizon = np.arange(1, n_horizons + 1)
+    cutoff = np.broadcast_to(cutoff_years[None, :, None], forecast.shape)
+    keep = ~np.isnan(forecast) & ~np.isnan(actual)
+    return pd.DataFrame({
+        'country': np.broadcast_to(np.asarray(countries)[:, None, None], forecast.shape)[keep],
+        'model': name,
+        'cutoff': cutoff[keep],
+        'horizon': np.broadcast_to(horizon, forecast.shape)[keep],
+        'year': (cutoff + horizon)[keep],
+        'forecast': forecast[keep],
+        'actual': actual[keep],
+        'error': (forecast - actual)[keep],
+        'covered': covered[keep].astype(np.float64),
+    })
+
+
+# ============================================
+# Risk classifier: incremental scaler + warm start
+# ============================================
+
+_risk = None
+
+
+def _init_risk_worker(state):
+    global _risk
+    _risk = state
+
+
+def _run_risk_block(cutoffs):
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.preprocessing import StandardScaler
+
+    X, target, year, pairs = _risk
+    results = []
+    for horizon, (source, dest) in enumerate(pairs, start=1):
+        outcome_year = year[dest]                           # pairs are sorted by outcome year
+        scaler = StandardScaler()
+        model = LogisticRegression(random_state=42, class_weight='balanced', warm_start=True, max_iter=1000)
+        fitted_to = 0
+        for cutoff in cutoffs:
+            end = np.searchsorted(outcome_year, cutoff, side='right')
+            if end > fitted_to:
+                scaler.partial_fit(X[source[fitted_to:end]])
+                fitted_to = end
+            if len(np.unique(target[dest[:end]])) < 2:
+                continue
+            model.fit(scaler.transform(X[source[:end]]), target[dest[:end]])
+
+            # Outcome year cutoff + horizon, i.e. features of the cutoff year
+            lo = np.searchsorted(outcome_year, cutoff + horizon, side='left')
+            hi = np.searchsorted(outcome_year, cutoff + horizon, side='right')
+            if hi > lo:
+                probability = model.predict_proba(scaler.transform(X[source[lo:hi]]))[:, 1]
+                results.append((cutoff, dest[lo:hi], probability))
+    return results
+
+
+def horizon_pairs(country, year, max_horizon=MAX_HORIZON):
+    """Row pairs ``h`` years apart within a country, for ``h = 1 ... max_horizon``.
+
+    Returns a list of ``(source, dest)`` index arrays: row ``source[k]`` is year
+    ``t`` and row ``dest[k]`` year ``t + h`` of the same country, sorted by
+    ``t + h``. Missing years simply have no pair.
+    """
+    codes = pd.factorize(np.asarray(country))[0].astype(np.int64)
+    span = int(year.max()) + max_horizon + 1
+    keys = codes * span + year
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    pairs = []
+    for horizon in range(1, max_horizon + 1):
+        position = np.minimum(np.searchsorted(sorted_keys, keys + horizon), len(keys) - 1)
+        found = sorted_keys[position] == keys + horizon
+        source, dest = np.flatnonzero(found), order[position[found]]
+        by_outcome = np.argsort(year[dest], kind='stable')
+        pairs.append((source[by_outcome], dest[by_outcome]))
+    return pairs
+
+
+def backtest_risk(df, first_cutoff=FIRST_CUTOFF, max_horizon=MAX_HORIZON, n_jobs=1):
+    """Walk-forward errors of the logistic risk classifier (``ERROR_COLUMNS``).
+
+    Features are built once for the whole table with ``src.risk``. The rolling
+    windows only look backwards, the first change rate of a country (which
+    ``risk_features`` back-fills from the next year) is set to 0, and
+    ``year_scaled`` maps years with a range known at the first cutoff. The
+    forecast ``h`` years ahead of a cutoff uses the features of the cutoff
+    year (see ``horizon_pairs``), so a cutoff never sees its future.
+    ``n_jobs`` > 1 splits the cutoffs into contiguous blocks, each
+    warm-starting on its own (probabilities then differ from ``n_jobs=1``
+    within the solver tolerance).
+    """
+    from src.risk import DEFAULT_FEATURE_SPEC, RISK_FEATURES, risk_features
+
+    df = df[['country', 'year', 'temperature_change']].dropna(subset=['temperature_change'])
+    df = df.assign(country=df['country'].astype(str)).sort_values(['country', 'year'], kind='stable')
+    year = df['year'].to_numpy(dtype=np.int64)
+    if len(df) == 0:
+        return _finish([])
+
+    first_year = int(year.min())
+    spec = {**DEFAULT_FEATURE_SPEC, 'year_range': [first_year, max(int(first_cutoff), first_year + 1)]}
+    X = risk_features(df, spec).to_numpy()
+    country = df['country'].to_numpy()
+    first_row = np.r_[True, country[1:] != country[:-1]]
+    X[first_row, RISK_FEATURES.index('temp_change_rate')] = 0.0
+    target = (df['temperature_change'].to_numpy() > spec['threshold']).astype(int)
+
+    cutoffs = np.unique(year[(year >= first_cutoff) & (year < year.max())])
+    state = (X, target, year, horizon_pairs(country, year, max_horizon))
+    n_jobs_used, blocks = _chunks(len(cutoffs), n_jobs)
+    blocks = [cutoffs[rows] for rows in blocks]
+    if n_jobs_used == 1:
+        _init_risk_worker(state)
+        try:
+            results = [_run_risk_block(block) for block in blocks]
+        finally:
+            _init_risk_worker(None)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs_used,
+            initializer=_init_risk_worker,
+            initargs=(state,),
+        ) as pool:
+            results = list(pool.map(_run_risk_block, blocks))
+
+    frames = []
+    for cutoff, rows, probability in (fold for block in results for fold in block):
+        actual = target[rows].astype(np.float64)
+        frames.append(pd.DataFrame({
+            'country': country[rows],
+            'model': 'logistic_risk',
+            'cutoff': cutoff,
+            'horizon': year[rows] - cutoff,
+            'year': year[rows],
+            'forecast': probability,
+            'actual': actual,
+            'error': probability - actual,
+            'covered': np.nan,
+        }))
+    return _finish(frames)
+
+
+# ============================================
+# Driver and metrics
+# ============================================
+
+def _finish(frames):
+    if not frames:
+        return pd.DataFrame(columns=ERROR_COLUMNS)
+    errors = pd.concat(frames, ignore_index=True)[ERROR_COLUMNS]
+    return errors.astype({'country': str, 'cutoff': np.int16, 'horizon': np.int16, 'year': np.int16})
+
+
+def walk_forward(df, families=FAMILIES, first_cutoff=FIRST_CUTOFF, max_horizon=MAX_HORIZON,
+                 confidence=CONFIDENCE, min_years=MIN_YEARS, n_jobs=1):
+    """Fold errors of every model family, one row per (model, country, cutoff, horizon)."""
+    frames = []
+    trend_models = {name: MODELS[name] for name in families if name in MODELS}
+    if trend_models:
+        frames.append(backtest_trends(df, trend_models, first_cutoff, max_horizon,
+                                      confidence, min_years, n_jobs))
+    if 'logistic_risk' in families:
+        frames.append(backtest_risk(df, first_cutoff, max_horizon, n_jobs))
+    return _finish([frame for frame in frames if len(frame)])
+
+
+def metrics_cube(errors, by=('model', 'horizon')):
+    """MAE, RMSE, bias and interval coverage of the fold errors, grouped by ``by``.
+
+    ``by`` can be any of the error columns, e.g. ``('model', 'cutoff', 'horizon')``
+    or ``('model', 'country', 'horizon')``.
+    """
+    by = list(by)
+    if len(errors) == 0:
+        return pd.DataFrame(columns=by + METRIC_COLUMNS[2:])
+    cube = (
+        errors.assign(abs_error=errors['error'].abs(), sq_error=errors['error'] ** 2)
+        .groupby(by, observed=True, sort=True)
+        .agg(
+            n=('error', 'size'),
+            mae=('abs_error', 'mean'),
+            rmse=('sq_error', 'mean'),
+            bias=('error', 'mean'),
+            coverage=('covered', 'mean'),
+        )
+        .reset_index()
+    )
+    cube['rmse'] = np.sqrt(cube['rmse'])
+    return cube
@@ -0,0 +1,178 @@
+"""
+Warming regime changes: optimal break years of every country's trend.
+
+The dashboard's acceleration story compares fixed periods (1961-1980 vs
+2010-2022). Here the data choose the periods: each country's series is split
+into linear segments, each with its own intercept and slope, at the break
+years that minimise the total residual sum of squares.
+
+- With prefix sums of ``n, Σx, Σy, Σxy, Σx², Σy²`` along the year axis the
+  OLS fit of any segment ``[i, j)`` costs O(1), so the cost of every segment
+  of every country is one array operation per end year (vectorised across
+  countries).
+- The best split into ``m + 1`` segments, for ``m = 0 ... max_breaks``,
+  follows by dynamic programming over the segment costs (exhaustive: every
+  admissible break year is considered). Segments need ``min_segment``
+  observed years.
+- The number of breaks is chosen by BIC. The single-break solution is
+  tested against one straight line with a Chow F-test. The break year is
+  itself estimated, so its p-value is optimistic; read it as a ranking.
+
+The result (``CHANGEPOINT_COLUMNS``) is the ``country_changepoints`` artifact:
+
+    changepoints = detect_changepoints(df)
+    write_artifact(changepoints, 'country_changepoints')
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from src.features import MIN_YEARS
+from src.projections import country_year_matrix
+
+MAX_BREAKS = 2
+MIN_SEGMENT = 10           # observed years per segment
+SIGNIFICANCE = 0.05
+
+CHANGEPOINT_COLUMNS = [
+    'country', 'iso3', 'break_year', 'pre_slope', 'post_slope', 'slope_change',
+    'f_stat', 'p_value', 'significant', 'n_breaks', 'break_years',
+]
+
+
+def prefix_sums(years, values):
+    """``(countries, years + 1, 6)`` prefix sums of ``n, Σx, Σy, Σxy, Σx², Σy²``.
+
+    ``x`` is counted from the first year; NaN values contribute nothing.
+    """
+    observed = ~np.isnan(values)
+    w = observed.astype(np.float64)
+    x = (np.asarray(years, dtype=np.float64) - years[0])[None, :] * w
+    y = np.where(observed, values, 0.0)
+    terms = np.stack([w, x, y, x * y, x * x, y * y], axis=-1)
+    out = np.zeros((values.shape[0], values.shape[1] + 1, 6))
+    np.cumsum(terms, axis=1, out=out[:, 1:])
+    return out
+
+
+def segment_fit(sums):
+    """Slope, residual sum of squares and count of the OLS line behind ``(..., 6)`` sums."""
+    n, sx, sy, sxy, sxx, syy = np.moveaxis(sums, -1, 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ssxm = sxx - sx * sx / n
+        ssxym = sxy - sx * sy / n
+        ssym = syy - sy * sy / n
+        slope = ssxym / ssxm
+        sse = np.maximum(ssym - ssxym * slope, 0)
+    return slope, sse, n
+
+
+def segment_costs(prefix, min_segment=MIN_SEGMENT):
+    """SSE of every segment ``[i, j)``: array ``(countries, years + 1, years + 1)``.
+
+    Segments with fewer than ``min_segment`` observed years cost ``inf``.
+    """
+    n_countries, n_edges, _ = prefix.shape
+    cost = np.full((n_countries, n_edges, n_edges), np.inf)
+    for j in range(1, n_edges):
+        _, sse, n = segment_fit(prefix[:, j, None, :] - prefix[:, :j, :])
+        cost[:, :j, j] = np.where(n >= max(min_segment, 3), sse, np.inf)
+    return cost
+
+
+def optimal_partitions(cost, max_breaks=MAX_BREAKS):
+    """Best segmentation with ``m`` breaks for ``m = 0 ... max_breaks``.
+
+    Returns ``(sse, edges)``: ``sse`` is ``(max_breaks + 1, countries)`` and
+    ``edges[m]`` a ``(countries, m)`` array of the interior segment edges
+    (index of the first year of each new segment; -1 when infeasible).
+    """
+    n_countries, n_edges, _ = cost.shape
+    last = n_edges - 1
+    best = np.full((max_breaks + 1, n_countries, n_edges), np.inf)
+    choice = np.zeros((max_breaks + 1, n_countries, n_edges), dtype=np.int64)
+    best[0] = cost[:, 0, :]
+    for m in range(1, max_breaks + 1):
+        # best[m][j] = min_i best[m - 1][i] + cost[i, j]
+        candidates = best[m - 1][:, :, None] + cost
+        choice[m] = np.argmin(candidates, axis=1)
+        best[m] = np.take_along_axis(candidates, choice[m][:, None, :], axis=1)[:, 0, :]
+
+    rows = np.arange(n_countries)
+    edges = []
+    for m in range(max_breaks + 1):
+        found = np.zeros((n_countries, m), dtype=np.int64)
+        end = np.full(n_countries, last)
+        for k in range(m, 0, -1):
+            end = choice[k][rows, end]
+            found[:, k - 1] = end
+        found[~np.isfinite(best[m][:, last])] = -1
+        edges.append(found)
+    return best[:, :, last], edges
+
+
+def detect_changepoints(df, max_breaks=MAX_BREAKS, min_segment=MIN_SEGMENT,
+                        significance=SIGNIFICANCE, min_years=MIN_YEARS):
+    """Break years, slopes before/after and significance for every country.
+
+    Parameters
+    ----------
+    df : long table with ``country``, ``iso3``, ``year`` and ``temperature_change``.
+    max_breaks : largest number of breaks considered (chosen by BIC).
+    min_segment : minimum observed years in each segment.
+    significance : level of the Chow test for ``significant``.
+    min_years : countries with fewer observed years are skipped.
+
+    ``break_year`` is the last year of the first segment of the single-break
+    fit, with the slopes (°C/year) of the two segments and the Chow test.
+    ``n_breaks`` / ``break_years`` ("1979;2001") come from the BIC choice.
+    """
+    countries, iso3, years, values = country_year_matrix(df)
+    keep = (~np.isnan(values)).sum(axis=1) >= max(min_years, 2 * min_segment)
+    countries, iso3, values = countries[keep], iso3[keep], values[keep]
+    if len(countries) == 0:
+        return pd.DataFrame(columns=CHANGEPOINT_COLUMNS)
+
+    prefix = prefix_sums(years, values)
+    cost = segment_costs(prefix, min_segment)
+    sse, edges = optimal_partitions(cost, max_breaks)
+    n = prefix[:, -1, 0]
+
+    # BIC: 2 parameters per segment plus one per break year
+    m = np.arange(max_breaks + 1)[:, None]
+    with np.errstate(divide='ignore'):
+        bic = n * np.log(sse / n) + (3 * m + 2) * np.log(n)
+    bic[~np.isfinite(sse)] = np.inf
+    n_breaks = np.argmin(bic, axis=0)
+
+    # Single break: slopes and Chow test against one line
+    rows = np.arange(len(countries))
+    edge = edges[1][:, 0] if max_breaks >= 1 else np.full(len(countries), -1)
+    ok = edge > 0
+    edge_safe = np.where(ok, edge, 1)
+    pre_slope, sse1, _ = segment_fit(prefix[rows, edge_safe] - prefix[:, 0])
+    post_slope, sse2, _ = segment_fit(prefix[:, -1] - prefix[rows, edge_safe])
+    sse_split = sse1 + sse2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f_stat = ((sse[0] - sse_split) / 2) / (sse_split / (n - 4))
+    p_value = stats.f.sf(f_stat, 2, n - 4)
+
+    break_years = [
+        ';'.join(str(int(years[e - 1])) for e in edges[k][i]) if k > 0 else ''
+        for i, k in enumerate(n_breaks)
+    ]
+    result = pd.DataFrame({
+        'country': countries,
+        'iso3': iso3,
+        'break_year': np.where(ok, years[edge_safe - 1], -1),
+        'pre_slope': np.where(ok, pre_slope, np.nan),
+        'post_slope': np.where(ok, post_slope, np.nan),
+        'slope_change': np.where(ok, post_slope - pre_slope, np.nan),
+        'f_stat': np.where(ok, f_stat, np.nan),
+        'p_value': np.where(ok, p_value, np.nan),
+        'significant': ok & (p_value < significance),
+        'n_breaks': n_breaks,
+        'break_years': break_years,
+    })
+    return result[CHANGEPOINT_COLUMNS]
@@ -0,0 +1,190 @@
+"""
+Model selection for the K-means clustering phase.
+
+``sweep_k`` replaces the serial OPTIMAL NUMBER OF CLUSTERS loop of
+``notebooks/07_clustering_phase5.ipynb``:
+
+- every (k, seed) fit runs as a task on a process pool, so the sweep scales
+  with the number of cores (``n_jobs=1`` keeps everything in-process),
+- the pairwise distance matrix is computed once, in the parent, and copied
+  once into each worker (through the pool initializer, not with every task),
+  so each silhouette evaluation only does the O(n²) label bookkeeping. Every
+  worker holds its own copy: at most ``SILHOUETTE_EXACT_MAX``² float64 values,
+  128 MB, per process,
+- for large n the silhouette is estimated on a fixed random sample of points
+  (the same sample for every k, so the scores stay comparable).
+
+The result is a tidy table with one row per (k, seed) that feeds
+``recommend_k`` and ``plot_k_selection`` (``clustering_optimal_k.png``).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+K_RANGE = range(2, 11)
+METRIC_COLUMNS = ['k', 'seed', 'inertia', 'silhouette', 'davies_bouldin', 'calinski_harabasz']
+
+# Above this many points the silhouette is estimated on a sample
+SILHOUETTE_EXACT_MAX = 4000
+SILHOUETTE_SAMPLE_SIZE = 2000
+
+# Worker state: set once per process so tasks don't re-send the matrices
+_X = None
+_DISTANCES = None
+_SAMPLE = None
+
+
+def _init_worker(X, distances, sample, limit_threads):
+    global _X, _DISTANCES, _SAMPLE
+    _X, _DISTANCES, _SAMPLE = X, distances, sample
+    if limit_threads:
+        # One BLAS/OpenMP thread per worker: the pool provides the parallelism
+        try:
+            from threadpoolctl import threadpool_limits
+            threadpool_limits(1)
+        except ImportError:
+            pass
+
+
+def _fit_one(task):
+    from sklearn.cluster import KMeans
+    from sklearn.metrics import calinski_harabasz_score, davies_bouldin_score, silhouette_score
+
+    k, seed, n_init, max_iter = task
+    kmeans = KMeans(n_clusters=k, random_state=seed, n_init=n_init, max_iter=max_iter)
+    labels = kmeans.fit_predict(_X)
+
+    sample_labels = labels if _SAMPLE is None else labels[_SAMPLE]
+    if len(np.unique(sample_labels)) > 1:
+        silhouette = silhouette_score(_DISTANCES, sample_labels, metric='precomputed')
+    else:
+        silhouette = np.nan
+
+    return {
+        'k': k,
+        'seed': seed,
+        'inertia': kmeans.inertia_,
+        'silhouette': silhouette,
+        'davies_bouldin': davies_bouldin_score(_X, labels),
+        'calinski_harabasz': calinski_harabasz_score(_X, labels),
+    }
+
+
+def silhouette_sample(n_samples, sample_size=None, random_state=42):
+    """Return the point indices used for the silhouette, or None for all points."""
+    if sample_size is None:
+        sample_size = n_samples if n_samples <= SILHOUETTE_EXACT_MAX else SILHOUETTE_SAMPLE_SIZE
+    if sample_size >= n_samples:
+        return None
+    rng = np.random.default_rng(random_state)
+    return np.sort(rng.choice(n_samples, size=sample_size, replace=False))
+
+
+def sweep_k(X, k_values=K_RANGE, seeds=(42,), n_init=20, max_iter=300, n_jobs=None,
+            silhouette_sample_size=None, random_state=42):
+    """Fit K-means for every k (and seed) and score each fit.
+
+    Parameters
+    ----------
+    X : scaled feature matrix (n_samples, n_features).
+    k_values : numbers of clusters to try.
+    seeds : ``random_state`` values; several seeds show how stable each k is.
+    n_init, max_iter : passed to ``KMeans``.
+    n_jobs : worker processes (None = all cores, 1 = run in this process).
+    silhouette_sample_size : points used for the silhouette. None picks the
+        exact score up to ``SILHOUETTE_EXACT_MAX`` points and a
+        ``SILHOUETTE_SAMPLE_SIZE`` sample above that.
+    random_state : seed of the silhouette sample.
+
+    Returns a DataFrame with ``METRIC_COLUMNS``, sorted by k and seed.
+    """
+    from sklearn.metrics import pairwise_distances
+
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    sample = silhouette_sample(len(X), silhouette_sample_size, random_state)
+    points = X if sample is None else X[sample]
+    distances = pairwise_distances(points, metric='euclidean')
+
+    tasks = [(k, seed, n_init, max_iter) for k in k_values for seed in seeds]
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(tasks))
+
+    if n_jobs == 1:
+        _init_worker(X, distances, sample, limit_threads=False)
+        try:
+            rows = [_fit_one(task) for task in tasks]
+        finally:
+            _init_worker(None, None, None, limit_threads=False)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_worker,
+            initargs=(X, distances, sample, True),
+        ) as pool:
+            rows = list(pool.map(_fit_one, tasks))
+
+    return pd.DataFrame(rows, columns=METRIC_COLUMNS).sort_values(['k', 'seed']).reset_index(drop=True)
+
+
+def best_per_k(metrics):
+    """Keep the lowest-inertia seed of every k (what ``n_init`` does within a seed)."""
+    best = metrics.loc[metrics.groupby('k')['inertia'].idxmin()]
+    return best.sort_values('k').reset_index(drop=True)
+
+
+def recommend_k(metrics):
+    """Return the k suggested by each metric: ``{'silhouette': k, ...}``."""
+    best = best_per_k(metrics).set_index('k')
+    return {
+        'silhouette': int(best['silhouette'].idxmax()),
+        'davies_bouldin': int(best['davies_bouldin'].idxmin()),
+        'calinski_harabasz': int(best['calinski_harabasz'].idxmax()),
+    }
+
+
+def plot_k_selection(metrics, path=None):
+    """Draw the 2x2 k-selection figure (elbow, silhouette, DB, CH).
+
+    With several seeds the best seed per k is drawn. Saves to ``path`` when
+    given and returns the figure.
+    """
+    import matplotlib.pyplot as plt
+
+    best = best_per_k(metrics)
+    k = best['k']
+
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+
+    # 1. Elbow plot
+    axes[0, 0].plot(k, best['inertia'], 'bo-', linewidth=2, markersize=8)
+    axes[0, 0].set_title('Elbow Method', fontweight='bold', fontsize=13)
+    axes[0, 0].set_ylabel('Inertia (Within-cluster sum of squares)')
+
+    # 2. Silhouette score
+    axes[0, 1].plot(k, best['silhouette'], 'go-', linewidth=2, markersize=8)
+    axes[0, 1].set_title('Silhouette Score (Higher is Better)', fontweight='bold', fontsize=13)
+    axes[0, 1].set_ylabel('Silhouette Score')
+    axes[0, 1].axhline(y=best['silhouette'].max(), color='r', linestyle='--', alpha=0.5)
+
+    # 3. Davies-Bouldin Index
+    axes[1, 0].plot(k, best['davies_bouldin'], 'ro-', linewidth=2, markersize=8)
+    axes[1, 0].set_title('Davies-Bouldin Index (Lower is Better)', fontweight='bold', fontsize=13)
+    axes[1, 0].set_ylabel('Davies-Bouldin Index')
+    axes[1, 0].axhline(y=best['davies_bouldin'].min(), color='g', linestyle='--', alpha=0.5)
+
+    # 4. Calinski-Harabasz Index
+    axes[1, 1].plot(k, best['calinski_harabasz'], 'mo-', linewidth=2, markersize=8)
+    axes[1, 1].set_title('Calinski-Harabasz Index (Higher is Better)', fontweight='bold', fontsize=13)
+    axes[1, 1].set_ylabel('Calinski-Harabasz Index')
+    axes[1, 1].axhline(y=best['calinski_harabasz'].max(), color='r', linestyle='--', alpha=0.5)
+
+    for ax in axes.flat:
+        ax.set_xlabel('Number of Clusters (k)')
+        ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    if path is not None:
+        fig.savefig(path, dpi=150, bbox_inches='tight')
+    return fig
@@ -0,0 +1,128 @@
+"""
+Country lookup and nearest-neighbour "similar countries".
+
+"Find Your Country" scanned the clustering table with a boolean mask for the
+selected country, then again for its cluster, and listed the five warmest
+members of the cluster as "similar countries". ``CountryIndex`` is built
+once per version of the clustering results and answers both questions
+directly:
+
+- ``position`` / ``row``: O(1) dictionary lookup by country name or ISO3 code
+  (rows are pre-converted to dicts),
+- ``neighbors``: the ``k`` countries closest in the standardised space of
+  the clustering features (``SIMILARITY_FEATURES``, scaled like the K-means
+  input of notebook 07: zero mean, unit variance, missing values set to the
+  median), from a KD-tree (``scipy.spatial.cKDTree``), with Euclidean
+  distances. Optionally restricted to the country's own cluster.
+
+    index = load_country_index()
+    index.row('Spain')['cluster_name']
+    index.neighbors('ESP', k=5)      # [{'country': 'Algeria', ..., 'distance': 0.10}, ...]
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from src.artifacts import artifact_source, read_artifact
+from src.data_loader import load_cached
+
+# The K-means input features of notebooks/07_clustering_phase5.ipynb
+SIMILARITY_FEATURES = [
+    'mean_temp', 'std_temp', 'warming_rate', 'recent_mean', 'period_change', 'acceleration',
+]
+NEIGHBOR_COLUMNS = ['country', 'iso3', 'cluster_name', 'distance']
+
+
+class CountryIndex:
+    """Lookup tables and a KD-tree over one clustering results table."""
+
+    def __init__(self, df, features=SIMILARITY_FEATURES):
+        self.frame = df.reset_index(drop=True)
+        self.features = [f for f in features if f in self.frame.columns]
+
+        self._positions = {}
+        for column in ('iso3', 'country'):
+            if column in self.frame.columns:
+                for position, key in enumerate(self.frame[column]):
+                    if isinstance(key, str) and key:
+                        self._positions.setdefault(key, position)
+        self.countries = sorted(self.frame['country'].astype(str).unique())
+        self._records = self.frame.to_dict('records')
+        self._columns = {
+            column: self.frame[column].astype(object).to_numpy()
+            for column in NEIGHBOR_COLUMNS[:-1] if column in self.frame.columns
+        }
+
+        X = self.frame[self.features].to_numpy(dtype=np.float64)
+        if np.isnan(X).any():
+            X = np.where(np.isnan(X), np.nanmedian(X, axis=0), X)
+        scale = X.std(axis=0)
+        self.mean = X.mean(axis=0)
+        self.scale = np.where(scale > 0, scale, 1.0)
+        self.points = (X - self.mean) / self.scale
+        self.tree = cKDTree(self.points)
+
+        if 'cluster_name' in self.frame.columns:
+            self.clusters = self.frame['cluster_name'].to_numpy()
+            self.cluster_sizes = self.frame['cluster_name'].value_counts().to_dict()
+        else:
+            self.clusters = None
+            self.cluster_sizes = {}
+
+    def __len__(self):
+        return len(self.frame)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def position(self, key):
+        """Row position of a country name or ISO3 code (``KeyError`` if unknown)."""
+        return self._positions[key]
+
+    def row(self, key):
+        """The clustering row of a country name or ISO3 code, as a dict (shared: do not modify)."""
+        return self._records[self.position(key)]
+
+    def nearest(self, key, k=5, same_cluster=False):
+        """``(positions, distances)`` of the ``k`` countries closest to ``key``, closest first.
+
+        ``distance`` is Euclidean in standardised feature units. The country
+        itself is excluded; ``same_cluster`` keeps only members of its cluster.
+        """
+        position = self.position(key)
+        n = len(self)
+        k = min(k, n - 1)
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+
+        query = k + 1
+        while True:
+            distances, positions = self.tree.query(self.points[position], k=min(query, n))
+            keep = positions != position
+            if same_cluster and self.clusters is not None:
+                keep &= self.clusters[positions] == self.clusters[position]
+            if keep.sum() >= k or query >= n:
+                break
+            query *= 2          # not enough members of the cluster among the closest: widen
+        return positions[keep][:k], distances[keep][:k]
+
+    def neighbors(self, key, k=5, same_cluster=False):
+        """``nearest`` as a list of dicts with ``NEIGHBOR_COLUMNS``, closest first."""
+        positions, distances = self.nearest(key, k, same_cluster)
+        return [
+            {**{column: values[p] for column, values in self._columns.items()}, 'distance': float(d)}
+            for p, d in zip(positions, distances)
+        ]
+
+
+def load_country_index():
+    """Index over the ``clustering_results_named`` artifact, built once per file version (None if missing)."""
+    source = artifact_source('clustering_results_named')
+    if source is None:
+        return None
+    return load_cached(
+        source,
+        lambda p: CountryIndex(read_artifact('clustering_results_named')),
+        variant='country_index',
+    )
@@ -0,0 +1,50 @@
+"""
+Dashboard pages, imported on first visit.
+
+``app.py`` used to hold all seven pages in one ``if/elif`` chain, with pandas,
+numpy and plotly imported at the top of every run. Each page is now a module
+of this package with a ``render(live_data)`` function (and an optional
+``warm()`` that pre-loads its artifacts):
+
+- ``app.py`` only imports ``streamlit`` and this package. ``render_page``
+  imports the selected page module the first time it is shown, and its heavy
+  dependencies (pandas, plotly, scipy, sqlalchemy, sklearn via the model
+  registry) with it,
+- ``src.dashboard.bootstrap`` imports the other pages and warms their caches
+  in a background thread while the first page is being read,
+- ``src.dashboard.timing`` records every step (script run, page import,
+  render, warm-up) for the sidebar timing report.
+"""
+
+import importlib
+import sys
+
+from src.dashboard.timing import timed
+
+# Sidebar label -> module of this package, in menu order
+PAGES = {
+    "🏠 Overview": "overview",
+    "📊 About the Dataset": "dataset",
+    "📈 Temperature Trends": "trends",
+    "🌍 Geographic Patterns": "geographic",
+    "🔮 Future Projections": "projections",
+    "📈 Logistic Regression": "logistic",
+    "🔍 Country Clustering": "clustering",
+}
+
+
+def load_page(label):
+    """The module of page ``label``, imported (and timed) on first use."""
+    name = f"{__name__}.{PAGES[label]}"
+    if name in sys.modules:
+        # import_module waits if another thread is still executing the module
+        return importlib.import_module(name)
+    with timed('import', PAGES[label]):
+        return importlib.import_module(name)
+
+
+def render_page(label, live_data):
+    """Import page ``label`` if needed and draw it."""
+    module = load_page(label)
+    with timed('render', PAGES[label]):
+        module.render(live_data)
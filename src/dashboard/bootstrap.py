@@ -0,0 +1,66 @@
+"""
+Background warm-up of the dashboard, once per process.
+
+The first run of ``app.py`` starts one daemon thread that, while the reader
+is still on the first page:
+
+1. imports every page module (and so pandas, plotly, scipy ...), in menu order,
+2. calls each page's ``warm()``, which loads its artifacts into the
+   process-wide cache of ``src.data_loader`` (same columns as the page),
+3. re-renders the stale figures built by ``src.figures`` and resizes
+   every figure to display width (``load_image``).
+
+The caches are thread-safe and load each key once, so a page visited while
+its warm-up is still running waits for that load instead of repeating it.
+Each step is recorded in ``src.dashboard.timing``; a failing step is recorded
+and skipped (the page shows its usual "not generated yet" message).
+"""
+
+import threading
+import traceback
+
+from src.dashboard import PAGES, load_page
+from src.dashboard.timing import timed
+
+_started = False
+_start_lock = threading.Lock()
+errors = {}          # step -> traceback of the steps that failed
+
+
+def _step(name, func):
+    try:
+        with timed('warm', name):
+            func()
+    except Exception:
+        errors[name] = traceback.format_exc()
+
+
+def _warm_figures():
+    from src.dashboard.common import load_image
+    from src.figures import FIGURES, FIGURES_DIR
+
+    for name in dict.fromkeys([*FIGURES, *(png.stem for png in sorted(FIGURES_DIR.glob('*.png')))]):
+        load_image(f"{name}.png")
+
+
+def warm_up(pages=None):
+    """Run the warm-up steps in the calling thread (all pages by default)."""
+    labels = list(pages or PAGES)
+    for label in labels:
+        _step(f"import {PAGES[label]}", lambda label=label: load_page(label))
+    for label in labels:
+        warm = getattr(load_page(label), 'warm', None) if f"import {PAGES[label]}" not in errors else None
+        if warm is not None:
+            _step(f"artifacts {PAGES[label]}", warm)
+    _step("figures", _warm_figures)
+
+
+def start_warmup():
+    """Start the warm-up thread unless it already ran in this process. Returns True if started."""
+    global _started
+    with _start_lock:
+        if _started:
+            return False
+        _started = True
+    threading.Thread(target=warm_up, name="dashboard-warmup", daemon=True).start()
+    return True
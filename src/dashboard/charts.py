@@ -0,0 +1,109 @@
+"""
+Plotly figures drawn from the views of ``src.aggregates``.
+
+Line series go out as WebGL traces (``go.Scattergl``) thinned to
+``MAX_POINTS`` per trace with LTTB, so a chart's payload does not grow with
+the length of the series behind it. Bars are few (decades, top/bottom
+countries) and are sent as they are.
+"""
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from src.aggregates import SMOOTHING_WINDOW, lttb
+
+MAX_POINTS = 1000          # per line trace
+
+WARM = '#e74c3c'
+COOL = '#3498db'
+BAND = 'rgba(243, 156, 18, 0.35)'
+
+
+def line_trace(x, y, name, max_points=MAX_POINTS, **kwargs):
+    """``go.Scattergl`` of ``(x, y)`` decimated to ``max_points`` (x sorted, no NaN in y)."""
+    keep = lttb(x, y, max_points)
+    return go.Scattergl(x=x[keep], y=y[keep], name=name, **kwargs)
+
+
+def yearly_figure(yearly):
+    """Global mean with its min-max range, and the cross-country std per year."""
+    fig = make_subplots(
+        rows=2, cols=1, shared_xaxes=True, row_heights=[0.7, 0.3], vertical_spacing=0.08,
+        subplot_titles=("Average temperature change across countries", "Variability (standard deviation)"),
+    )
+    years = yearly['year'].to_numpy()
+    fig.add_trace(line_trace(years, yearly['min'].to_numpy(), "Min", mode='lines',
+                             line={'width': 0}, showlegend=False, hoverinfo='skip'), row=1, col=1)
+    fig.add_trace(line_trace(years, yearly['max'].to_numpy(), "Min-max range", mode='lines',
+                             line={'width': 0}, fill='tonexty', fillcolor=BAND, hoverinfo='skip'), row=1, col=1)
+    fig.add_trace(line_trace(years, yearly['mean'].to_numpy(), "Mean", mode='lines+markers',
+                             line={'color': WARM, 'width': 2}, marker={'size': 4},
+                             hovertemplate="%{x}: %{y:+.2f}°C<extra></extra>"), row=1, col=1)
+    fig.add_trace(go.Bar(x=years, y=yearly['std'], name="Std", marker_color=COOL, opacity=0.7,
+                         hovertemplate="%{x}: %{y:.2f}°C<extra></extra>"), row=2, col=1)
+    fig.add_hline(y=0, line_dash="dash", line_color="gray", row=1, col=1)
+    fig.update_yaxes(title_text="°C", row=1, col=1)
+    fig.update_yaxes(title_text="°C", row=2, col=1)
+    fig.update_xaxes(title_text="Year", row=2, col=1)
+    fig.update_layout(height=650, hovermode='x unified', legend={'orientation': 'h', 'y': 1.08})
+    return fig
+
+
+def decade_figure(decades):
+    """Mean per decade with ± one standard deviation, min and max in the hover."""
+    fig = go.Figure(go.Bar(
+        x=decades['decade'].astype(str) + "s",
+        y=decades['mean'],
+        error_y={'type': 'data', 'array': decades['std'], 'color': 'gray'},
+        marker={'color': decades['mean'], 'colorscale': 'Reds', 'showscale': False},
+        text=[f"{value:+.2f}°C" for value in decades['mean']],
+        textposition='outside',
+        customdata=decades[['std', 'min', 'max', 'observations']].to_numpy(),
+        hovertemplate=("%{x}: %{y:+.2f}°C ± %{customdata[0]:.2f}<br>"
+                       "range %{customdata[1]:+.2f} to %{customdata[2]:+.2f}°C<br>"
+                       "%{customdata[3]} observations<extra></extra>"),
+    ))
+    fig.add_hline(y=0, line_dash="dash", line_color="gray")
+    fig.update_layout(height=450, xaxis_title="Decade", yaxis_title="Mean temperature change (°C)")
+    return fig
+
+
+def rankings_figure(rankings):
+    """Side-by-side bars of the highest and lowest warming countries."""
+    n = int(rankings['rank'].max()) if len(rankings) else 0
+    fig = make_subplots(rows=1, cols=2, horizontal_spacing=0.25,
+                        subplot_titles=(f"Top {n}: highest warming", f"Top {n}: lowest warming"))
+    for col, (group, color) in enumerate([('highest', WARM), ('lowest', COOL)], start=1):
+        subset = rankings[rankings['group'] == group].sort_values('rank', ascending=False)
+        fig.add_trace(go.Bar(
+            x=subset['mean_temp'], y=subset['country'], orientation='h', marker_color=color, opacity=0.8,
+            text=[f"{value:.3f}°C" for value in subset['mean_temp']], textposition='auto',
+            customdata=subset[['min_temp', 'max_temp', 'years_data']].to_numpy(),
+            hovertemplate=("%{y}: %{x:+.3f}°C<br>range %{customdata[0]:+.2f} to %{customdata[1]:+.2f}°C"
+                           "<br>%{customdata[2]} years<extra></extra>"),
+            showlegend=False,
+        ), row=1, col=col)
+        fig.update_xaxes(title_text="Average temperature change (°C)", row=1, col=col)
+    fig.update_layout(height=max(400, 28 * n + 120))
+    return fig
+
+
+def case_studies_figure(series):
+    """One panel per case-study category with the smoothed series of its countries."""
+    categories = list(dict.fromkeys(series['category']))
+    rows = (len(categories) + 1) // 2
+    fig = make_subplots(rows=max(rows, 1), cols=2, subplot_titles=[f"{c} Countries" for c in categories],
+                        vertical_spacing=0.12)
+    for i, category in enumerate(categories):
+        row, col = i // 2 + 1, i % 2 + 1
+        subset = series[(series['category'] == category) & series['value'].notna()]
+        for country, group in subset.groupby('country', sort=False):
+            fig.add_trace(line_trace(
+                group['year'].to_numpy(), group['value'].to_numpy(), country, mode='lines+markers',
+                marker={'size': 3}, legendgroup=category,
+                hovertemplate=f"{country} %{{x}}: %{{y:+.2f}}°C<extra></extra>",
+            ), row=row, col=col)
+        fig.add_hline(y=0, line_dash="dash", line_color="gray", row=row, col=col)
+        fig.update_yaxes(title_text=f"°C ({SMOOTHING_WINDOW}-yr MA)", row=row, col=col)
+    fig.update_layout(height=360 * max(rows, 1), legend={'orientation': 'h', 'y': -0.08})
+    return fig
@@ -0,0 +1,306 @@
+"""
+🔍 Country Clustering page: K-means warming profiles, cluster map and features.
+"""
+
+import streamlit as st
+
+from src import db
+from src.country_index import load_country_index
+from src.dashboard.common import load_clustering_results, load_image
+from src.maps import GEOJSON_PATH, country_map, geojson_version, load_cluster_map, load_geojson
+from src.result_cache import artifact_version, cached_result
+
+TOP_COLUMNS = ['country', 'mean_temp', 'warming_rate', 'recent_mean']
+
+
+def warm():
+    """Load the artifacts this page reads into the process-wide cache."""
+    load_clustering_results()
+    load_cluster_map()
+    load_country_index()
+
+
+def _cluster_profiles(clustering_df):
+    """Per-cluster statistics and top 10 countries, in order of first appearance."""
+    profiles = []
+    for cluster_name, cluster_data in clustering_df.groupby('cluster_name', sort=False, observed=True):
+        profiles.append({
+            'name': cluster_name,
+            'avg_temp': cluster_data['mean_temp'].mean(),
+            'avg_warming_rate': cluster_data['warming_rate'].mean(),
+            'avg_recent': cluster_data['recent_mean'].mean(),
+            'avg_acceleration': cluster_data['acceleration'].mean(),
+            'description': (cluster_data['cluster_description'].iloc[0]
+                            if 'cluster_description' in cluster_data.columns else None),
+            'top_countries': cluster_data.nlargest(10, 'mean_temp')[TOP_COLUMNS],
+        })
+    return profiles
+
+
+# A fragment: picking a country reruns only this part of the page, so the
+# world map above is not rebuilt or re-sent; the selection gets its own small map.
+@st.fragment
+def _country_search(index, detail):
+    country_search = st.selectbox(
+        "Select a country to see its cluster assignment:",
+        options=index.countries
+    )
+
+    if country_search:
+        country_info = index.row(country_search)
+
+        st.markdown(f"### {country_info['country']}")
+        st.plotly_chart(
+            country_map(index.frame, country_info['iso3'], load_geojson(GEOJSON_PATH), detail),
+            use_container_width=True
+        )
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown(f"**Cluster:** {country_info['cluster_name']}")
+            st.markdown(f"**Description:** {country_info['cluster_description']}")
+
+            st.markdown("**Warming Metrics:**")
+            st.markdown(f"- Average temperature change: **{country_info['mean_temp']:.3f}°C**")
+            st.markdown(f"- Warming rate: **{country_info['warming_rate']*10:.3f}°C/decade**")
+            st.markdown(f"- Recent average (2010-2022): **{country_info['recent_mean']:.3f}°C**")
+            st.markdown(f"- Temperature volatility: **{country_info['std_temp']:.3f}°C**")
+
+        with col2:
+            st.markdown("**Trend Analysis:**")
+            st.markdown(f"- Early period (1961-1980): **{country_info['early_mean']:.3f}°C**")
+            st.markdown(f"- Change from early to recent: **{country_info['period_change']:.3f}°C**")
+            st.markdown(f"- Warming acceleration: **{country_info['acceleration']:.5f}°C/year²**")
+
+            # Similar countries: nearest neighbours in the standardised clustering features
+            same_cluster = index.cluster_sizes.get(country_info['cluster_name'], 1) - 1
+            st.markdown(f"**Most similar warming profiles ({same_cluster} other countries in same cluster):**")
+            for similar in index.neighbors(country_search, k=5):
+                note = "" if similar['cluster_name'] == country_info['cluster_name'] else f", {similar['cluster_name']}"
+                st.markdown(f"- {similar['country']} (distance {similar['distance']:.2f}{note})")
+
+
+def render(live_data):
+    """Draw the page; ``live_data`` reads the database instead of the artifacts."""
+    st.markdown('<h1 class="main-header">🔍 Country Clustering: Identifying Warming Patterns</h1>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="info-box">
+    <h3>What is Clustering Analysis?</h3>
+    Using machine learning (K-means clustering), we grouped 212 countries into distinct segments based on
+    their warming patterns from 1961-2022. Each cluster represents countries with similar temperature trajectories,
+    enabling targeted climate adaptation strategies.
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Load clustering data (live: cluster assignments kept, features refreshed from the database)
+    clustering_df = db.clustering_results() if live_data else load_clustering_results()
+
+    if clustering_df is not None and live_data:
+        st.caption("Cluster features computed live from PostgreSQL (cluster assignments from the last notebook run)")
+
+    if clustering_df is not None:
+        # ---------------------------
+        # NEW: Interactive Map Section
+        # ---------------------------
+        st.markdown('### 🌍 Global Cluster Map')
+        
+        # Base map built once per data version (src/maps.py); reruns re-use the figure.
+        # The border resolution only applies to Plotly's built-in shapes, not to a GeoJSON
+        detail = "simplified"
+        if geojson_version(GEOJSON_PATH) is None and st.toggle("Detailed borders", key="cluster_map_detail"):
+            detail = "detailed"
+        fig_map = db.cluster_map(detail) if live_data else load_cluster_map(detail)
+
+        st.plotly_chart(fig_map, use_container_width=True)
+        
+        st.markdown("---")
+        # ---------------------------
+
+        st.markdown('<h2 class="section-header">📊 Cluster Overview</h2>', unsafe_allow_html=True)
+
+        # Display cluster distribution
+        cluster_counts = clustering_df['cluster_name'].value_counts()
+        col1, col2 = st.columns([1, 1])
+
+        with col1:
+            st.markdown("### Cluster Distribution")
+            for cluster_name, count in cluster_counts.items():
+                pct = (count / len(clustering_df)) * 100
+                st.metric(cluster_name, f"{count} countries", f"{pct:.1f}%")
+
+        with col2:
+            st.markdown("### Clustering Quality Metrics")
+            st.info("""
+            **Methodology:** K-means clustering with 6 features
+            - Average temperature change
+            - Temperature volatility
+            - Warming rate (trend)
+            - Recent period average (2010-2022)
+            - Change from early to recent period
+            - Warming acceleration
+            """)
+
+        st.markdown("---")
+
+        # Cluster Details
+        st.markdown('<h2 class="section-header">🎯 Cluster Profiles</h2>', unsafe_allow_html=True)
+
+        unique_clusters = clustering_df['cluster_name'].unique()
+
+        # Computed once per data version for every session (src/result_cache.py)
+        data_version = db.data_version() if live_data else ()
+        profiles = cached_result(
+            'cluster_profiles', lambda: _cluster_profiles(clustering_df),
+            (artifact_version('clustering_results_named'), data_version),
+        )
+
+        for profile in profiles:
+            st.markdown(f"### {profile['name']}")
+
+            # Cluster statistics
+            avg_temp = profile['avg_temp']
+            avg_warming_rate = profile['avg_warming_rate']
+            avg_recent = profile['avg_recent']
+            avg_acceleration = profile['avg_acceleration']
+
+            # Display cluster characteristics
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                st.metric("Avg Temperature", f"{avg_temp:.3f}°C")
+            with col2:
+                st.metric("Warming Rate", f"{avg_warming_rate*10:.3f}°C/decade")
+            with col3:
+                st.metric("Recent Average", f"{avg_recent:.3f}°C")
+            with col4:
+                st.metric("Acceleration", f"{avg_acceleration:.5f}°C/year²")
+
+            # Display description
+            if profile['description'] is not None:
+                st.markdown(f"**Description:** {profile['description']}")
+
+            # Top countries in this cluster
+            st.markdown("**Top 10 countries by average warming:**")
+            top_countries = profile['top_countries']
+
+            # Display as table
+            st.dataframe(
+                top_countries.style.format({
+                    'mean_temp': '{:.3f}°C',
+                    'warming_rate': '{:.5f}°C/year',
+                    'recent_mean': '{:.3f}°C'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+
+            st.markdown("---")
+
+        # Visualizations
+        st.markdown('<h2 class="section-header">📈 Visual Analysis</h2>', unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("### Clustering Quality Metrics")
+            img_path = load_image("reports/figures/clustering_optimal_k.png")
+            if img_path:
+                st.image(img_path, use_container_width=True)
+                st.caption("Multiple metrics used to determine optimal number of clusters")
+            else:
+                st.warning("Visualization not found. Run the clustering notebook to generate.")
+
+        with col2:
+            st.markdown("### 2D Cluster Visualization (PCA)")
+            img_path = load_image("reports/figures/clustering_pca_visualization.png")
+            if img_path:
+                st.image(img_path, use_container_width=True)
+                st.caption("Countries projected onto 2D space using Principal Component Analysis")
+            else:
+                st.warning("Visualization not found. Run the clustering notebook to generate.")
+
+        st.markdown("---")
+
+        st.markdown("### Feature Distributions by Cluster")
+        img_path = load_image("reports/figures/clustering_feature_distributions.png")
+        if img_path:
+            st.image(img_path, use_container_width=True)
+            st.caption("Box plots showing how different features vary across clusters")
+        else:
+            st.warning("Visualization not found. Run the clustering notebook to generate.")
+
+        # Business Recommendations
+        st.markdown("---")
+        st.markdown('<h2 class="section-header">💼 Strategic Recommendations by Cluster</h2>', unsafe_allow_html=True)
+
+        recommendations = {
+            "Low-Risk Countries": {
+                "priority": "🟢 MONITOR & MAINTAIN",
+                "actions": [
+                    "Regular climate monitoring",
+                    "Gradual infrastructure upgrades",
+                    "Energy efficiency improvements",
+                    "Sustainable development practices",
+                    "Community resilience programs",
+                    "Sea level rise adaptation (if coastal/island)",
+                    "Ocean acidification mitigation",
+                    "Storm surge defenses"
+                ],
+                "investment": "MODERATE: (~0.5-1.5% GDP)",
+                "risk": "MODERATE"
+            },
+            "High-Risk Countries": {
+                "priority": "🟠 HIGH PRIORITY - URGENT ACTION",
+                "actions": [
+                    "Accelerated adaptation planning",
+                    "Infrastructure upgrades for extreme temperatures",
+                    "Enhanced monitoring systems",
+                    "Climate risk assessment updates",
+                    "Emergency response system enhancement",
+                    "Retrofit existing infrastructure",
+                    "Update building codes and standards",
+                    "Develop climate contingency plans",
+                    "Emergency climate adaptation planning",
+                    "Water resource management crisis protocols"
+                ],
+                "investment": "HIGH: (~2-4% GDP)",
+                "risk": "HIGH"
+            }
+        }
+
+        for cluster_name in unique_clusters:
+            if cluster_name in recommendations:
+                rec = recommendations[cluster_name]
+
+                st.markdown(f"### {cluster_name}")
+                st.markdown(f"**Priority Level:** {rec['priority']}")
+
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    st.markdown("**Priority Actions:**")
+                    for action in rec['actions']:
+                        st.markdown(f"- {action}")
+
+                with col2:
+                    st.markdown(f"**Investment Needs:** {rec['investment']}")
+                    st.markdown(f"**Risk Level:** {rec['risk']}")
+
+                st.markdown("---")
+
+        # Search functionality
+        st.markdown('<h2 class="section-header">🔎 Find Your Country</h2>', unsafe_allow_html=True)
+
+        index = db.country_index() if live_data else load_country_index()
+        _country_search(index, detail)
+
+    else:
+        st.warning("""
+        Clustering results not found. Please run the clustering notebook first:
+
+        `notebooks/07_clustering_phase5.ipynb`
+
+        This will generate the required clustering analysis and save results to `reports/clustering_results_named.csv`.
+        """)
@@ -0,0 +1,66 @@
+"""
+Helpers shared by the dashboard pages.
+"""
+
+import io
+from pathlib import Path
+
+from src.artifacts import read_artifact
+from src.data_loader import load_cached
+from src.figures import figure_path
+
+# st.image shrinks anything wider than the page (2 x 730 px) and re-encodes it
+# as PNG on every rerun; the notebook figures are ~2100 px wide.
+DISPLAY_WIDTH = 2 * 730
+
+
+def _display_png(path):
+    from PIL import Image
+
+    with Image.open(path) as image:
+        if image.width <= DISPLAY_WIDTH:
+            return Path(path).read_bytes()
+        height = int(1.0 * image.height * DISPLAY_WIDTH / image.width)
+        image = image.resize((DISPLAY_WIDTH, height), resample=Image.BILINEAR)
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+# Figures built by src/figures.py (listed in reports/figures/manifest.json) are
+# re-rendered here when their input artifacts (or drawing code) changed since
+# the PNG was written; the others are served as the notebooks left them.
+# Returns the PNG bytes at display width, resized once per file version
+# instead of once per rerun.
+def load_image(image_path):
+    path = figure_path(Path(image_path).stem)
+    if path is not None:
+        return load_cached(path, _display_png, variant='display')
+    return None
+
+# Artifacts are read from typed Parquet files (CSV fallback) and cached
+# process-wide, so reruns and concurrent sessions re-use the parsed frames.
+# Pass `columns` to decode only what a page needs. Copy before modifying them.
+def load_temperature_projections(columns=None):
+    return read_artifact("temperature_projections_2030", columns=columns)
+
+def load_clustering_results(columns=None):
+    return read_artifact("clustering_results_named", columns=columns)
+
+def load_country_projections(columns=None):
+    return read_artifact("country_projections", columns=columns)
+
+def load_country_uncertainty(columns=None):
+    return read_artifact("country_uncertainty", columns=columns)
+
+def load_climate_long(columns=None):
+    return read_artifact("climate_long", columns=columns)
+
+def load_backtest_metrics(columns=None):
+    return read_artifact("backtest_metrics", columns=columns)
+
+def load_model_zoo_forecasts(columns=None):
+    return read_artifact("model_zoo_forecasts", columns=columns)
+
+def load_country_changepoints(columns=None):
+    return read_artifact("country_changepoints", columns=columns)
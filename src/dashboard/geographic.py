@@ -0,0 +1,355 @@
+"""
+🌍 Geographic Patterns page: country rankings, regional patterns and case studies.
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from src import db
+from src.aggregates import MIN_YEARS, SMOOTHING_WINDOW, TOP_N, load_trend_views
+from src.dashboard.charts import case_studies_figure, rankings_figure
+from src.dashboard.common import load_country_changepoints, load_image
+
+
+def warm():
+    """Load the artifacts this page reads into the process-wide cache."""
+    load_country_changepoints()
+    load_trend_views()
+
+
+def render(live_data):
+    """Draw the page; ``live_data`` reads the database instead of the artifacts."""
+    st.markdown('<h1 class="main-header">🌍 Regional Warming: Who\'s Affected Most?</h1>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="info-box">
+    <h3>Geographic Heterogeneity</h3>
+    Climate change is a global phenomenon, but its impacts are far from uniform. Some regions
+    are warming 3-4 times faster than the global average, while others experience more moderate changes.
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    tab1, tab2, tab3 = st.tabs(["🏆 Top/Bottom Countries", "🗺️ Regional Patterns", "🔍 Case Studies"])
+
+    with tab1:
+        st.markdown('<div class="section-header">Countries by Average Warming (1961-2022)</div>', unsafe_allow_html=True)
+
+        # Show top countries visualization (pre-aggregated rankings, src/aggregates.py)
+        views = db.trend_views() if live_data else load_trend_views()
+        if views is not None and len(views['rankings']) > 0:
+            st.plotly_chart(rankings_figure(views['rankings']), use_container_width=True)
+            source = ", live from PostgreSQL" if live_data else ""
+            st.caption(f"Top {TOP_N} highest and lowest warming countries (countries with at least {MIN_YEARS} years of data){source}")
+        else:
+            img_path = load_image("reports/figures/eda_top_countries.png")
+            if img_path:
+                st.image(img_path, use_column_width=True)
+                st.caption("Top 15 highest and lowest warming countries (countries with at least 40 years of data)")
+            else:
+                st.warning("Top countries visualization not yet generated.")
+
+        st.markdown("---")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("**🔥 Fastest Warming Countries**")
+            st.markdown("""
+            Top warming nations (62-year average):
+
+            1. **Estonia** (~1.2°C average)
+            2. **Lithuania** (~1.2°C)
+            3. **Latvia** (~1.2°C)
+            4. **Belarus** (~1.1°C)
+            5. **Russia** (~1.1°C)
+
+            **Pattern:** Concentrated in Eastern Europe and Northern Asia
+
+            **Common Features:**
+            - High latitudes (45°N - 70°N)
+            - Continental climates
+            - Proximity to Arctic region
+            - Large landmasses
+
+            **Why So Extreme:**
+            - **Arctic amplification**: High latitudes warm 2-3x faster
+            - **Ice-albedo feedback**: Less snow/ice → less reflection → more heat absorbed
+            - **Continental effect**: Land heats faster than oceans
+            """)
+
+        with col2:
+            st.markdown("**❄️ Slowest Warming Countries**")
+            st.markdown("""
+            Lowest warming nations (62-year average):
+
+            - **Kiribati** (~0.1°C average)
+            - **Nauru** (~0.1°C)
+            - **Tuvalu** (~0.2°C)
+            - **Solomon Islands** (~0.2°C)
+            - **Papua New Guinea** (~0.2°C)
+
+            **Pattern:** Small Pacific island nations
+
+            **Common Features:**
+            - Tropical locations (near equator)
+            - Small land area, surrounded by ocean
+            - Maritime climate
+            - Low latitudes
+
+            **Why More Stable:**
+            - **Ocean buffering**: Water absorbs heat slowly, moderates temperature
+            - **Tropical location**: Less seasonal variation to amplify
+            - **Maritime effect**: Ocean temperatures more stable than land
+            - **Note**: Despite lower temperature rise, these nations face existential threats from sea-level rise (not measured in this dataset)
+            """)
+
+        st.markdown("---")
+
+        st.markdown("""
+        <div class="warning-box">
+        <h4>⚠️ The Paradox of Vulnerability</h4>
+        <p>Notice a cruel irony: <strong>Small island nations showing the least warming are often most threatened
+        by climate change.</strong></p>
+
+        <p><strong>Why?</strong> This dataset only measures temperature. These nations face:</p>
+        <ul>
+        <li>Sea level rise (existential threat)</li>
+        <li>Ocean acidification (coral reef death, fishing collapse)</li>
+        <li>Stronger cyclones/typhoons (catastrophic damage)</li>
+        <li>Saltwater intrusion into freshwater (drinking water crisis)</li>
+        </ul>
+
+        <p><strong>Meanwhile:</strong> Countries showing highest warming (Russia, Canada) have:</p>
+        <ul>
+        <li>Resources to adapt (wealth, technology)</li>
+        <li>Vast territories to relocate within</li>
+        <li>Infrastructure to withstand temperature changes</li>
+        </ul>
+
+        <p>This underscores that <strong>temperature change alone doesn't capture full climate impact</strong>.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with tab2:
+        st.markdown('<div class="section-header">Geographic Heterogeneity Analysis</div>', unsafe_allow_html=True)
+
+        # Show geographic heterogeneity visualization
+        img_path = load_image("reports/figures/eda_geographic_heterogeneity.png")
+        if img_path:
+            st.image(img_path, use_column_width=True)
+            st.caption("Relationship between country geography and temperature variability")
+        else:
+            st.warning("Geographic heterogeneity visualization not yet generated.")
+
+        # Where and when warming changed pace (src/changepoints.py)
+        st.markdown("**🗺️ Regime Changes by Country:**")
+
+        changepoints = db.country_changepoints() if live_data else load_country_changepoints()
+        if changepoints is not None and len(changepoints) > 0:
+            map_metric = st.radio(
+                "Color by", ["Slope change (°C/decade)", "Break year"],
+                horizontal=True, key="changepoint_metric"
+            )
+            breaks = changepoints[changepoints['break_year'] > 0].assign(
+                slope_change_decade=lambda d: d['slope_change'] * 10
+            )
+            color = 'slope_change_decade' if map_metric.startswith("Slope") else 'break_year'
+            fig_breaks_map = px.choropleth(
+                data_frame=breaks,
+                locations="iso3",
+                color=color,
+                hover_name="country",
+                hover_data={
+                    "iso3": False,
+                    "break_year": True,
+                    "slope_change_decade": ":.2f",
+                    "p_value": ":.3f",
+                    "break_years": True,
+                },
+                labels={"slope_change_decade": "Slope change (°C/decade)", "break_year": "Break year"},
+                projection="natural earth",
+                color_continuous_scale="RdBu_r" if color == 'slope_change_decade' else "Viridis",
+                color_continuous_midpoint=0 if color == 'slope_change_decade' else None,
+                height=500,
+            )
+            fig_breaks_map.update_layout(margin={"r": 0, "t": 10, "l": 0, "b": 0})
+            st.plotly_chart(fig_breaks_map, use_container_width=True)
+            st.caption(
+                "Break year of the best single-break trend and the change in warming rate across it. "
+                "'break_years' lists the breaks kept by BIC (up to two, empty when one trend suffices)."
+            )
+        else:
+            st.info("Changepoints not generated yet. Run notebook 04 to write reports/country_changepoints.parquet.")
+
+        st.markdown("**Does Country Size Affect Data Quality?**")
+
+        st.markdown("""
+        One limitation of this dataset is that temperature is aggregated at the **national level**.
+        This raises an important question: Do large, geographically diverse countries show more
+        variable temperature readings because they actually experience more diverse climates?
+
+        **Analysis Findings:**
+
+        **Large/Elongated Countries** (Russia, Canada, Chile, China):
+        - Show higher temperature variability over time
+        - National averages mask huge regional differences
+        - Example: Russia 2020 = +3.69°C national average
+          - Arctic Russia: +5-6°C warming
+          - Southern Russia: +2-3°C warming
+          - National figure is area-weighted average
+
+        **Small/Compact Countries** (Singapore, Luxembourg, Monaco):
+        - More stable temperature readings
+        - National average actually represents most of the country
+        - Less geographic diversity to mask
+
+        **Implication:**
+        - Treat large country data as "regional averages" rather than precise local conditions
+        - Small country data more reliable for local analysis
+        - For policy/planning in large countries, seek subnational climate data
+
+        **Nota sobre la selección de países:**
+        He utilizado esta etiqueta en Russia, Canada, Chile, China para hacer una comparación con los más pequeños Singapore, Luxembourg, Monaco. Era solo un estudio de caso, por si los países variaban mucho la temperatura teniendo también en cuenta que habrían diversos tipos climaticos dentro de un propio país.
+        """)
+
+    with tab3:
+        st.markdown('<div class="section-header">Case Studies: Contrasting Warming Patterns</div>', unsafe_allow_html=True)
+
+        # Show case studies visualization (smoothed series, src/aggregates.py)
+        views = db.trend_views() if live_data else load_trend_views()
+        if views is not None and len(views['case_studies']) > 0:
+            st.plotly_chart(case_studies_figure(views['case_studies']), use_container_width=True)
+            st.caption(f"Temperature trajectories for different country categories (centred {SMOOTHING_WINDOW}-year moving average)")
+        else:
+            img_path = load_image("reports/figures/eda_case_studies.png")
+            if img_path:
+                st.image(img_path, use_column_width=True)
+                st.caption("Temperature trajectories for different country categories")
+            else:
+                st.warning("Case studies visualization not yet generated.")
+
+        st.markdown("---")
+
+        st.markdown("**Case Study 1: Russia—Arctic Amplification**")
+
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            st.markdown("""
+            **Geography:**
+            - 17 million km² (largest country)
+            - Spans 11 time zones, 41° latitude
+            - 70% of land above 50°N latitude
+            - Massive Arctic/subarctic territory
+
+            **Warming Pattern:**
+            - 1961-1980: Fluctuating around baseline
+            - 1980-2000: Rapid warming begins
+            - 2000-2022: Extreme warming years
+            - 2020 peak: +3.69°C (hottest recorded)
+
+            **Why So Extreme:**
+            - Arctic amplification effect (2-3x global average)
+            - Permafrost thaw accelerates warming
+            - Loss of sea ice reduces Earth's reflectivity
+            - Continental interior far from moderating ocean influence
+            """)
+
+        with col2:
+            st.metric("62-Yr Avg", "+1.1°C", "3x global avg")
+            st.metric("2020 Peak", "+3.69°C", "Highest recorded")
+            st.metric("Arctic Regions", "+5-6°C", "In some areas")
+
+        st.markdown("---")
+
+        st.markdown("**Case Study 2: Chile—Geographic Complexity**")
+
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            st.markdown("""
+            **Geography:**
+            - 4,300 km long (north-south)
+            - Only 177 km wide (average)
+            - Spans 38° of latitude
+            - Atacama Desert (north) to Patagonia (south)
+
+            **Climate Zones in One Country:**
+            - **North**: Arid desert, extreme heat
+            - **Center**: Mediterranean, moderate
+            - **South**: Cold maritime, subpolar
+
+            **Data Challenge:**
+            - National average meaningless for local conditions
+            - North might be +2°C, South might be +0.5°C
+            - Single temperature obscures 10°C+ variation
+
+            **Warming Pattern:**
+            - High variability in national average
+            - Likely reflects shifting dominance of different climate zones year-to-year
+            """)
+
+        with col2:
+            st.metric("Length", "4,300 km", "N-S span")
+            st.metric("Width", "177 km", "Average")
+            st.metric("Lat Range", "38°", "Tropical to Antarctic")
+
+        st.markdown("---")
+
+        st.markdown("**Case Study 3: Kiribati—Island Stability (and Vulnerability)**")
+
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            st.markdown("""
+            **Geography:**
+            - 33 atolls and islands
+            - Total land area: 811 km²
+            - Scattered across 3.5 million km² of ocean
+            - Average elevation: 2 meters above sea level
+
+            **Warming Pattern:**
+            - Very low temperature warming: ~0.1°C average
+            - Ocean buffering keeps temperatures stable
+            - Little year-to-year variation
+
+            **The Paradox:**
+            - **Temperature impact**: Minimal (lowest in dataset)
+            - **Climate threat level**: EXISTENTIAL
+
+            **Why the Disconnect:**
+            - Sea level rise of 1-2 meters would submerge entire nation
+            - Ocean acidification destroying coral reefs (food source)
+            - This dataset **only** measures temperature—misses main threats
+            """)
+
+        with col2:
+            st.metric("Temp Change", "+0.1°C", "Lowest globally")
+            st.metric("Elevation", "2 meters", "Above sea level")
+            st.metric("Threat Level", "Extreme", "Sea level rise")
+
+        st.markdown("---")
+
+        st.markdown("""
+        <div class="info-box">
+        <h4>💡 Key Lesson from Case Studies</h4>
+        <p><strong>Temperature change alone doesn't tell the full climate story.</strong></p>
+
+        <ul>
+        <li><strong>Russia:</strong> High temperature change, high adaptive capacity</li>
+        <li><strong>Kiribati:</strong> Low temperature change, existential threat from other factors</li>
+        <li><strong>Chile:</strong> National average hides dramatic regional variation</li>
+        </ul>
+
+        <p>For comprehensive climate risk assessment, combine temperature data with:</p>
+        <ul>
+        <li>Sea level projections</li>
+        <li>Precipitation/drought patterns</li>
+        <li>Extreme weather frequency</li>
+        <li>Economic adaptive capacity</li>
+        <li>Geographic vulnerability</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,318 @@
+"""
+📈 Logistic Regression page: climate risk classifier, country outlook and threshold crossings.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from src import db
+from src.dashboard.common import (
+    load_climate_long,
+    load_country_projections,
+    load_image,
+    load_temperature_projections,
+)
+from src.exceedance import exceedance_lookup, load_exceedance_lookup
+from src.result_cache import artifact_version, cached_result
+from src.risk import load_risk_model, score_projections, score_risk
+
+GLOBAL_COLUMNS = ['Year', 'Quadratic_Projection']
+OUTLOOK_COLUMNS = ['country', 'model', 'year', 'projection']
+
+
+def warm():
+    """Load the artifacts this page reads into the process-wide cache."""
+    load_temperature_projections(columns=GLOBAL_COLUMNS)
+    load_risk_model()
+    load_climate_long()
+    load_country_projections(columns=OUTLOOK_COLUMNS)
+    load_exceedance_lookup()
+
+
+def _model_version(risk_model):
+    metadata = risk_model.metadata
+    return (metadata.get('name'), metadata.get('version'), metadata.get('created_at'))
+
+
+def _world_risk(projections, history, risk_model):
+    """Risk probability and level of every projected global anomaly."""
+    # Observed years in front of the projections complete the rolling-average features
+    first_year = int(projections['Year'].min())
+    world = pd.DataFrame({
+        'country': 'World',
+        'year': projections['Year'].to_numpy(),
+        'temperature_change': projections['Quadratic_Projection'].to_numpy(),
+    })
+    world_history = None
+    if history is not None:
+        world_history = (
+            history[history['year'] < first_year]
+            .groupby('year', observed=True)['temperature_change'].mean()
+            .reset_index()
+            .assign(country='World')
+        )
+    scored = score_risk(world, risk_model, world_history)
+
+    risk_df = projections[['Year', 'Quadratic_Projection']].copy()
+    risk_df['Risk_Probability'] = scored['risk_probability'].to_numpy()
+    risk_df['Risk_Level'] = np.where(scored['high_risk'], 'High Risk', 'Normal')
+    return risk_df
+
+
+def _country_outlook(country_proj, history, risk_model):
+    """``(milestones, outlook)``: risk probability per country at 2030/2040/2050, highest first."""
+    quadratic = country_proj[country_proj['model'] == 'quadratic']
+    country_history = None
+    if history is not None:
+        country_history = history[history['year'] < quadratic['year'].min()]
+    country_risk = score_projections(quadratic, risk_model, country_history)
+
+    milestones = [y for y in (2030, 2040, 2050) if y in set(country_risk['year'])]
+    outlook = (
+        country_risk[country_risk['year'].isin(milestones)]
+        .pivot_table(index='country', columns='year', values='risk_probability', observed=True)
+        .sort_values(milestones[0], ascending=False)
+    )
+    outlook.columns = [f"{year}" for year in outlook.columns]
+    return milestones, outlook
+
+
+def _risk_colors(frame):
+    """Cell styles of the risk table: High Risk rows highlighted."""
+    row_styles = np.where(frame['Risk_Level'] == 'High Risk', 'background-color: #ffcccc', '')
+    return pd.DataFrame(
+        np.broadcast_to(row_styles[:, None], frame.shape), index=frame.index, columns=frame.columns
+    )
+
+
+def render(live_data):
+    """Draw the page; ``live_data`` reads the database instead of the artifacts."""
+    st.markdown('<h1 class="main-header">📈 Logistic Regression: Climate Risk Classification</h1>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="info-box">
+    <h3>What is Logistic Regression for Climate Risk?</h3>
+    Using machine learning classification, we predict whether a year/country represents "High Risk" climate conditions
+    based on temperature anomalies >1.5°C. This creates an early warning system for climate adaptation planning.
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Load projections for risk assessment
+    projections = load_temperature_projections(columns=GLOBAL_COLUMNS)
+
+    if projections is not None:
+        st.markdown('<h2 class="section-header">🎯 Risk Classification Model</h2>', unsafe_allow_html=True)
+
+        # Trained model registered by notebook 08 (loaded once per process)
+        risk_model = load_risk_model()
+        metrics = risk_model.metrics if risk_model is not None else {}
+        spec = risk_model.metadata.get('feature_spec', {}) if risk_model is not None else {}
+        train_years = metrics.get('train_years', [1961, 2010])
+        test_years = metrics.get('test_years', [2011, 2022])
+
+        # Model overview
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("### Model Performance")
+            st.metric("ROC AUC Score", f"{metrics.get('roc_auc', 0.87):.2f}", "Good discriminatory power")
+            st.metric("Accuracy", f"{metrics.get('accuracy', 0.82):.2f}", "Overall prediction accuracy")
+            recall = metrics.get('recall_high_risk', 0.78)
+            st.metric("High Risk Recall", f"{recall:.2f}", f"Captures {recall:.0%} of high-risk cases")
+
+        with col2:
+            st.markdown("### Risk Threshold")
+            st.metric("High Risk Definition", f">{spec.get('threshold', 1.5)}°C", "Paris Agreement threshold")
+            st.metric("Training Period", f"{train_years[0]}-{train_years[1]}", "Historical data")
+            st.metric("Test Period", f"{test_years[0]}-{test_years[1]}", "Recent validation")
+
+        if risk_model is not None:
+            st.caption(f"Metrics of the registered model ({risk_model.metadata['version']}, "
+                       f"trained {risk_model.metadata['created_at'][:10]})")
+        else:
+            st.caption("Reference metrics from the last notebook report. No trained model registered yet.")
+
+        st.markdown("---")
+
+        # Feature importance
+        st.markdown("### Key Risk Indicators")
+        features_data = {
+            'Feature': ['Temperature Change', '5-Year Average', '10-Year Average', 'Change Rate', 'Year (Scaled)'],
+            'Importance': ['High', 'High', 'Medium', 'Medium', 'Low'],
+            'Direction': ['Positive', 'Positive', 'Positive', 'Positive', 'Positive']
+        }
+        st.table(pd.DataFrame(features_data))
+
+        st.markdown("---")
+
+        # Risk assessment visualization
+        st.markdown('<h2 class="section-header">📊 Risk Assessment Dashboard</h2>', unsafe_allow_html=True)
+
+        # Show logistic regression visualizations
+        img_path = load_image("reports/figures/logistic_confusion_matrix.png")
+        if img_path:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.image(img_path, caption="Confusion Matrix - Risk Classification")
+            with col2:
+                roc_path = load_image("reports/figures/logistic_roc_curve.png")
+                if roc_path:
+                    st.image(roc_path, caption="ROC Curve - Model Performance")
+        else:
+            st.warning("Logistic regression visualizations not yet generated. Run the logistic regression notebook first.")
+
+        st.markdown("---")
+
+        # Future risk projections
+        st.markdown("### 🔮 Future Risk Projections (2023-2030)")
+
+        if risk_model is None:
+            st.info("""
+            No trained risk model registered. Run `notebooks/08_logistic_regression_phase5.ipynb` to train
+            the logistic regression and save it to `models/logistic_risk/`.
+            """)
+        else:
+            # Scored once per data and model version for every session (src/result_cache.py)
+            history = db.climate_long() if live_data else load_climate_long()
+            history_version = db.data_version() if live_data else artifact_version('climate_long')
+            model_version = _model_version(risk_model)
+            risk_df = cached_result(
+                'world_risk', lambda: _world_risk(projections, history, risk_model),
+                (artifact_version('temperature_projections_2030'), history_version, model_version),
+            )
+
+            # Display risk projections
+            st.dataframe(
+                risk_df.style.format({
+                    'Quadratic_Projection': '{:.3f}°C',
+                    'Risk_Probability': '{:.1%}'
+                }).apply(_risk_colors, axis=None),
+                use_container_width=True,
+                hide_index=True
+            )
+
+            st.caption("Risk probability from the trained logistic regression applied to the projected global anomalies. High Risk = >50% probability of exceeding the 1.5°C threshold.")
+
+            # Every country x year of the per-country quadratic projections in one batch
+            st.markdown("### 🌍 Country Risk Outlook")
+
+            if live_data:
+                country_proj = db.country_projections()
+            else:
+                country_proj = load_country_projections(columns=OUTLOOK_COLUMNS)
+
+            if country_proj is not None and len(country_proj) > 0:
+                projections_version = history_version if live_data else artifact_version('country_projections')
+                milestones, outlook = cached_result(
+                    'country_risk_outlook', lambda: _country_outlook(country_proj, history, risk_model),
+                    (projections_version, history_version, model_version),
+                )
+
+                col1, col2 = st.columns([1, 3])
+                with col1:
+                    for year in milestones:
+                        n_high = int((outlook[str(year)] > 0.5).sum())
+                        st.metric(f"High-risk countries {year}", f"{n_high} / {len(outlook)}")
+                with col2:
+                    st.dataframe(
+                        outlook.head(20).style.format('{:.1%}'),
+                        use_container_width=True
+                    )
+
+                st.caption("Top 20 countries by risk probability, scored with the same model on each country's quadratic trend.")
+            else:
+                st.info("Per-country projections not yet generated. Run the regression notebook (05) first.")
+
+        st.markdown("---")
+
+        # Crossing year of every threshold, precomputed per country (src/exceedance.py)
+        st.markdown("### ⏳ When Does a Country Cross a Threshold?")
+
+        crossings = exceedance_lookup(db.country_exceedance()) if live_data else load_exceedance_lookup()
+        if crossings is not None and len(crossings) > 0:
+            crossing_countries = list(crossings.index.unique(level='country'))
+            thresholds = sorted(crossings.index.unique(level='threshold'))
+
+            col1, col2 = st.columns([2, 3])
+            with col1:
+                crossing_country = st.selectbox(
+                    "Country", crossing_countries,
+                    index=crossing_countries.index("Spain") if "Spain" in crossing_countries else 0,
+                    key="crossing_country"
+                )
+            with col2:
+                crossing_threshold = st.select_slider(
+                    "Threshold (°C)", thresholds, value=1.5 if 1.5 in thresholds else thresholds[0],
+                    format_func=lambda h: f"{h:.1f}°C", key="crossing_threshold"
+                )
+
+            row = crossings.loc[(crossing_country, crossing_threshold)]
+            status_text = {
+                'crossed': "Already crossed", 'projected': "Projected", 'later': "After 2050", 'never': "Trend never gets there",
+            }[row['status']]
+            band_text = (
+                f"{row['boot_lower']:.0f} - {row['boot_upper']:.0f}" if pd.notna(row['boot_upper'])
+                else f"{row['boot_lower']:.0f} or later" if pd.notna(row['boot_lower']) else "—"
+            )
+
+            col1, col2, col3 = st.columns(3)
+            col1.metric(
+                f"Trend reaches {crossing_threshold:.1f}°C",
+                f"{row['crossing_year']:.0f}" if pd.notna(row['crossing_year']) else "Never", status_text
+            )
+            col2.metric("95% bootstrap band", band_text)
+            col3.metric("Probability by 2050", f"{row['p_by_horizon']:.0%}")
+
+            country_crossings = crossings.loc[crossing_country].reset_index()
+            fig_crossing = go.Figure(go.Scatter(
+                x=country_crossings['boot_median'], y=country_crossings['threshold'], mode='markers',
+                error_x=dict(
+                    type='data', symmetric=False,
+                    array=(country_crossings['boot_upper'] - country_crossings['boot_median']).fillna(0),
+                    arrayminus=(country_crossings['boot_median'] - country_crossings['boot_lower']).fillna(0)
+                ),
+                name=crossing_country
+            ))
+            fig_crossing.add_vline(x=2050, line_dash="dot", line_color="gray", annotation_text="2050")
+            fig_crossing.update_layout(
+                height=350, xaxis_title="Crossing year (bootstrap median, 95% band)",
+                yaxis_title="Threshold (°C)", xaxis_range=[1960, 2150]
+            )
+            st.plotly_chart(fig_crossing, use_container_width=True)
+            st.caption(
+                "Crossing years solved from each country's quadratic trend, with bands from 1,000 residual-bootstrap "
+                "refits. An open band means some refitted trends never reach the threshold."
+            )
+        else:
+            st.info("Crossing years not generated yet. Run notebook 05 to write reports/country_exceedance.parquet.")
+
+        st.markdown("---")
+
+        # Business recommendations
+        st.markdown('<h2 class="section-header">💼 Business Implications</h2>', unsafe_allow_html=True)
+
+        st.markdown("""
+        **Early Warning System Benefits:**
+        - Predict high-risk climate scenarios 2-3 years in advance
+        - Enable proactive risk management and adaptation planning
+        - Support data-driven infrastructure investment decisions
+
+        **Key Action Items:**
+        1. **Monitor 5-year temperature averages** - Early indicator of risk
+        2. **Implement risk thresholds** - Automated alerts at 1.2°C anomalies
+        3. **Stress-test portfolios** - Against high-risk climate scenarios
+        4. **Develop contingency plans** - For accelerated warming trajectories
+        """)
+
+    else:
+        st.warning("""
+        Logistic regression results not found. Please run the logistic regression notebook first:
+
+        `notebooks/08_logistic_regression_phase5.ipynb`
+
+        This will generate the required risk classification model and save results to `reports/phase5_logistic_summary.txt`.
+        """)
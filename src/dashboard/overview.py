@@ -0,0 +1,102 @@
+"""
+🏠 Overview page: headline numbers and key findings (static content).
+"""
+
+import streamlit as st
+
+
+def render(live_data):
+    """Draw the page; ``live_data`` reads the database instead of the artifacts."""
+    st.markdown('<h1 class="main-header">🌡️ Global Temperature Change: 62 Years of Data</h1>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="warning-box">
+    <h3>What This Analysis Shows</h3>
+    After analyzing 62 years of global temperature data (1961-2022) covering 225 countries,
+    we've documented a clear and accelerating warming trend across the planet. This analysis
+    quantifies exactly how fast our planet is warming and where we're headed if current trends continue.
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Key metrics
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("📅 Years Analyzed", "1961-2022", "62 years")
+        st.caption("Continuous temperature records")
+    with col2:
+        st.metric("🌍 Countries", "225", "Global coverage")
+        st.caption("From Afghanistan to Zimbabwe")
+    with col3:
+        st.metric("📈 Warming Rate (2022)", "+0.047°C/year", "8x faster than 1961")
+        st.caption("Rate is accelerating")
+    with col4:
+        st.metric("🔮 2030 Projection", "+1.93°C", "Based on current trends")
+        st.caption("Quadratic model projection")
+
+    st.markdown("---")
+
+    # What we discovered
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown('<div class="section-header">📊 Key Findings</div>', unsafe_allow_html=True)
+        st.markdown("""
+        **1. Clear Warming Trend**
+        Global temperature data confirms a continuous upward trend since 1961. The polynomial regression analysis demonstrates that this warming is accelerating, with recent decades consistently outperforming historical averages.
+
+        **2. Acceleration Confirmed (8x)**
+        Our model reveals a dramatic increase in the warming rate. In 1961, the rate was approximately **0.006°C/year**. By 2022, it surged to **0.047°C/year**—a nearly eight-fold acceleration in just six decades.
+
+        **3. Geographic Disparities**
+        Clustering analysis identifies that warming is most intense in **Arctic and continental regions**. These areas form distinct "high-warming" clusters that are heating up significantly faster than the global baseline.
+
+        **4. 2030 Projection: 1.93°C**
+        Based on the quadratic trend ($R^2 > 0.9$), the model projects a global temperature anomaly of **+1.93°C by 2030**, assuming current trends continue without major intervention.
+        """)
+
+    with col2:
+        st.markdown('<div class="section-header">🔬 What This Data Represents</div>', unsafe_allow_html=True)
+        st.markdown("""
+        **Temperature Change Explained:**
+        This analysis relies on temperature anomalies, which measure deviation from the 1951-1980 baseline average. A value of 0°C represents the baseline normal, while positive values indicate warming. For context, +1°C signifies a global shift that triggers major ecosystem disruptions.
+
+        **Why This Matters:**
+        Seemingly small numbers like +1°C or +2°C have profound global consequences. Warming of this magnitude triggers major ecosystem disruptions and requires urgent adaptation measures.
+
+        **What Causes These Changes:**
+        Although this dataset focuses on temperature metrics, the driving forces are well-established. Greenhouse gas emissions—primarily CO₂ and methane—are the main culprits, exacerbated by deforestation and industrial activity, with natural variability playing only a minor role. This analysis quantifies the *what* and *when* of this accelerating crisis.
+        """)
+
+    st.markdown("---")
+
+    st.markdown('<div class="section-header">🎯 Who Should Use This Analysis</div>', unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("**Policy Makers**")
+        st.markdown("""
+        - Quantify warming rates for your region
+        - Compare national trends to global averages
+        - Use projections for infrastructure planning
+        - Set evidence-based climate targets
+        """)
+
+    with col2:
+        st.markdown("**Researchers & Students**")
+        st.markdown("""
+        - Access cleaned, analyzed temperature data
+        - Understand statistical modeling approaches
+        - See real-world data science in action
+        - Build on this foundation for further study
+        """)
+
+    with col3:
+        st.markdown("**Business & Infrastructure**")
+        st.markdown("""
+        - Plan for temperature scenarios through 2030
+        - Assess climate risks to operations
+        - Design for warmer future conditions
+        - Make data-driven adaptation decisions
+        """)
@@ -0,0 +1,584 @@
+"""
+🔮 Future Projections page: global models, what-if scenarios and country projections.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from src import db
+from src.dashboard.common import (
+    load_backtest_metrics,
+    load_country_projections,
+    load_country_uncertainty,
+    load_image,
+    load_model_zoo_forecasts,
+    load_temperature_projections,
+)
+from src.projections import HORIZON
+from src.scenarios import DEGREES, TARGET_YEAR, THRESHOLD, WORLD, load_scenario_engine
+
+TABLE_COLUMNS = ['Year', 'Quadratic_Projection', 'Quadratic_CI_Lower', 'Quadratic_CI_Upper']
+
+
+def warm():
+    """Load the artifacts this page reads into the process-wide cache."""
+    load_scenario_engine()
+    load_temperature_projections(columns=TABLE_COLUMNS)
+    load_country_projections()
+    load_model_zoo_forecasts()
+    load_backtest_metrics()
+
+
+def render(live_data):
+    """Draw the page; ``live_data`` reads the database instead of the artifacts."""
+    st.markdown('<h1 class="main-header">🔮 Where Are We Heading? Projections to 2030</h1>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="warning-box">
+    <h3>⚠️ Statistical Extrapolation vs Climate Modeling</h3>
+    <strong>Important:</strong> The projections below are <strong>statistical extrapolations</strong>
+    based on historical trends (1961-2022). They assume current patterns continue without major
+    policy interventions or unexpected natural events.
+
+    These are NOT comprehensive climate model outputs (like IPCC uses), but rather serve as
+    <strong>baseline scenarios</strong> for planning purposes—showing where we're headed if nothing changes.
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # What-if controls (src/scenarios.py): every change is refitted from precomputed sums
+    engine = db.scenario_engine() if live_data else load_scenario_engine()
+    if engine is not None:
+        st.sidebar.markdown("**🎛️ Projection Scenario**")
+        scenario_window = st.sidebar.slider(
+            "Training window", engine.first_year, engine.last_year,
+            (engine.first_year, engine.last_year), key="scenario_window"
+        )
+        scenario_model = st.sidebar.selectbox(
+            "Trend model", list(DEGREES), index=list(DEGREES).index("quadratic"),
+            format_func=str.title, key="scenario_model"
+        )
+        scenario_threshold = st.sidebar.slider(
+            "Threshold (°C)", 1.0, 3.0, THRESHOLD, 0.1, key="scenario_threshold"
+        )
+        scenario_year = st.sidebar.slider(
+            "Target year", engine.last_year + 1, HORIZON,
+            max(TARGET_YEAR, engine.last_year + 1), key="scenario_year"
+        )
+        scenario_countries = st.sidebar.multiselect(
+            "Countries", sorted(engine.countries), default=[WORLD], key="scenario_countries",
+            help=f"{WORLD} is the yearly mean of all countries"
+        )
+
+    tab1, tab2, tab3 = st.tabs(["📊 Projection Models", "🎯 2030 Forecast", "💼 Implications"])
+
+    with tab1:
+        st.markdown('<div class="section-header">Two Models: Linear vs Accelerating Warming</div>', unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("**Model 1: Linear (Simple) Trend**")
+
+            # Show model 1 visualization
+            img_path = load_image("reports/figures/regression_model1_simple.png")
+            if img_path:
+                st.image(img_path, use_column_width=True)
+            else:
+                st.warning("Model 1 visualization not generated.")
+
+            st.markdown("""
+            **Assumption:** Warming continues at constant rate
+
+            **Formula:** `Temp = β₀ + β₁ × Year`
+
+            **Fitted Rate:** 0.023°C per year (0.23°C per decade)
+
+            **Test Performance:**
+            - R² = -1.43 (POOR fit on recent data)
+            - RMSE = 0.26°C
+
+            **Problem:**
+            - Significantly **underestimates** recent warming
+            - Doesn't capture acceleration
+            - Straight line can't match curved reality
+
+            **2030 Projection:** 1.37°C [0.85, 1.88]
+
+            **Conclusion:** Linear model is **inadequate**—warming
+            is not constant, it's speeding up.
+            """)
+
+        with col2:
+            st.markdown("**Model 2: Polynomial (Quadratic) Trend**")
+
+            # Show model 2 visualization
+            img_path = load_image("reports/figures/regression_model2_polynomial.png")
+            if img_path:
+                st.image(img_path, use_column_width=True)
+            else:
+                st.warning("Model 2 visualization not generated.")
+
+            st.markdown("""
+            **Assumption:** Warming is accelerating over time
+
+            **Formula:** `Temp = β₀ + β₁ × Year + β₂ × Year²`
+
+            **Fitted Rates:**
+            - 1961: 0.006°C/year (0.06°C/decade)
+            - 2022: 0.047°C/year (0.47°C/decade)
+            - **Acceleration: 8x faster!**
+
+            **Test Performance:**
+            - R² = 0.51 (MUCH better fit)
+            - RMSE = 0.12°C
+
+            **Advantage:**
+            - Captures the upward curve
+            - Matches recent data well
+            - Accounts for feedback loops
+
+            **2030 Projection:** 1.93°C [1.70, 2.16]
+
+            **Conclusion:** Quadratic model better represents
+            reality—supports **accelerating warming** hypothesis.
+            """)
+
+        st.markdown("---")
+
+        st.markdown("**Model Comparison:**")
+
+        comparison_data = {
+            'Metric': ['Test R² Score', 'Test RMSE', 'Captures Acceleration?', '2030 Projection', 'Confidence Interval (95%)', 'Best Use Case'],
+            'Linear Model': ['-1.43 (poor)', '0.26°C', 'No ❌', '1.37°C', '[0.85, 1.88]', 'Conservative lower bound'],
+            'Quadratic Model': ['0.51 (good)', '0.12°C', 'Yes ✅', '1.93°C', '[1.70, 2.16]', 'Most realistic scenario']
+        }
+
+        st.table(pd.DataFrame(comparison_data))
+
+        st.markdown("""
+        **Recommendation:** Use **quadratic model** for primary projections, as it:
+        1. Fits recent data much better (R² = 0.51 vs -1.43)
+        2. Captures observed acceleration
+        3. More accurate for near-term forecasts (2023-2030)
+        4. Aligns with climate science understanding of feedback loops
+        """)
+
+    with tab2:
+        st.markdown('<div class="section-header">2030 Temperature Projection</div>', unsafe_allow_html=True)
+
+        # Show future projections visualization
+        img_path = load_image("reports/figures/regression_future_projections.png")
+        if img_path:
+            st.image(img_path, use_column_width=True)
+            st.caption("Temperature projections through 2030 with confidence intervals")
+        else:
+            st.warning("Future projections visualization not generated.")
+
+        st.markdown("---")
+
+        # Key projections: the sidebar scenario when the data are available,
+        # otherwise the notebook 05 results
+        if engine is not None and scenario_countries:
+            started = time.perf_counter()
+            curves, summary = engine.run(
+                tuple(scenario_countries), scenario_window[0], scenario_window[1],
+                DEGREES[scenario_model], scenario_threshold, scenario_year
+            )
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            lead = summary.iloc[0]
+
+            st.markdown(
+                f"**🎯 Scenario Forecast: {lead['country']} ({scenario_model.title()} trend, "
+                f"trained {scenario_window[0]}-{scenario_window[1]})**"
+            )
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric(f"{scenario_year} Projection", f"{lead['target_projection']:.2f}°C",
+                        f"{lead['rate'] * 10:+.2f}°C/decade")
+            col2.metric("95% PI Lower", f"{lead['target_lower']:.2f}°C", "Uncertainty range")
+            col3.metric("95% PI Upper", f"{lead['target_upper']:.2f}°C", "Worst case")
+            col4.metric(
+                f"Trend reaches {scenario_threshold:.1f}°C",
+                f"{lead['crossing_year']:.0f}" if pd.notna(lead['crossing_year']) else f"Not by {HORIZON}"
+            )
+
+            fig_scenario = go.Figure()
+            for country, rows in curves.groupby('country', sort=False):
+                future = rows[rows['year'] > scenario_window[1]]
+                fig_scenario.add_trace(go.Scatter(
+                    x=np.concatenate([future['year'], future['year'][::-1]]),
+                    y=np.concatenate([future['pi_upper'], future['pi_lower'][::-1]]),
+                    fill='toself', opacity=0.2, line=dict(width=0),
+                    hoverinfo='skip', showlegend=False, name=country
+                ))
+                fig_scenario.add_trace(go.Scatter(
+                    x=rows['year'], y=rows['observed'], mode='markers',
+                    marker=dict(size=4), opacity=0.5, name=f"{country} (observed)"
+                ))
+                fig_scenario.add_trace(go.Scatter(x=rows['year'], y=rows['projection'], mode='lines', name=country))
+            fig_scenario.add_vrect(x0=scenario_window[0], x1=scenario_window[1], fillcolor="gray", opacity=0.08,
+                                   line_width=0, annotation_text="Training window")
+            fig_scenario.add_hline(y=scenario_threshold, line_dash="dot", line_color="green",
+                                   annotation_text=f"Threshold {scenario_threshold:.1f}°C")
+            fig_scenario.update_layout(height=450, xaxis_title="Year", yaxis_title="Temperature change (°C)")
+            st.plotly_chart(fig_scenario, use_container_width=True)
+
+            scenario_table = summary.set_index('country')[
+                ['n_years', 'r2', 'rate', 'target_projection', 'target_lower', 'target_upper', 'crossing_year']
+            ].assign(rate=lambda d: d['rate'] * 10)
+            scenario_table.columns = [
+                'Years fitted', 'R²', 'Rate (°C/decade)', f'{scenario_year} (°C)', '95% PI Lower',
+                '95% PI Upper', f'Reaches {scenario_threshold:.1f}°C'
+            ]
+            st.dataframe(
+                scenario_table.style.format('{:.2f}', na_rep='—').format(
+                    '{:.0f}', subset=['Years fitted', f'Reaches {scenario_threshold:.1f}°C'], na_rep='—'
+                ),
+                use_container_width=True
+            )
+            st.caption(
+                f"Fitted from precomputed sums in {elapsed_ms:.1f} ms (recent scenarios are cached). "
+                "Change the window, model, threshold and countries in the sidebar."
+            )
+        else:
+            st.markdown("**🎯 Primary Forecast (Quadratic Model)**")
+
+            col1, col2, col3, col4 = st.columns(4)
+
+            col1.metric("2025 Projection", "1.61°C", "+0.05°C/yr")
+            col2.metric("2030 Projection", "1.93°C", "+0.06°C/yr")
+            col3.metric("95% CI Lower", "1.70°C", "Uncertainty range")
+            col4.metric("95% CI Upper", "2.16°C", "Worst case")
+            if engine is None:
+                st.caption("Notebook 05 results. Run notebook 02 to write reports/climate_long.parquet and explore scenarios.")
+
+        st.markdown("---")
+
+        # Year-by-year projections table
+        df_proj = load_temperature_projections(
+            columns=TABLE_COLUMNS
+        )
+        if df_proj is not None:
+            st.markdown("**Year-by-Year Projections (2023-2030):**")
+
+            # Display with formatting
+            display_df = df_proj[['Year', 'Quadratic_Projection', 'Quadratic_CI_Lower', 'Quadratic_CI_Upper']].copy()
+            display_df.columns = ['Year', 'Projected Temp (°C)', '95% CI Lower', '95% CI Upper']
+
+            st.dataframe(
+                display_df.style.format({
+                    'Projected Temp (°C)': '{:.3f}',
+                    '95% CI Lower': '{:.3f}',
+                    '95% CI Upper': '{:.3f}'
+                }).background_gradient(subset=['Projected Temp (°C)'], cmap='YlOrRd'),
+                use_container_width=True,
+                hide_index=True
+            )
+
+            st.caption("Projections based on quadratic regression model trained on 1961-2012 data, validated on 2013-2022")
+
+        st.markdown("---")
+
+        # Per-country linear and quadratic fits with 95% prediction intervals
+        st.markdown("**🌍 Country Projections to 2050:**")
+
+        if live_data:
+            country_proj = db.country_projections()
+        else:
+            country_proj = load_country_projections()
+
+        if country_proj is not None and len(country_proj) > 0:
+            proj_countries = sorted(country_proj['country'].unique())
+            default_countries = [c for c in ["Spain", "Germany", "Brazil"] if c in proj_countries] or proj_countries[:1]
+
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                selected_countries = st.multiselect("Countries", proj_countries, default=default_countries)
+            with col2:
+                proj_model = st.radio("Model", ["quadratic", "linear"], format_func=str.title)
+                use_bootstrap = st.checkbox("Bootstrap bands", help="Empirical 95% bands from 2,000 block-bootstrap refits")
+
+            proj_view = country_proj[
+                (country_proj['model'] == proj_model) & country_proj['country'].isin(selected_countries)
+            ]
+            band_lower, band_upper = 'pi_lower', 'pi_upper'
+            if use_bootstrap and len(proj_view) > 0:
+                bands = db.country_uncertainty() if live_data else load_country_uncertainty(
+                    columns=['country', 'model', 'year', 'boot_lower', 'boot_upper']
+                )
+                if bands is not None:
+                    proj_view = proj_view.merge(
+                        bands[['country', 'model', 'year', 'boot_lower', 'boot_upper']],
+                        on=['country', 'model', 'year'], how='left'
+                    )
+                    band_lower, band_upper = 'boot_lower', 'boot_upper'
+                else:
+                    st.info("Bootstrap bands not generated yet. Run notebook 05. Showing analytic intervals.")
+
+            if len(proj_view) > 0:
+                fig_proj = go.Figure()
+                for country, rows in proj_view.groupby('country', observed=True):
+                    fig_proj.add_trace(go.Scatter(
+                        x=np.concatenate([rows['year'], rows['year'][::-1]]),
+                        y=np.concatenate([rows[band_upper], rows[band_lower][::-1]]),
+                        fill='toself', opacity=0.2, line=dict(width=0),
+                        hoverinfo='skip', showlegend=False, name=country
+                    ))
+                    fig_proj.add_trace(go.Scatter(x=rows['year'], y=rows['projection'], mode='lines', name=country))
+                fig_proj.add_hline(y=1.5, line_dash="dot", line_color="green", annotation_text="Paris 1.5°C")
+                fig_proj.update_layout(
+                    height=450, xaxis_title="Year", yaxis_title="Projected temperature change (°C)"
+                )
+                st.plotly_chart(fig_proj, use_container_width=True)
+
+                milestones = proj_view[proj_view['year'].isin([2030, 2040, 2050])]
+                milestone_table = milestones.pivot_table(
+                    index='country', columns='year', values='projection', observed=True
+                )
+                milestone_table.columns = [f"{year} (°C)" for year in milestone_table.columns]
+                st.dataframe(milestone_table.style.format('{:.2f}'), use_container_width=True)
+                if band_lower == 'boot_lower':
+                    st.caption("Shaded bands are empirical 95% bands from block-bootstrap refits of each country's trend")
+                else:
+                    st.caption("Shaded bands are 95% prediction intervals of each country's own trend fit")
+        else:
+            st.info("Country projections not generated yet. Run notebook 05 to write reports/country_projections.parquet.")
+
+        # Same country under every model of the zoo (src/model_zoo.py)
+        st.markdown("**🧪 Model Comparison by Country:**")
+
+        zoo = None if live_data else load_model_zoo_forecasts()
+        zoo_countries = sorted(zoo['country'].unique()) if zoo is not None else (
+            sorted(country_proj['country'].unique()) if live_data and country_proj is not None else []
+        )
+        if zoo_countries:
+            zoo_country = st.selectbox(
+                "Country", zoo_countries,
+                index=zoo_countries.index("Spain") if "Spain" in zoo_countries else 0,
+                key="zoo_country"
+            )
+            if live_data:
+                zoo_view = db.model_zoo_forecasts(zoo_country)
+            else:
+                zoo_view = zoo[zoo['country'] == zoo_country]
+
+            fig_zoo = go.Figure()
+            for model_name, rows in zoo_view.groupby('model', observed=True):
+                fig_zoo.add_trace(go.Scatter(
+                    x=rows['year'], y=rows['forecast'], mode='lines',
+                    name=str(model_name).replace('_', ' ').title()
+                ))
+            fig_zoo.add_hline(y=1.5, line_dash="dot", line_color="green", annotation_text="Paris 1.5°C")
+            fig_zoo.update_layout(height=400, xaxis_title="Year", yaxis_title="Forecast temperature change (°C)")
+            st.plotly_chart(fig_zoo, use_container_width=True)
+
+            zoo_table = zoo_view[zoo_view['year'].isin([2030, 2050])].pivot_table(
+                index='model', columns='year', values=['forecast', 'lower', 'upper'], observed=True
+            )
+            zoo_table.columns = [f"{year} {stat}" for stat, year in zoo_table.columns]
+            st.dataframe(zoo_table[sorted(zoo_table.columns)].style.format('{:.2f}'), use_container_width=True)
+            st.caption(
+                "Polynomial trends, Holt's linear trend, a segmented trend with one breakpoint and a local "
+                "linear trend state-space model, each fitted to the country's own series (95% intervals)."
+            )
+        else:
+            st.info("Model zoo forecasts not generated yet. Run notebook 05 to write reports/model_zoo_forecasts.parquet.")
+
+        # Walk-forward backtest: every cutoff year x country, forecasts 1-10 years ahead
+        with st.expander("📏 Walk-forward backtest (forecast error by horizon)"):
+            backtest = db.backtest_metrics() if live_data else load_backtest_metrics()
+            if backtest is not None and len(backtest) > 0:
+                fig_bt = px.line(
+                    backtest, x='horizon', y='rmse', color='model', markers=True,
+                    labels={'horizon': 'Years ahead', 'rmse': 'RMSE', 'model': 'Model'}
+                )
+                fig_bt.update_layout(height=350)
+                st.plotly_chart(fig_bt, use_container_width=True)
+
+                trend_backtest = backtest[backtest['model'] != 'logistic_risk']
+                bt_table = trend_backtest.pivot_table(
+                    index='horizon', columns='model', values=['mae', 'coverage'], observed=True
+                )
+                bt_table.columns = [f"{model} {metric}" for metric, model in bt_table.columns]
+                st.dataframe(bt_table.style.format('{:.3f}'), use_container_width=True)
+                st.caption(
+                    "Expanding-window refits at every cutoff year from 1990. Coverage is the share of observed "
+                    "values inside the 95% prediction interval. The risk model predicts each year from the "
+                    "features of the cutoff year; its RMSE is the root Brier score."
+                )
+            else:
+                st.info("Backtest metrics not generated yet. Run notebook 05 to write reports/backtest_metrics.parquet.")
+
+        st.markdown("---")
+
+        st.markdown("**Climate Impact Assessment:**")
+
+        st.markdown("""
+        Our model projects +1.93°C warming by 2030, which represents significant climate change.
+
+        **Current Trajectory:**
+        - **2024**: ~1.4°C above baseline
+        - **2030**: Projected 1.93°C above baseline
+        - **Trend**: Accelerating warming rate
+
+        **What +1.93°C by 2030 Means:**
+        - Increased extreme weather frequency
+        - Greater ecosystem disruption
+        - More challenging adaptation required
+        - Approaching dangerous thresholds
+
+        **Can This Be Avoided?**
+        These projections assume **business as usual**—no major policy changes or emission
+        reductions. Aggressive climate action could bend the curve downward, but time is running out.
+        """)
+
+    with tab3:
+        st.markdown('<div class="section-header">What 1.93°C Means in Practice</div>', unsafe_allow_html=True)
+
+        st.markdown("**Translation from Statistics to Reality:**")
+
+        st.markdown("""
+        A global average of +1.93°C might sound abstract. Here's what it means for different sectors:
+        """)
+
+        # Sector impacts
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("**🌾 Agriculture & Food Security**")
+            st.markdown("""
+            - **Crop yields**: 10-20% decline in tropical regions
+            - **Growing seasons**: Shift by 2-3 weeks
+            - **Water availability**: Increased drought frequency
+            - **Pests**: Expanded range, longer active seasons
+            - **Livestock**: Heat stress reduces productivity
+
+            **Action Needed:** Drought-resistant crops, irrigation infrastructure
+            """)
+
+            st.markdown("**🏗️ Infrastructure & Cities**")
+            st.markdown("""
+            - **Cooling demand**: 30-40% increase in peak summer
+            - **Power grids**: Strain from AC load, heat reduces efficiency
+            - **Roads/rail**: Buckling, thermal expansion damage
+            - **Buildings**: Designed for old climate now inadequate
+            - **Water systems**: Increased demand, supply challenges
+
+            **Action Needed:** Retrofit for heat, upgrade capacity
+            """)
+
+            st.markdown("**💧 Water Resources**")
+            st.markdown("""
+            - **Glaciers**: Accelerated melting → long-term shortages
+            - **Rivers**: Lower flows in summer, flash floods in storms
+            - **Groundwater**: Faster depletion from increased pumping
+            - **Quality**: Warmer water = more algae, bacteria
+
+            **Action Needed:** Storage, conservation, desalination
+            """)
+
+        with col2:
+            st.markdown("**🏥 Public Health**")
+            st.markdown("""
+            - **Heat-related illness**: 2-3x increase in hospitalizations
+            - **Disease vectors**: Mosquitoes, ticks expand range
+            - **Air quality**: More ozone, particulates in heat
+            - **Mental health**: Climate anxiety, displacement stress
+            - **Vulnerable groups**: Elderly, poor most affected
+
+            **Action Needed:** Early warning systems, cooling centers
+            """)
+
+            st.markdown("**🌲 Ecosystems & Biodiversity**")
+            st.markdown("""
+            - **Species extinction**: 15-20% at risk at 2°C
+            - **Coral reefs**: 70-90% lost (already happening)
+            - **Forests**: Increased wildfires, pest outbreaks
+            - **Ocean**: Acidification, reduced oxygen
+            - **Cascading effects**: Food web disruptions
+
+            **Action Needed:** Protected areas, corridors, restoration
+            """)
+
+            st.markdown("**💼 Economic & Business**")
+            st.markdown("""
+            - **Labor productivity**: Outdoor work 10-15% less efficient
+            - **Supply chains**: Disrupted by extreme weather
+            - **Insurance**: Premiums rise, some areas uninsurable
+            - **Real estate**: Coastal, flood-prone areas lose value
+            - **Tourism**: Altered seasons, damaged destinations
+
+            **Action Needed:** Climate risk assessment, diversification
+            """)
+
+        st.markdown("---")
+
+        st.markdown("**📋 Planning Scenarios for Decision-Makers:**")
+
+        scenarios = {
+            'Scenario': ['Lower Bound', 'Most Likely', 'Upper Bound', 'Planning Recommendation'],
+            'Assumptions': [
+                'Model uncertainty (lower 95% CI)',
+                'Current trends continue (our projection)',
+                'Model uncertainty (upper 95% CI)',
+                'Conservative approach for risk management'
+            ],
+            '2030_Temperature': ['1.70°C', '1.93°C', '2.16°C', 'Plan for 2.16°C'],
+            'Probability': ['2.5%', '95%', '2.5%', 'Upper 97.5th percentile'],
+            'Action_Posture': ['Monitor closely', 'Very urgent', 'Crisis mode', 'Prepare for worst case']
+        }
+
+        st.table(pd.DataFrame(scenarios))
+
+        st.markdown("---")
+
+        st.markdown("**🎯 Recommendations by Time Horizon:**")
+
+        st.markdown("""
+        **2025 (Immediate - 2 years):**
+        - ✅ Assess current infrastructure climate resilience
+        - ✅ Update building codes and design standards
+        - ✅ Establish heat emergency protocols
+        - ✅ Begin workforce climate training
+        - ✅ Climate-proof critical supply chains
+
+        **2030 (Near-term - 7 years):**
+        - ✅ Complete major infrastructure retrofits
+        - ✅ Achieve 50% renewable energy (to slow acceleration)
+        - ✅ Implement adaptive water management
+        - ✅ Relocate/protect vulnerable assets
+        - ✅ Full climate risk integration in all planning
+
+        **2050 (Long-term - 27 years):**
+        - ✅ Carbon-neutral operations
+        - ✅ Climate-resilient infrastructure fully deployed
+        - ✅ Adaptive systems operational
+        - ✅ Multi-scenario contingency plans active
+        - ✅ Continuous monitoring and updating
+        """)
+
+        st.markdown("---")
+
+        st.markdown("""
+        <div class="info-box">
+        <h4>💡 Key Takeaway</h4>
+        <p><strong>1.93°C by 2030 is not inevitable</strong>—it's what happens if current trends continue.</p>
+
+        <p><strong>Every fraction of a degree matters:</strong></p>
+        <ul>
+        <li>1.0°C: Major ecosystem changes</li>
+        <li>1.5°C: Significant adaptation challenges</li>
+        <li>2.0°C: Very difficult adaptation</li>
+        <li>2.5°C+: Some impacts irreversible</li>
+        </ul>
+
+        <p><strong>The curve can still be bent</strong>—but the window for action narrows each year.
+        These projections are not destiny; they're a warning of what's ahead without major course correction.</p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,153 @@
+"""
+Startup and rerun timings of the dashboard.
+
+Every Streamlit interaction re-executes ``app.py``, and the first visit of a
+page imports its module (and whatever heavy libraries it needs). The app
+records those steps here, process-wide:
+
+- ``script``: the whole script run, per page (the first one is the cold start),
+- ``import`` / ``render``: page module import (first visit only) and drawing,
+- ``warm``: the background warm-up steps of ``src.dashboard.bootstrap``.
+
+``timing_table()`` renders the first and the latest duration of every step as
+a Markdown table for the sidebar; ``cache_table()`` adds the hit/miss
+counters of the shared caches. ``python -m src.dashboard.timing`` measures
+the cold start and the rerun time of every page in fresh processes
+(Streamlit's ``AppTest``), so two versions of the app can be compared:
+
+    python -m src.dashboard.timing --reruns 5
+    python -m src.dashboard.timing --app /tmp/old_app.py
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+_lock = threading.Lock()
+_steps = {}          # (phase, name) -> [first_seconds, last_seconds, count]
+
+
+def record(phase, name, seconds):
+    """Add one measurement of step ``(phase, name)``."""
+    with _lock:
+        step = _steps.get((phase, name))
+        if step is None:
+            _steps[(phase, name)] = [seconds, seconds, 1]
+        else:
+            step[1] = seconds
+            step[2] += 1
+
+
+@contextmanager
+def timed(phase, name):
+    """Record the duration of the ``with`` block as step ``(phase, name)``."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, name, time.perf_counter() - started)
+
+
+def timings():
+    """``[(phase, name, first_seconds, last_seconds, count)]`` in recording order."""
+    with _lock:
+        return [(phase, name, *step) for (phase, name), step in _steps.items()]
+
+
+def timing_table(phases=('script', 'import', 'render', 'warm')):
+    """Markdown table of the recorded steps (first and latest duration in ms)."""
+    rows = ["| Step | First (ms) | Latest (ms) | Runs |", "|---|---:|---:|---:|"]
+    for phase in phases:
+        for step_phase, name, first, last, count in timings():
+            if step_phase == phase:
+                rows.append(f"| {phase}: {name} | {first * 1000:.0f} | {last * 1000:.0f} | {count} |")
+    return "\n".join(rows)
+
+
+# Cache modules with a ``cache_info()``; reported only once a page has imported them
+CACHES = {
+    'artifacts': 'src.data_loader',
+    'queries': 'src.db',
+    'results': 'src.result_cache',
+}
+
+
+def cache_table():
+    """Markdown table of the hit/miss counters of the shared caches loaded so far."""
+    rows = ["| Cache | Hits | Misses | Entries |", "|---|---:|---:|---:|"]
+    for label, module_name in CACHES.items():
+        # A module the warm-up thread is still importing has no cache_info yet
+        cache_info = getattr(sys.modules.get(module_name), 'cache_info', None)
+        if cache_info is None:
+            continue
+        stats = cache_info()
+        hits = stats['hits'] + stats.get('disk_hits', 0)
+        rows.append(f"| {label} | {hits} | {stats['misses']} | {stats['entries']} |")
+    return "\n".join(rows) if len(rows) > 2 else ""
+
+
+# ============================================
+# Benchmark (fresh process per page)
+# ============================================
+
+_MEASURE = """
+import json, sys, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=300)
+at.run()
+cold = time.perf_counter() - started
+label = {label!r}
+if label is not None:
+    started = time.perf_counter()
+    at.sidebar.radio[0].set_value(label).run()
+    cold = time.perf_counter() - started + cold
+reruns = []
+for _ in range({reruns}):
+    started = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - started)
+print(json.dumps({{"cold": cold, "rerun": sorted(reruns)[len(reruns) // 2], "errors": len(at.exception)}}))
+"""
+
+
+def measure_page(app, label=None, reruns=3):
+    """Cold start (to ``label``, default page if None) and median rerun time of ``app``, in seconds."""
+    code = _MEASURE.format(app=str(app), label=label, reruns=reruns)
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def page_labels(app):
+    """Options of the page selector of ``app`` (read from a first run)."""
+    code = (
+        "from streamlit.testing.v1 import AppTest; "
+        f"at = AppTest.from_file({str(app)!r}, default_timeout=300).run(); "
+        "import json; print(json.dumps(list(at.sidebar.radio[0].options)))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold start and rerun time of every dashboard page.")
+    parser.add_argument('--app', default=str(PROJECT_ROOT / 'app.py'))
+    parser.add_argument('--reruns', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'page':<28} {'cold start (s)':>15} {'rerun (ms)':>11}")
+    for i, label in enumerate(page_labels(args.app)):
+        result = measure_page(args.app, None if i == 0 else label, args.reruns)
+        flag = "" if result["errors"] == 0 else f"  ⚠️ {result['errors']} exception(s)"
+        print(f"{label:<28} {result['cold']:>15.2f} {result['rerun'] * 1000:>11.0f}{flag}")
@@ -0,0 +1,289 @@
+"""
+📈 Temperature Trends page: global trend, acceleration and decade breakdown.
+"""
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from src import db
+from src.aggregates import load_trend_views
+from src.dashboard.charts import decade_figure, yearly_figure
+from src.dashboard.common import load_country_changepoints, load_image
+
+# Narrative context of each decade, next to its measured statistics
+DECADE_CONTEXT = {
+    1960: 'Pre-acceleration era',
+    1970: 'Natural variability dominant',
+    1980: 'Human signal emerges',
+    1990: 'Scientific consensus forms',
+    2000: 'Acceleration confirmed',
+    2010: 'Paris Agreement signed',
+    2020: 'Exceeding safe limits',
+}
+
+
+def warm():
+    """Load the artifacts this page reads into the process-wide cache."""
+    load_country_changepoints()
+    load_trend_views()
+
+
+def _decade_table(decades):
+    """Decade comparison table; incomplete decades are starred."""
+    incomplete = decades['last_year'] - decades['first_year'] < 9
+    labels = decades['decade'].astype(str) + "s" + incomplete.map({True: "*", False: ""})
+    return pd.DataFrame({
+        'Decade': labels,
+        'Avg_Change': decades['mean'].map(lambda v: f"{v:+.2f}°C"),
+        'Vs_Previous': decades['mean'].diff().map(lambda v: "" if pd.isna(v) else f"{v:+.2f}°C"),
+        'Std': decades['std'].map(lambda v: f"{v:.2f}°C"),
+        'Range': [f"{lo:+.2f} to {hi:+.2f}°C" for lo, hi in zip(decades['min'], decades['max'])],
+        'Observations': decades['observations'],
+        'Context': decades['decade'].map(DECADE_CONTEXT).fillna(""),
+    })
+
+
+def render(live_data):
+    """Draw the page; ``live_data`` reads the database instead of the artifacts."""
+    st.markdown('<h1 class="main-header">📈 How Temperatures Have Changed Over Time</h1>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="info-box">
+    <h3>Temporal Analysis: 62 Years of Global Warming</h3>
+    This section explores how global temperatures have evolved from 1961 to 2022, revealing
+    clear patterns of warming and—most critically—the acceleration of that warming over time.
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    tab1, tab2, tab3 = st.tabs(["📊 Overall Trends", "📈 Warming Acceleration", "📅 Decade-by-Decade"])
+
+    with tab1:
+        st.markdown('<div class="section-header">Temperature Distribution & Temporal Patterns</div>', unsafe_allow_html=True)
+
+        # Show univariate analysis
+        img_path = load_image("reports/figures/eda_univariate_temperature.png")
+        if img_path:
+            st.image(img_path, use_column_width=True)
+            st.caption("Statistical distribution of temperature changes across all countries and years")
+        else:
+            st.warning("Visualization not yet generated. Run the EDA notebook (04_eda_phase3.ipynb) to create this figure.")
+
+        st.markdown("""
+        **What These Plots Tell Us:**
+
+        **1. Distribution Shape (Histogram)**
+        - Slightly right-skewed: More extreme warm years than extreme cool years
+        - Mean (0.538°C) > Median (0.470°C): Confirms rightward skew
+        - Shows the shift from cooler early years to warmer recent years
+
+        **2. Outliers (Box Plot)**
+        - Most extreme warming: +3.69°C (Russia 2020, Estonia 2020)
+        - Most extreme cooling: -2.06°C (rare, early period anomalies)
+        - ~99% of observations fall between -1.5°C and +2.5°C
+
+        **3. Data Quality (Q-Q Plot)**
+        - Reasonably normal distribution in the center
+        - Heavier tails than perfect normal distribution
+        - Indicates real climate extremes, not just measurement error
+
+        **Why both box plot and violin plot for the same variable?**
+        El box-plot para que se vean los outliers y el violin-plot para que se vea la densidad y forma de la distribución.
+        """)
+
+        st.markdown("---")
+
+        # Show temporal trends (pre-aggregated per year, src/aggregates.py)
+        views = db.trend_views() if live_data else load_trend_views()
+        if views is not None and len(views['yearly']) > 0:
+            yearly = views['yearly']
+            st.plotly_chart(yearly_figure(yearly), use_container_width=True)
+            source = ", live from PostgreSQL" if live_data else ""
+            st.caption(f"Year-by-year average across countries and its range ({yearly['year'].min()}-{yearly['year'].max()}){source}")
+        else:
+            img_path = load_image("reports/figures/eda_temporal_trends.png")
+            if img_path:
+                st.image(img_path, use_column_width=True)
+                st.caption("Year-by-year global average temperature change (1961-2022)")
+            else:
+                st.warning("Temporal trends visualization not yet generated.")
+
+        st.markdown("""
+        **Key Observations from Temporal Analysis:**
+
+        **The Clear Upward Trend:**
+        - 1960s-1970s: Temperatures fluctuate around baseline (0°C)
+        - 1980s: Warming becomes clearly visible
+        - 1990s-2000s: Consistent positive anomalies
+        - 2010s-2020s: Every year significantly above baseline
+
+        **Variability Over Time:**
+        - Early years (1961-1980): High variability, both warm and cool years
+        - Recent years (2000-2022): Lower variability, consistently warm
+        - Suggests "new normal" has shifted upward
+
+        **Record-Breaking Years:**
+        - All of the top 10 warmest years occurred after 2010
+        - 2016, 2020, 2019, 2022 among hottest recorded
+        - Pattern: Each decade warmer than the previous
+        """)
+
+    with tab2:
+        st.markdown('<div class="section-header">Accelerating Warming: Not Just Getting Warmer, Getting Faster</div>', unsafe_allow_html=True)
+
+        # Show bivariate analysis
+        img_path = load_image("reports/figures/regression_bivariate_analysis.png")
+        if img_path:
+            st.image(img_path, use_column_width=True)
+            st.caption("Linear vs quadratic fit showing acceleration of warming")
+        else:
+            st.warning("Regression analysis visualization not yet generated.")
+
+        st.markdown("""
+        <div class="warning-box">
+        <h4>🚨 Critical Finding: Warming is Accelerating</h4>
+        The most important discovery from this analysis isn't just that temperatures are rising—
+        it's that the <strong>rate</strong> of warming is increasing. The planet is warming faster now
+        than it was 60 years ago.
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("**Warming Rate in 1961**")
+            st.metric("Rate", "0.006°C/year", "")
+            st.caption("Very slow, barely detectable")
+
+            st.markdown("**Per Decade**")
+            st.metric("", "0.06°C", "")
+
+        with col2:
+            st.markdown("**Warming Rate in 2022**")
+            st.metric("Rate", "0.047°C/year", "+683%")
+            st.caption("Nearly 8x faster!")
+
+            st.markdown("**Per Decade**")
+            st.metric("", "0.47°C", "8x increase")
+
+        st.markdown("---")
+
+        # Data-driven regime changes: optimal break year of every country (src/changepoints.py)
+        st.markdown("**⏱️ When Did Warming Speed Up? (Break Years by Country)**")
+
+        changepoints = db.country_changepoints() if live_data else load_country_changepoints()
+        if changepoints is not None and len(changepoints) > 0:
+            breaks = changepoints[changepoints['break_year'] > 0]
+            accelerating = breaks[breaks['significant'] & (breaks['slope_change'] > 0)]
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Significant acceleration", f"{len(accelerating) / max(len(breaks), 1):.0%}",
+                          f"{len(accelerating)} of {len(breaks)} countries")
+            with col2:
+                st.metric("Median rate before break", f"{breaks['pre_slope'].median() * 10:.2f}°C/decade")
+            with col3:
+                st.metric("Median rate after break", f"{breaks['post_slope'].median() * 10:.2f}°C/decade")
+
+            fig_breaks = px.histogram(
+                breaks, x='break_year', color='significant', nbins=40,
+                labels={'break_year': 'Break year', 'significant': 'Significant (p < 0.05)'}
+            )
+            fig_breaks.update_layout(height=350, yaxis_title="Countries", bargap=0.05)
+            st.plotly_chart(fig_breaks, use_container_width=True)
+            st.caption(
+                "Each country's series is split into two linear trends at the year that minimises the squared "
+                "error (segments of at least 10 years); significance is a Chow test against a single trend."
+            )
+        else:
+            st.info("Changepoints not generated yet. Run notebook 04 to write reports/country_changepoints.parquet.")
+
+        st.markdown("---")
+
+        st.markdown("**What Causes Acceleration?**")
+
+        st.markdown("""
+        The quadratic (curved) trend line fits the data better than a straight line,
+        indicating genuine acceleration. Possible reasons:
+
+        1. **Cumulative Emissions**: Greenhouse gases accumulate in atmosphere
+        2. **Feedback Loops**:
+           - Melting ice → less sunlight reflected → more warming
+           - Thawing permafrost → releases more CO₂ → more warming
+        3. **Increased Emission Rates**: Industrial activity has intensified
+        4. **Ocean Heat Lag**: Oceans releasing stored heat
+
+        **Model Diagnosis & Validation:**
+
+        To determine the nature of the warming trend, we compared two statistical models.
+        The diagnosis shows that the **Linear Model** fails to capture recent trends
+        (Test R²: -1.43), indicating a poor fit.
+
+        In contrast, the **Quadratic Model** provides a statistically valid fit
+        (Test R²: 0.51). Based on this validated model, the positive quadratic coefficient
+        (+0.000338) confirms mathematically that the rate of warming is accelerating.
+
+        **Conclusion:**
+        The data rejects the hypothesis of constant warming. The validated quadratic
+        model proves the curve is bending upward.
+        """)
+
+    with tab3:
+        st.markdown('<div class="section-header">Decade-by-Decade Breakdown</div>', unsafe_allow_html=True)
+
+        # Show decade analysis (pre-aggregated per decade, src/aggregates.py)
+        views = db.trend_views() if live_data else load_trend_views()
+        decades = views['decades'] if views is not None else None
+        if decades is not None and len(decades) > 0:
+            st.plotly_chart(decade_figure(decades), use_container_width=True)
+            source = ", live from PostgreSQL" if live_data else ""
+            st.caption(f"Average temperature change by decade (error bars: ± one standard deviation){source}")
+        else:
+            img_path = load_image("reports/figures/eda_decade_analysis.png")
+            if img_path:
+                st.image(img_path, use_column_width=True)
+                st.caption("Average temperature change by decade")
+            else:
+                st.warning("Decade analysis visualization not yet generated.")
+
+        st.markdown("**Generational Climate Shifts:**")
+
+        # Decade comparison table
+        if decades is not None and len(decades) > 0:
+            st.dataframe(_decade_table(decades), use_container_width=True, hide_index=True)
+            partial = decades[decades['last_year'] - decades['first_year'] < 9]
+            if len(partial) > 0:
+                st.caption("; ".join(
+                    f"*{row.decade}s includes {row.first_year}-{row.last_year} only (incomplete decade)"
+                    for row in partial.itertuples()
+                ))
+        else:
+            st.info("Decade statistics not generated yet. Run notebook 02 to write reports/climate_long.parquet.")
+
+        st.markdown("---")
+
+        st.markdown("**Inter-Generational Perspective:**")
+
+        st.markdown("""
+        **Someone born in 1961** experienced:
+        - **Age 0-20 (1961-1981)**: Climate similar to historical norms, minor fluctuations
+        - **Age 20-40 (1981-2001)**: Gradual warming, +0.2-0.4°C, barely noticeable
+        - **Age 40-60 (2001-2021)**: Rapid warming, +0.7-1.2°C, major disruptions
+        - **Age 61+ (2021-now)**: Every year exceeds 1°C warming, "new normal"
+
+        **Someone born in 2020** will experience:
+        - **Age 0-10 (2020-2030)**: +1.93°C warming (projected), extreme as baseline
+        - **Lifetime normal**: What previous generations called "catastrophic"
+
+        **The Climate You're Born Into:**
+        - 1960s child: Grew up in stable climate, saw it deteriorate
+        - 2000s child: Never knew stable climate, adapts to chaos
+        - 2020s child: Extreme weather is normal, doesn't know "cool" summers
+
+        This is why urgency matters—each passing decade, the problem compounds and
+        the "normal" shifts further into dangerous territory.
+        """)
@@ -0,0 +1,193 @@
+"""
+Cached loaders for the artifacts in ``reports/``.
+
+Streamlit re-executes ``app.py`` from the top on every widget interaction, so a
+plain ``pd.read_csv`` in a helper re-parses the same file on every click. The
+loaders in this module keep parsed DataFrames in a process-wide cache keyed on
+the file path plus its modification time and size:
+
+- a rerun only costs one ``os.stat()`` per artifact,
+- every session served by the same Streamlit process shares a single copy,
+- re-running a notebook rewrites the file, changes its signature and the next
+  load re-parses it automatically.
+
+Cached frames are shared between sessions: treat them as read-only and call
+``.copy()`` before modifying them.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+REPORTS_DIR = PROJECT_ROOT / "reports"
+
+# Bounds for the process-wide cache (entries and approximate bytes in memory)
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def file_signature(path):
+    """Return ``(resolved_path, mtime_ns, size)`` for ``path``."""
+    resolved = Path(path).resolve()
+    stat = os.stat(resolved)
+    return (str(resolved), stat.st_mtime_ns, stat.st_size)
+
+
+def _frame_nbytes(obj):
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(deep=True))
+    return 0
+
+
+class ArtifactCache:
+    """Thread-safe LRU cache of parsed files keyed on path + mtime + size.
+
+    Each entry remembers the file signature it was parsed from. A lookup whose
+    signature no longer matches (file rewritten, touched or truncated) is a miss
+    and replaces the stale entry. Entries are evicted least-recently-used first
+    once either ``max_entries`` or ``max_bytes`` is exceeded.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (signature, value, nbytes)
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key, signature):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            return False, None
+
+    def get(self, path, loader, key=None):
+        """Return ``loader(path)``, re-using the cached result while the file is unchanged."""
+        signature = file_signature(path)
+        key = key or signature[0]
+
+        found, value = self._lookup(key, signature)
+        if found:
+            return value
+
+        # One parse per key: concurrent sessions missing on the same file wait
+        # for the first one instead of all reading it from disk.
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            found, value = self._lookup(key, signature)
+            if found:
+                return value
+            value = loader(path)
+            self._store(key, signature, value)
+            return value
+
+    def _store(self, key, signature, value):
+        nbytes = _frame_nbytes(value)
+        with self._lock:
+            self.misses += 1
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (signature, value, nbytes)
+            self._bytes += nbytes
+            # Always keep the entry just stored, even if it alone exceeds the budget
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                evicted_key, (_, _, evicted_bytes) = self._entries.popitem(last=False)
+                self._bytes -= evicted_bytes
+                self._key_locks.pop(evicted_key, None)
+
+    def invalidate(self, path=None):
+        """Drop the entries for ``path`` (every variant of it), or everything if ``path`` is None."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._key_locks.clear()
+                self._bytes = 0
+                return
+            resolved = str(Path(path).resolve())
+            for key in [k for k in self._entries if k == resolved or k.startswith(resolved + "|")]:
+                self._bytes -= self._entries.pop(key)[2]
+                self._key_locks.pop(key, None)
+
+    def info(self):
+        """Return hit/miss counters and current size of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Shared by every session of the Streamlit process
+_cache = ArtifactCache()
+
+
+def load_cached(path, loader, variant=None):
+    """Return ``loader(path)`` through the process-wide cache.
+
+    ``variant`` distinguishes several cached results for the same file (e.g.
+    different column selections). Returns None when the file does not exist.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    key = str(path.resolve())
+    if variant is not None:
+        key += "|" + repr(variant)
+    return _cache.get(path, loader, key=key)
+
+
+def load_csv(path, **read_kwargs):
+    """Read a CSV through the process-wide cache.
+
+    Returns None when the file does not exist (the dashboard shows a
+    "run the notebook first" message in that case). Extra keyword arguments are
+    passed to ``pd.read_csv`` and are part of the cache key.
+    """
+    variant = sorted(read_kwargs.items()) if read_kwargs else None
+    return load_cached(path, lambda p: pd.read_csv(p, **read_kwargs), variant=variant)
+
+
+def load_parquet(path, columns=None):
+    """Read a Parquet file through the process-wide cache.
+
+    Only ``columns`` are decoded (column projection) and the file is memory
+    mapped instead of being copied into a read buffer. Returns None when the
+    file does not exist.
+    """
+    if columns is not None:
+        columns = list(columns)
+    return load_cached(
+        path,
+        lambda p: pd.read_parquet(p, columns=columns, engine="pyarrow", memory_map=True),
+        variant=columns,
+    )
+
+
+def invalidate(path=None):
+    """Forget a cached artifact (or all of them) so the next load re-reads it."""
+    _cache.invalidate(path)
+
+
+def cache_info():
+    """Return hit/miss counters and memory usage of the shared cache."""
+    return _cache.info()
@@ -0,0 +1,426 @@
+"""
+Database access for the dashboard's live-data mode.
+
+The app used to read only the artifacts in ``reports/``. With live data on,
+pages query the ``climate_indicators`` table loaded by notebook 02 instead:
+
+- one SQLAlchemy engine per process (``get_engine``) with a small connection
+  pool, so a Streamlit rerun borrows a pooled connection instead of opening a
+  new one,
+- ``query_df`` runs parameterised SQL and caches the result per
+  (sql, params) for ``ttl`` seconds, shared by every session,
+- the aggregate helpers read the rollup tables of ``src.rollups`` (a few
+  hundred rows, rebuilt on every load) instead of grouping the base table;
+  row-level helpers filter on its indexed columns.
+
+Connection settings come from ``DATABASE_URL`` or the ``POSTGRES_*`` variables
+of ``docker-compose.yml`` (defaulting to the compose credentials on
+localhost). Cached frames are shared: copy them before modifying.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from src.db_loader import TABLE
+from src.rollups import ensure_rollups
+
+DEFAULT_TTL = 300          # seconds a query result stays valid
+MAX_CACHED_QUERIES = 128
+CONNECT_TIMEOUT = 3        # seconds, so a missing database fails fast
+
+
+def database_url():
+    """Connection URL from ``DATABASE_URL`` or the ``POSTGRES_*`` variables."""
+    if os.environ.get('DATABASE_URL'):
+        return os.environ['DATABASE_URL']
+    user = os.environ.get('POSTGRES_USER', 'datascientist')
+    password = os.environ.get('POSTGRES_PASSWORD', 'climate2024')
+    host = os.environ.get('POSTGRES_HOST', 'localhost')
+    port = os.environ.get('POSTGRES_PORT', '5432')
+    database = os.environ.get('POSTGRES_DB', 'climate_data')
+    return f'postgresql://{user}:{password}@{host}:{port}/{database}'
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """Return the process-wide engine, creating it (and its pool) on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            url = database_url()
+            if url.startswith('postgresql'):
+                _engine = create_engine(
+                    url,
+                    pool_size=5,
+                    max_overflow=5,
+                    pool_pre_ping=True,    # drop connections the server closed
+                    pool_recycle=1800,
+                    connect_args={'connect_timeout': CONNECT_TIMEOUT},
+                )
+            else:
+                _engine = create_engine(url)
+        return _engine
+
+
+def set_engine(engine):
+    """Use ``engine`` instead of the one built from the environment (clears the cache)."""
+    global _engine
+    with _engine_lock:
+        _engine = engine
+    clear_cache()
+
+
+# ============================================
+# Query cache
+# ============================================
+
+class QueryCache:
+    """Thread-safe TTL + LRU cache of query results keyed on (sql, params)."""
+
+    def __init__(self, max_entries=MAX_CACHED_QUERIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            return False, None
+
+    def get(self, key, compute, ttl):
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        # One query per key: concurrent reruns wait for the first one
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            found, value = self._lookup(key)
+            if found:
+                return value
+            value = compute()
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = (time.monotonic() + ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self._key_locks.pop(evicted, None)
+            return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+    def info(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+
+_cache = QueryCache()
+
+
+def _cache_key(sql, params):
+    return (sql, tuple(sorted((params or {}).items())))
+
+
+def query_df(sql, params=None, ttl=DEFAULT_TTL):
+    """Run a parameterised query (``:name`` placeholders) and return a DataFrame.
+
+    Results are cached per (sql, params) for ``ttl`` seconds.
+    """
+    def run():
+        with get_engine().connect() as conn:
+            return pd.read_sql(text(sql), conn, params=params)
+
+    return _cache.get(_cache_key(sql, params), run, ttl)
+
+
+def clear_cache():
+    """Forget every cached query result (e.g. after a load)."""
+    _cache.clear()
+
+
+def cache_info():
+    return _cache.info()
+
+
+def is_available(ttl=30):
+    """True when the database answers and ``climate_indicators`` exists.
+
+    Builds the rollup tables if they are missing. The answer is cached for
+    ``ttl`` seconds so an unreachable server does not slow down every rerun.
+    """
+    def check():
+        try:
+            with get_engine().connect() as conn:
+                conn.execute(text(f'SELECT 1 FROM {TABLE} LIMIT 1'))
+            ensure_rollups(get_engine())
+            return True
+        except Exception:
+            return False
+
+    return _cache.get(('is_available',), check, ttl)
+
+
+# ============================================
+# Dashboard queries
+# ============================================
+
+def yearly_global_mean(start_year=1961, end_year=2100, ttl=DEFAULT_TTL):
+    """Mean temperature change across countries for each year (``year``, ``mean``, ``countries``)."""
+    return query_df("""
+        SELECT year, avg_temp AS mean, num_countries AS countries
+        FROM climate_yearly
+        WHERE year BETWEEN :start_year AND :end_year
+        ORDER BY year
+    """, {'start_year': start_year, 'end_year': end_year}, ttl)
+
+
+def decade_means(ttl=DEFAULT_TTL):
+    """Mean temperature change per decade (``decade``, ``mean``, ``observations``)."""
+    return query_df("""
+        SELECT decade, avg_temp AS mean, num_records AS observations
+        FROM climate_decade
+        ORDER BY decade
+    """, None, ttl)
+
+
+def yearly_stats(ttl=DEFAULT_TTL):
+    """Per-year mean, std, min, max and country count (``src.aggregates.YEARLY_COLUMNS``)."""
+    from src.aggregates import YEARLY_COLUMNS, std_from_sums
+
+    yearly = query_df("""
+        SELECT year, avg_temp AS mean, min_temp AS min, max_temp AS max,
+               num_countries AS countries, sum_temp, sum_sq_temp
+        FROM climate_yearly
+        ORDER BY year
+    """, None, ttl)
+    return yearly.assign(
+        std=std_from_sums(yearly['countries'], yearly['sum_temp'], yearly['sum_sq_temp'])
+    )[YEARLY_COLUMNS]
+
+
+def decade_stats(ttl=DEFAULT_TTL):
+    """Per-decade mean, std, min, max and covered years (``src.aggregates.DECADE_COLUMNS``)."""
+    from src.aggregates import DECADE_COLUMNS, std_from_sums
+
+    decades = query_df("""
+        SELECT decade, avg_temp AS mean, min_temp AS min, max_temp AS max,
+               num_records AS observations, sum_temp, sum_sq_temp
+        FROM climate_decade
+        ORDER BY decade
+    """, None, ttl)
+    years = yearly_stats(ttl)['year']
+    covered = years.groupby(years // 10 * 10).agg(['min', 'max'])
+    return decades.assign(
+        std=std_from_sums(decades['observations'], decades['sum_temp'], decades['sum_sq_temp']),
+        first_year=decades['decade'].map(covered['min']),
+        last_year=decades['decade'].map(covered['max']),
+    )[DECADE_COLUMNS]
+
+
+def country_means(min_years=40, ttl=DEFAULT_TTL):
+    """Per-country mean, min, max and year count for countries with ``min_years`` or more."""
+    return query_df("""
+        SELECT country, iso3, avg_temp AS mean_temp, min_temp, max_temp,
+               num_years AS years_data
+        FROM climate_country_summary
+        WHERE num_years >= :min_years
+        ORDER BY avg_temp DESC
+    """, {'min_years': min_years}, ttl)
+
+
+def country_series(country, ttl=DEFAULT_TTL):
+    """Yearly values of one country (``idx_country_year`` lookup)."""
+    return query_df(f"""
+        SELECT year, temperature_change
+        FROM {TABLE}
+        WHERE country = :country
+        ORDER BY year
+    """, {'country': country}, ttl)
+
+
+def climate_long(ttl=DEFAULT_TTL):
+    """The long table columns used by the feature engine, in (country, year) order."""
+    return query_df(f"""
+        SELECT country, iso3, year, temperature_change
+        FROM {TABLE}
+        ORDER BY country, year
+    """, None, ttl)
+
+
+def trend_state(ttl=DEFAULT_TTL):
+    """OLS trend state (``src.trend_state``) of the live table, cached like a query.
+
+    Uses the state saved by the last load when it holds the same values
+    (content fingerprint, so a reload that rewrote every value with the same
+    row count is noticed), otherwise builds it from ``climate_long``.
+    """
+    from src.trend_state import TrendState, frame_fingerprint, load_trend_state
+
+    def build():
+        long = climate_long(ttl)
+        saved = load_trend_state()
+        if saved is not None and saved.fingerprint() == frame_fingerprint(long):
+            return saved
+        return TrendState.from_frame(long)
+
+    return _cache.get(('trend_state',), build, ttl)
+
+
+def country_features(ttl=DEFAULT_TTL):
+    """Clustering features (``src.features``) computed from the live table, cached like a query."""
+    from src.features import compute_country_features
+
+    return _cache.get(
+        ('country_features',),
+        lambda: compute_country_features(climate_long(ttl), trend_state=trend_state(ttl)),
+        ttl,
+    )
+
+
+def country_projections(ttl=DEFAULT_TTL):
+    """Per-country projections (``src.projections``) from the live table, cached like a query."""
+    from src.projections import compute_country_projections
+
+    return _cache.get(('country_projections',), lambda: compute_country_projections(climate_long(ttl)), ttl)
+
+
+def country_uncertainty(ttl=DEFAULT_TTL):
+    """Block-bootstrap bands of the per-country projections (``src.uncertainty``), cached."""
+    from src.uncertainty import bootstrap_projections
+
+    return _cache.get(('country_uncertainty',),
+                      lambda: bootstrap_projections(climate_long(ttl), method='block'), ttl)
+
+
+def model_zoo_forecasts(country, ttl=DEFAULT_TTL):
+    """Forecasts of every ``src.model_zoo`` model for one country of the live table, cached."""
+    from src.model_zoo import run_zoo
+
+    return _cache.get(
+        ('model_zoo_forecasts', country),
+        lambda: run_zoo(climate_long(ttl), countries=[country], n_jobs=1)[0],
+        ttl,
+    )
+
+
+def backtest_metrics(ttl=DEFAULT_TTL):
+    """Walk-forward metrics cube (``src.backtest``) of the live table, cached like a query."""
+    from src.backtest import metrics_cube, walk_forward
+
+    return _cache.get(('backtest_metrics',), lambda: metrics_cube(walk_forward(climate_long(ttl))), ttl)
+
+
+def country_changepoints(ttl=DEFAULT_TTL):
+    """Break years and slopes (``src.changepoints``) of the live table, cached like a query."""
+    from src.changepoints import detect_changepoints
+
+    return _cache.get(('country_changepoints',), lambda: detect_changepoints(climate_long(ttl)), ttl)
+
+
+def scenario_engine(ttl=DEFAULT_TTL):
+    """What-if projection engine (``src.scenarios``) over the live table, cached like a query."""
+    from src.scenarios import ScenarioEngine
+
+    return _cache.get(('scenario_engine',), lambda: ScenarioEngine.from_frame(climate_long(ttl)), ttl)
+
+
+def country_exceedance(ttl=DEFAULT_TTL):
+    """Threshold crossing years with bootstrap bands (``src.exceedance``) of the live table, cached."""
+    from src.exceedance import compute_exceedance
+
+    return _cache.get(('country_exceedance',), lambda: compute_exceedance(climate_long(ttl)), ttl)
+
+
+def trend_views(ttl=DEFAULT_TTL):
+    """Chart views of the Trends and Geographic pages (``src.aggregates``) from the rollups, cached."""
+    from src.aggregates import CASE_STUDIES, MIN_YEARS, TOP_N, case_study_series, country_rankings
+
+    def build():
+        series = [
+            country_series(country, ttl).assign(country=country, iso3='')
+            for countries in CASE_STUDIES.values() for country in countries
+        ]
+        return {
+            'yearly': yearly_stats(ttl),
+            'decades': decade_stats(ttl),
+            'rankings': country_rankings(country_means(MIN_YEARS, ttl), TOP_N, MIN_YEARS),
+            'case_studies': case_study_series(pd.concat(series, ignore_index=True)),
+        }
+
+    return _cache.get(('trend_views',), build, ttl)
+
+
+def clustering_results(ttl=DEFAULT_TTL):
+    """Cluster assignments of the last notebook run with features refreshed from the live table.
+
+    None when the ``clustering_results_named`` artifact is missing.
+    """
+    from src.artifacts import read_artifact
+
+    def build():
+        clustering_df = read_artifact("clustering_results_named")
+        if clustering_df is None:
+            return None
+        live_features = country_features(ttl)
+        feature_cols = [c for c in live_features.columns[2:] if c in clustering_df.columns]
+        return clustering_df.drop(columns=feature_cols).merge(
+            live_features[['iso3'] + feature_cols],
+            on='iso3', how='left'
+        )
+
+    return _cache.get(('clustering_results',), build, ttl)
+
+
+def cluster_map(detail='simplified', ttl=DEFAULT_TTL):
+    """Base cluster map (``src.maps``) of ``clustering_results``, built once per cache entry and GeoJSON version."""
+    from src.maps import GEOJSON_PATH, cluster_map as build_map, geojson_version, load_geojson
+
+    version = geojson_version(GEOJSON_PATH)
+
+    def build():
+        clustering_df = clustering_results(ttl)
+        if clustering_df is None:
+            return None
+        return build_map(clustering_df, load_geojson(GEOJSON_PATH) if version is not None else None, detail)
+
+    return _cache.get(('cluster_map', detail if version is None else None, version), build, ttl)
+
+
+def country_index(ttl=DEFAULT_TTL):
+    """Country lookup and similar-country KD-tree (``src.country_index``) of ``clustering_results``."""
+    from src.country_index import CountryIndex
+
+    def build():
+        clustering_df = clustering_results(ttl)
+        return None if clustering_df is None else CountryIndex(clustering_df)
+
+    return _cache.get(('country_index',), build, ttl)
+
+
+def data_version(ttl=DEFAULT_TTL):
+    """Fingerprint of the loaded data (years, rows and sum of ``climate_yearly``), for result cache keys."""
+    version = query_df("""
+        SELECT COUNT(*) AS years, SUM(num_countries) AS observations, SUM(sum_temp) AS total
+        FROM climate_yearly
+    """, None, ttl).iloc[0]
+    return ('live', int(version['years']), int(version['observations'] or 0), round(float(version['total'] or 0), 6))
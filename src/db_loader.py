@@ -0,0 +1,218 @@
+"""
+Bulk loader for the ``climate_indicators`` table.
+
+Replaces ``df_clean.to_sql('climate_indicators', ..., if_exists='replace',
+method='multi')`` of ``notebooks/02_data_transformation.ipynb``, which sent the
+table as thousands of parameterised INSERT statements and dropped the live table
+before re-creating it. A load now runs in three steps:
+
+1. ``climate_indicators_staging`` is created with explicit column types and a
+   primary key on ``(iso3, year)``,
+2. the rows are streamed into it with ``COPY ... FROM STDIN`` (CSV chunks), then
+   the secondary indexes are built and the table is analysed,
+3. one short transaction drops the old table and renames the staging table,
+   its primary key and indexes into place.
+
+Readers keep querying the previous table until step 3 commits, so the
+dashboard never sees an empty or half-loaded table.
+
+Every row also stores ``row_hash``, a 64-bit content hash of its values, which
+``src.ingest`` compares against to load only new or revised rows. After the
+swap the aggregate tables of ``src.rollups`` are rebuilt.
+
+PostgreSQL (psycopg2, or psycopg 3) uses ``COPY``. Any other SQLAlchemy engine
+(e.g. ``sqlite:///:memory:``) is loaded with ``executemany``, which makes the
+loader easy to try without the database container.
+"""
+
+import io
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+TABLE = 'climate_indicators'
+
+# (column, SQL type) in table order; the DDL is valid for PostgreSQL and SQLite
+COLUMNS = [
+    ('objectid', 'INTEGER'),
+    ('country', 'TEXT NOT NULL'),
+    ('iso2', 'TEXT'),
+    ('iso3', 'TEXT NOT NULL'),
+    ('year', 'SMALLINT NOT NULL'),
+    ('temperature_change', 'DOUBLE PRECISION NOT NULL'),
+    ('indicator', 'TEXT'),
+    ('unit', 'TEXT'),
+    ('source', 'TEXT'),
+    ('cts_code', 'TEXT'),
+    ('cts_name', 'TEXT'),
+    ('cts_full_descriptor', 'TEXT'),
+    ('row_hash', 'BIGINT NOT NULL'),
+]
+PRIMARY_KEY = ('iso3', 'year')
+
+# Secondary indexes, built after the rows are in (iso3 lookups use the primary key)
+INDEXES = {
+    'idx_country': ('country',),
+    'idx_year': ('year',),
+    'idx_country_year': ('country', 'year'),
+}
+
+# Columns covered by ``row_hash``: everything the source file provides
+HASH_COLUMNS = [name for name, _ in COLUMNS if name != 'row_hash']
+
+COPY_CHUNK_ROWS = 100_000
+
+
+def content_hash(df):
+    """Return a signed 64-bit hash of ``HASH_COLUMNS`` for every row of ``df``.
+
+    Values are normalised first (text as objects, integer years, float64
+    temperatures) so the hash depends on the data, not on how it was read.
+    """
+    values = df[HASH_COLUMNS].astype(object)
+    values = values.where(values.notna(), None)
+    values['objectid'] = pd.to_numeric(df['objectid']).astype('float64')
+    values['year'] = df['year'].astype('int64')
+    values['temperature_change'] = df['temperature_change'].astype('float64')
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    return pd.Series(hashes.view(np.int64), index=df.index, name='row_hash')
+
+
+def prepare_frame(df):
+    """Return ``df`` with lowercase column names, in table order and checked.
+
+    Adds the ``row_hash`` column. Raises ValueError when a table column is
+    missing or when ``(iso3, year)`` is not unique.
+    """
+    df = df.rename(columns=str.lower)
+    missing = [name for name in HASH_COLUMNS if name not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns for {TABLE}: {missing}")
+
+    df = df[HASH_COLUMNS].assign(row_hash=content_hash(df))
+    duplicated = df.duplicated(list(PRIMARY_KEY))
+    if duplicated.any():
+        sample = df.loc[duplicated, list(PRIMARY_KEY)].head(5).to_dict('records')
+        raise ValueError(f"Duplicate (iso3, year) rows, e.g. {sample}")
+    return df
+
+
+def create_table_sql(table):
+    """``CREATE TABLE`` statement with explicit types and a named primary key."""
+    columns = ',\n    '.join(f'{name} {sql_type}' for name, sql_type in COLUMNS)
+    return (
+        f'CREATE TABLE {table} (\n'
+        f'    {columns},\n'
+        f'    CONSTRAINT {table}_pkey PRIMARY KEY ({", ".join(PRIMARY_KEY)})\n'
+        f')'
+    )
+
+
+def _index_sql(name, table, columns):
+    return f'CREATE INDEX {name} ON {table} ({", ".join(columns)})'
+
+
+def copy_rows(conn, df, table):
+    """Stream ``df`` into ``table`` with ``COPY FROM STDIN``, one CSV buffer per chunk."""
+    names = ', '.join(name for name, _ in COLUMNS)
+    sql = f'COPY {table} ({names}) FROM STDIN WITH (FORMAT csv)'
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        for start in range(0, len(df), COPY_CHUNK_ROWS):
+            buffer = io.StringIO()
+            df.iloc[start:start + COPY_CHUNK_ROWS].to_csv(buffer, header=False, index=False)
+            buffer.seek(0)
+            if hasattr(cursor, 'copy_expert'):
+                cursor.copy_expert(sql, buffer)           # psycopg2
+            else:
+                with cursor.copy(sql) as copy:           # psycopg 3
+                    copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+
+
+def insert_rows(conn, df, table):
+    """Portable fallback for engines without ``COPY`` (SQLite)."""
+    names = [name for name, _ in COLUMNS]
+    sql = text(
+        f'INSERT INTO {table} ({", ".join(names)}) '
+        f'VALUES ({", ".join(":" + name for name in names)})'
+    )
+    records = df.astype(object).where(df.notna(), None).to_dict('records')
+    if records:
+        conn.execute(sql, records)
+
+
+def write_rows(conn, df, table):
+    """Append the rows of a prepared frame to ``table`` (COPY on PostgreSQL)."""
+    if conn.dialect.name == 'postgresql':
+        copy_rows(conn, df, table)
+    else:
+        insert_rows(conn, df, table)
+
+
+def create_staging(engine, table=TABLE):
+    """Create an empty ``<table>_staging`` (dropping a leftover one) and return its name."""
+    staging = f'{table}_staging'
+    with engine.begin() as conn:
+        conn.execute(text(f'DROP TABLE IF EXISTS {staging}'))
+        conn.execute(text(create_table_sql(staging)))
+    return staging
+
+
+def drop_staging(engine, table=TABLE):
+    """Discard a partially filled staging table (the live table is untouched)."""
+    with engine.begin() as conn:
+        conn.execute(text(f'DROP TABLE IF EXISTS {table}_staging'))
+
+
+def swap_staging(engine, table=TABLE):
+    """Index the filled staging table and swap it in for ``table``."""
+    staging = f'{table}_staging'
+    postgres = engine.dialect.name == 'postgresql'
+
+    if postgres:
+        with engine.begin() as conn:
+            for name, columns in INDEXES.items():
+                conn.execute(text(_index_sql(f'{name}_staging', staging, columns)))
+        with engine.connect() as conn:
+            conn.execute(text(f'ANALYZE {staging}'))
+            conn.commit()
+
+    # One transaction, so readers see either the old or the new table
+    with engine.begin() as conn:
+        conn.execute(text(f'DROP TABLE IF EXISTS {table}'))
+        conn.execute(text(f'ALTER TABLE {staging} RENAME TO {table}'))
+        if postgres:
+            conn.execute(text(
+                f'ALTER TABLE {table} RENAME CONSTRAINT {staging}_pkey TO {table}_pkey'
+            ))
+            for name in INDEXES:
+                conn.execute(text(f'ALTER INDEX {name}_staging RENAME TO {name}'))
+        else:
+            # SQLite cannot rename indexes; build them inside the swap instead
+            for name, columns in INDEXES.items():
+                conn.execute(text(_index_sql(name, table, columns)))
+
+    if table == TABLE:
+        from src.rollups import refresh_rollups
+        refresh_rollups(engine, table)
+
+
+def load_climate_indicators(df, engine, table=TABLE):
+    """Replace ``table`` with the rows of ``df`` through a staging table.
+
+    ``df`` is the long table of the transformation notebook (column names in
+    any case). Returns the number of rows loaded.
+    """
+    df = prepare_frame(df)
+    staging = create_staging(engine, table)
+    try:
+        with engine.begin() as conn:
+            write_rows(conn, df, staging)
+    except Exception:
+        drop_staging(engine, table)
+        raise
+    swap_staging(engine, table)
+    return len(df)
@@ -0,0 +1,142 @@
+"""
+When does each country's warming trend cross 1.0, 1.5, 2.0 ... °C?
+
+The risk page only says whether the global projection passes 1.5°C. This
+module answers it for every country and threshold, with uncertainty:
+
+- the quadratic trend ``f(t) = β₀ + β₁t + β₂t²`` of ``src.projections`` is
+  solved for ``f(t) = h`` analytically, for all countries and thresholds at
+  once. The upward crossing is ``t = (-β₁ + √D) / 2β₂``, evaluated as
+  ``2c / (-β₁ - √D)`` when ``β₁ ≥ 0`` (no cancellation, and it tends to the
+  linear root as ``β₂ → 0``); no real root means the trend never gets there,
+- the band comes from the residual bootstrap of ``src.uncertainty``: the
+  resampled coefficients ``β*`` of every draw go through the same root
+  formula, and the quantiles of the crossing years are the band (draws that
+  never cross count as +∞, so an upper bound can be open),
+- ``p_by_horizon`` is the share of draws that cross by ``horizon``.
+
+The table has one row per (country, threshold) and is stored as the
+``country_exceedance`` artifact; ``exceedance_lookup`` indexes it so the
+dashboard answers "when does country X cross Y°C" with one ``.loc``:
+
+    table = compute_exceedance(df)
+    write_artifact(table, 'country_exceedance')
+    exceedance_lookup(table).loc[('Spain', 2.0)]
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.artifacts import artifact_source, read_artifact
+from src.data_loader import load_cached
+from src.features import MIN_YEARS
+from src.projections import HORIZON, YEAR_SCALE, country_year_matrix, fit_polynomial
+from src.uncertainty import BLOCK_LENGTH, QUANTILES, prepare_bootstrap, resample_coefficients
+
+THRESHOLDS = (1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0)
+N_RESAMPLES = 1000
+
+EXCEEDANCE_COLUMNS = [
+    'country', 'iso3', 'threshold', 'crossing_year', 'boot_lower', 'boot_median', 'boot_upper',
+    'p_by_horizon', 'status',
+]
+
+
+def crossing_times(beta, thresholds):
+    """Upward crossing ``t`` of ``β₀ + β₁t + β₂t² = h``: array ``beta.shape[:-1] + (thresholds,)``.
+
+    NaN where the trend never rises through ``h``.
+    """
+    b0, b1, b2 = (beta[..., k, None] for k in range(3))
+    c = b0 - np.asarray(thresholds, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sqrt_d = np.sqrt(b1 * b1 - 4 * b2 * c)
+        t = np.where(b1 >= 0, 2 * c / (-b1 - sqrt_d), (-b1 + sqrt_d) / (2 * b2))
+    return np.where(np.isfinite(t), t, np.nan)
+
+
+def crossing_status(crossing_year, last_year, horizon):
+    """'crossed', 'projected' (by ``horizon``), 'later' or 'never' for each crossing year."""
+    status = np.full(crossing_year.shape, 'never', dtype=object)
+    status[crossing_year > horizon] = 'later'
+    status[crossing_year <= horizon] = 'projected'
+    status[crossing_year <= last_year] = 'crossed'
+    return status
+
+
+def compute_exceedance(df, thresholds=THRESHOLDS, horizon=HORIZON, n_resamples=N_RESAMPLES,
+                       method='residual', block_length=BLOCK_LENGTH, quantiles=QUANTILES,
+                       seed=42, chunk_size=None, min_years=MIN_YEARS):
+    """Crossing year of every threshold for every country, with bootstrap bands.
+
+    Parameters
+    ----------
+    df : long table with ``country``, ``iso3``, ``year`` and ``temperature_change``.
+    thresholds : °C levels.
+    horizon : ``status`` / ``p_by_horizon`` are read against this year.
+    n_resamples, method, block_length : bootstrap of ``src.uncertainty``.
+    quantiles : (lower, median, upper) levels of the band.
+
+    Returns a DataFrame with ``EXCEEDANCE_COLUMNS`` ordered by country (first
+    appearance) and threshold. ``crossing_year`` is fractional (the trend
+    reaches ``h`` during that year); NaN crossing years and band edges mean
+    the trend never gets there.
+    """
+    countries, iso3, years, values = country_year_matrix(df)
+    keep = (~np.isnan(values)).sum(axis=1) >= min_years
+    countries, iso3, values = countries[keep], iso3[keep], values[keep]
+    if len(countries) == 0:
+        return pd.DataFrame(columns=EXCEEDANCE_COLUMNS)
+
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    center = years.mean()
+
+    fit = fit_polynomial(years, values, 2, center)
+    crossing = center + YEAR_SCALE * crossing_times(fit['beta'], thresholds)   # (countries, thresholds)
+
+    # Bootstrap: crossing years of every resampled trend, chunk by chunk
+    state = prepare_bootstrap(years, values, 2, np.arange(years.max() + 1, horizon + 1), center)
+    chunk_size = chunk_size or max(1, 2_000_000 // (len(countries) * state['residuals'].shape[1]))
+    sizes = [min(chunk_size, n_resamples - start) for start in range(0, n_resamples, chunk_size)]
+    draws = np.concatenate([
+        crossing_times(
+            resample_coefficients(state, np.random.default_rng(child), size, method, block_length),
+            thresholds,
+        )
+        for child, size in zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes)
+    ])                                                                  # (draws, countries, thresholds)
+    draws = np.where(np.isnan(draws), np.inf, center + YEAR_SCALE * draws)
+    bands = np.quantile(draws, quantiles, axis=0, method='inverted_cdf')
+    lower, median, upper = np.where(np.isfinite(bands), bands, np.nan)
+    p_by_horizon = (draws <= horizon).mean(axis=0)
+
+    n_thresholds = len(thresholds)
+    return pd.DataFrame({
+        'country': np.repeat(countries, n_thresholds),
+        'iso3': np.repeat(iso3, n_thresholds),
+        'threshold': np.tile(thresholds, len(countries)),
+        'crossing_year': crossing.ravel(),
+        'boot_lower': lower.ravel(),
+        'boot_median': median.ravel(),
+        'boot_upper': upper.ravel(),
+        'p_by_horizon': p_by_horizon.ravel(),
+        'status': crossing_status(crossing, years.max(), horizon).ravel(),
+    })[EXCEEDANCE_COLUMNS]
+
+
+def exceedance_lookup(table):
+    """Index the table by ``(country, threshold)`` (sorted, for fast ``.loc``)."""
+    table = table.assign(country=table['country'].astype(str), threshold=table['threshold'].astype(np.float64))
+    return table.set_index(['country', 'threshold']).sort_index()
+
+
+def load_exceedance_lookup():
+    """Indexed ``country_exceedance`` artifact, built once per file version (None if missing)."""
+    source = artifact_source('country_exceedance')
+    if source is None:
+        return None
+    return load_cached(
+        source,
+        lambda p: exceedance_lookup(read_artifact('country_exceedance')),
+        variant='lookup',
+    )
@@ -0,0 +1,239 @@
+"""
+Per-country feature engineering for the clustering phase.
+
+Vectorised replacement for the ``for country in df['country'].unique()`` loop of
+``notebooks/07_clustering_phase5.ipynb``. Instead of one boolean scan of the
+whole table and several ``stats.linregress`` calls per country, the long table
+is sorted once by (country, year) and each country becomes a slice
+``[offset, offset + length)`` of the sorted arrays. Countries with the same
+number of years are stacked into a dense ``(countries, years)`` block and every
+statistic is computed for the whole block at once:
+
+- mean / std / median / max / min along the rows,
+- early / recent period mean and std, ``period_change``.
+
+The trend features (``warming_rate``, ``trend_r2`` and the half-split
+``acceleration``) come from the per-country OLS sums of
+``src.trend_state.TrendState``, which delta loads keep up to date; pass a
+saved state to skip rebuilding it.
+
+Python-level work is proportional to the number of distinct series lengths
+(at most the number of years), not to the number of countries, so tens of
+thousands of regions or grid cells take seconds.
+
+The other statistics reproduce the notebook's arithmetic (summation order
+included) and match the loop value for value. The trend features do not: the
+running sums replace ``stats.linregress``, so ``clustering_results.csv`` is no
+longer byte-identical to the loop's output. ``warming_rate`` and ``trend_r2``
+agree to ~1e-14 relative, ``acceleration`` (a difference of two slopes) to
+~1e-11 - the price of updating them incrementally.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.trend_state import TrendState
+
+EARLY_PERIOD = (1961, 1980)   # First 20 years
+RECENT_PERIOD = (2010, 2022)  # Last ~13 years
+MIN_YEARS = 30                # Countries need at least 30 years of data
+
+FEATURE_COLUMNS = [
+    'country', 'iso3', 'mean_temp', 'std_temp', 'median_temp', 'max_temp',
+    'min_temp', 'warming_rate', 'trend_r2', 'early_mean', 'early_std',
+    'recent_mean', 'recent_std', 'period_change', 'acceleration', 'years_data',
+]
+
+
+# ============================================
+# Group layout helpers
+# ============================================
+
+def sort_by_group(df, group_col='country', year_col='year'):
+    """Return ``(codes, uniques, order)`` for a (group, year) sort of ``df``.
+
+    ``uniques`` keeps the order of first appearance (like ``Series.unique()``)
+    and ``order`` is a stable permutation that sorts the rows by group, then year.
+    """
+    codes, uniques = pd.factorize(df[group_col], sort=False)
+    order = np.lexsort((df[year_col].to_numpy(), codes))
+    return codes[order], uniques, order
+
+
+def group_offsets(sorted_codes, n_groups):
+    """Return ``(starts, counts)`` of each group in an array sorted by group code."""
+    counts = np.bincount(sorted_codes, minlength=n_groups)
+    starts = np.zeros(n_groups, dtype=np.int64)
+    np.cumsum(counts[:-1], out=starts[1:])
+    return starts, counts
+
+
+def _segment_blocks(starts, lengths):
+    """Yield ``(rows, index_matrix)`` for segments grouped by equal length.
+
+    ``index_matrix[i]`` holds the positions ``starts[rows[i]] + arange(length)``,
+    so ``values[index_matrix]`` is a dense block with one segment per row.
+    """
+    for length in np.unique(lengths):
+        rows = np.flatnonzero(lengths == length)
+        yield rows, starts[rows, None] + np.arange(length)
+
+
+# ============================================
+# Row-wise statistics on dense blocks
+# ============================================
+
+def _pandas_std(values):
+    """Row-wise sample std (ddof=1) with pandas' ``Series.std()`` arithmetic."""
+    count = values.shape[1]
+    if count <= 1:
+        return np.full(values.shape[0], np.nan)
+    if _pandas_uses_bottleneck():
+        # bottleneck.nanstd accumulates sequentially
+        avg = np.cumsum(values, axis=1)[:, -1] / count
+        sqr = (values - avg[:, None]) ** 2
+        return np.sqrt(np.cumsum(sqr, axis=1)[:, -1] / (count - 1))
+    avg = values.sum(axis=1, dtype=np.float64) / count
+    sqr = (avg[:, None] - values) ** 2
+    return np.sqrt(sqr.sum(axis=1, dtype=np.float64) / (count - 1))
+
+
+def _pandas_uses_bottleneck():
+    try:
+        import bottleneck  # noqa: F401
+    except ImportError:
+        return False
+    return bool(pd.get_option('compute.use_bottleneck'))
+
+
+def _period_mean_std(values, _years):
+    # pandas Series.mean(): float64 sum divided by the count
+    return values.sum(axis=1, dtype=np.float64) / values.shape[1], _pandas_std(values)
+
+
+def _segment_stats(values, years, rows_lo, rows_hi, func, n_out):
+    """Apply ``func`` to the slice ``[lo, hi)`` of every row of a block.
+
+    ``func`` receives dense ``(rows, length)`` blocks of values and years and
+    returns a tuple of ``n_out`` arrays. Rows with empty slices get NaN.
+    """
+    out = [np.full(values.shape[0], np.nan) for _ in range(n_out)]
+    lengths = rows_hi - rows_lo
+    nonempty = lengths > 0
+    for rows, idx in _segment_blocks(rows_lo[nonempty], lengths[nonempty]):
+        rows = np.flatnonzero(nonempty)[rows]
+        results = func(values[rows[:, None], idx], years[rows[:, None], idx])
+        for target, result in zip(out, results):
+            target[rows] = result
+    return out
+
+
+# ============================================
+# Feature engine
+# ============================================
+
+def compute_country_features(df, early_period=EARLY_PERIOD, recent_period=RECENT_PERIOD,
+                             min_years=MIN_YEARS, trend_state=None):
+    """Compute the clustering features of every country in a long table.
+
+    Parameters
+    ----------
+    df : DataFrame with ``country``, ``iso3``, ``year`` and ``temperature_change``
+        (one row per country-year, as returned by the ``climate_indicators`` query).
+    early_period, recent_period : inclusive ``(start, end)`` year ranges.
+    min_years : countries with fewer rows are skipped.
+    trend_state : ``TrendState`` of ``df`` (e.g. the saved one); built from
+        ``df`` when omitted.
+
+    Returns a DataFrame with ``FEATURE_COLUMNS``, one row per country in order
+    of first appearance in ``df``.
+    """
+    codes, uniques, order = sort_by_group(df)
+    starts, counts = group_offsets(codes, len(uniques))
+
+    temps = df['temperature_change'].to_numpy(dtype=np.float64)[order]
+    years = df['year'].to_numpy()[order]
+    iso3 = df['iso3'].to_numpy()[order]
+
+    kept = np.flatnonzero(counts >= min_years)
+    n_kept = len(kept)
+    columns = {name: np.zeros(n_kept) for name in FEATURE_COLUMNS[2:-1]}
+
+    for block_rows, idx in _segment_blocks(starts[kept], counts[kept]):
+        T = temps[idx]
+        Y = years[idx]
+
+        # Feature 1-5: central tendency, spread and extremes
+        mean_temp = T.mean(axis=1)
+        std_temp = T.std(axis=1)
+        columns['mean_temp'][block_rows] = mean_temp
+        columns['std_temp'][block_rows] = std_temp
+        columns['median_temp'][block_rows] = np.median(T, axis=1)
+        columns['max_temp'][block_rows] = T.max(axis=1)
+        columns['min_temp'][block_rows] = T.min(axis=1)
+
+        # Feature 7-10: early and recent periods (contiguous slices of sorted years)
+        lo = (Y < early_period[0]).sum(axis=1)
+        hi = (Y <= early_period[1]).sum(axis=1)
+        early_mean, early_std = _segment_stats(T, Y, lo, hi, _period_mean_std, 2)
+        early_empty = hi == lo
+        early_mean[early_empty] = 0
+        early_std[early_empty] = 0
+
+        lo = (Y < recent_period[0]).sum(axis=1)
+        hi = (Y <= recent_period[1]).sum(axis=1)
+        recent_mean, recent_std = _segment_stats(T, Y, lo, hi, _period_mean_std, 2)
+        recent_empty = hi == lo
+        recent_mean[recent_empty] = mean_temp[recent_empty]
+        recent_std[recent_empty] = std_temp[recent_empty]
+
+        columns['early_mean'][block_rows] = early_mean
+        columns['early_std'][block_rows] = early_std
+        columns['recent_mean'][block_rows] = recent_mean
+        columns['recent_std'][block_rows] = recent_std
+
+        # Feature 11: change from early to recent period
+        columns['period_change'][block_rows] = recent_mean - early_mean
+
+    # Feature 6 and 12: linear trend (warming rate, r²) and acceleration
+    # (second-half trend minus first-half trend) from the OLS sums
+    if trend_state is None:
+        trend_state = TrendState.from_frame(df)
+    trend = trend_state.trend_features().set_index('country')
+    trend = trend.reindex(pd.Index(uniques[kept], dtype=object))
+    for name in ('warming_rate', 'trend_r2', 'acceleration'):
+        columns[name] = trend[name].to_numpy(dtype=np.float64)
+
+    features = pd.DataFrame({
+        'country': uniques[kept],
+        'iso3': iso3[starts[kept]],
+        **columns,
+        'years_data': counts[kept],
+    })
+    return features[FEATURE_COLUMNS]
+
+
+def refresh_country_features(features, df, countries, **kwargs):
+    """Recompute the features of ``countries`` only and merge them into ``features``.
+
+    Used after a delta load (``src.ingest``): the rows of the other countries
+    are kept as they are, refreshed countries replace their old row in place
+    and countries that are new to ``features`` are appended. ``countries=None``
+    recomputes everything. Extra keyword arguments go to
+    ``compute_country_features``.
+    """
+    if countries is None:
+        return compute_country_features(df, **kwargs)
+
+    countries = set(countries)
+    fresh = compute_country_features(df[df['country'].isin(countries)], **kwargs)
+
+    kept = features[~features['country'].isin(countries)]
+    order = {country: i for i, country in enumerate(features['country'])}
+    fresh_old = fresh[fresh['country'].isin(order)]
+    fresh_new = fresh[~fresh['country'].isin(order)]
+
+    merged = pd.concat([kept, fresh_old])
+    merged = merged.iloc[merged['country'].map(order).argsort(kind='stable')]
+    return pd.concat([merged, fresh_new], ignore_index=True)[FEATURE_COLUMNS]
+
@@ -0,0 +1,533 @@
+"""
+Build system for the static figures in ``reports/figures/``.
+
+The PNGs shown by the dashboard used to exist only because someone re-ran a
+notebook; the app served whatever file was on disk, even after the data it
+was drawn from had changed. Figures whose inputs are artifacts of
+``src.artifacts`` are now registered here as plain functions of those
+artifacts:
+
+    @register("eda_decade_analysis", inputs=["climate_long"])
+    def decade_analysis(climate_long):
+        ...
+        return fig
+
+Each figure has a key: a SHA-256 over the content of its input files and the
+source code of its drawing function (plus the shared style).
+``reports/figures/manifest.json`` records the key every PNG was rendered
+with, so
+
+- ``stale_figures()`` lists the figures whose data or code changed since their
+  PNG was written (or whose PNG is missing),
+- ``build_figures()`` re-renders only those, in parallel on a process pool
+  with the non-interactive Agg backend,
+- ``figure_path()`` (used by ``app.py``) re-renders one stale figure before
+  returning its path, but only if the manifest has an entry for it (its PNG
+  was written by this module). PNGs without an entry (as left by the
+  notebooks) and figures whose inputs are not available (e.g.
+  ``climate_long.parquet`` not written yet) are served untouched; rebuild them
+  with the command line below.
+
+Figures that depend on notebook state rather than artifacts (fitted regression
+and logistic models, the k sweep) are still written by their notebooks.
+
+Rebuild from the command line:
+
+    python -m src.figures            # stale figures only
+    python -m src.figures --force    # everything
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from src.aggregates import CASE_STUDIES
+from src.artifacts import artifact_source, read_artifact
+from src.data_loader import REPORTS_DIR, file_signature, load_cached
+
+FIGURES_DIR = REPORTS_DIR / "figures"
+MANIFEST_NAME = "manifest.json"
+DPI = 150
+
+# Same palette and rcParams as the notebooks (sns.set_style("whitegrid"))
+COLORS = {
+    'primary': '#e74c3c',
+    'secondary': '#3498db',
+    'success': '#2ecc71',
+    'warning': '#f39c12',
+    'danger': '#c0392b'
+}
+CLUSTER_COLORS = ['#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6']
+RC_PARAMS = {
+    'figure.figsize': (12, 6),
+    'font.size': 10,
+    'axes.titlesize': 12,
+    'axes.labelsize': 11,
+}
+
+FigureSpec = namedtuple('FigureSpec', ['name', 'inputs', 'draw'])
+
+FIGURES = {}
+
+
+def register(name, inputs):
+    """Register ``draw(**artifacts) -> Figure`` as the recipe of ``<name>.png``."""
+    def decorator(draw):
+        FIGURES[name] = FigureSpec(name, tuple(inputs), draw)
+        return draw
+    return decorator
+
+
+def _new_figure(nrows=1, ncols=1, figsize=None):
+    # Figure objects instead of pyplot: no global figure registry, nothing to close
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots(nrows, ncols)
+
+
+# ============================================
+# EDA figures (notebooks/04_eda_phase3.ipynb)
+# ============================================
+
+@register("eda_univariate_temperature", inputs=["climate_long"])
+def univariate_temperature(climate_long):
+    from scipy import stats
+
+    temps = climate_long['temperature_change'].astype('float64').dropna()
+    fig, axes = _new_figure(2, 2, figsize=(14, 10))
+
+    axes[0, 0].hist(temps, bins=50, color=COLORS['primary'], alpha=0.7, edgecolor='black')
+    axes[0, 0].axvline(temps.mean(), color='red', linestyle='--', linewidth=2,
+                       label=f'Mean: {temps.mean():.3f}°C')
+    axes[0, 0].axvline(temps.median(), color='green', linestyle='--', linewidth=2,
+                       label=f'Median: {temps.median():.3f}°C')
+    axes[0, 0].set_title('Distribution of Temperature Change', fontweight='bold')
+    axes[0, 0].set_xlabel('Temperature Change (°C)')
+    axes[0, 0].set_ylabel('Frequency')
+    axes[0, 0].legend()
+    axes[0, 0].grid(True, alpha=0.3)
+
+    bp = axes[0, 1].boxplot(temps, vert=True, patch_artist=True, widths=0.5, showfliers=True)
+    bp['boxes'][0].set_facecolor(COLORS['secondary'])
+    bp['boxes'][0].set_alpha(0.7)
+    axes[0, 1].set_title('Box Plot of Temperature Change', fontweight='bold')
+    axes[0, 1].set_ylabel('Temperature Change (°C)')
+    axes[0, 1].grid(True, alpha=0.3, axis='y')
+
+    parts = axes[1, 0].violinplot([temps], positions=[1], showmeans=True, showmedians=True)
+    for pc in parts['bodies']:
+        pc.set_facecolor(COLORS['success'])
+        pc.set_alpha(0.7)
+    axes[1, 0].set_title('Violin Plot of Temperature Change', fontweight='bold')
+    axes[1, 0].set_ylabel('Temperature Change (°C)')
+    axes[1, 0].set_xticks([1])
+    axes[1, 0].set_xticklabels(['Temperature'])
+    axes[1, 0].grid(True, alpha=0.3, axis='y')
+
+    stats.probplot(temps, dist="norm", plot=axes[1, 1])
+    axes[1, 1].set_title('Q-Q Plot (Normality Check)', fontweight='bold')
+    axes[1, 1].grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    return fig
+
+
+@register("eda_temporal_trends", inputs=["climate_long"])
+def temporal_trends(climate_long):
+    yearly = (climate_long.groupby('year')['temperature_change']
+              .agg(['mean', 'median', 'std', 'min', 'max']).reset_index())
+    fig, axes = _new_figure(3, 1, figsize=(14, 12))
+
+    axes[0].plot(yearly['year'], yearly['mean'], marker='o', linewidth=2, markersize=4,
+                 color=COLORS['primary'], label='Mean')
+    axes[0].plot(yearly['year'], yearly['median'], marker='s', linewidth=2, markersize=3,
+                 color=COLORS['secondary'], alpha=0.7, label='Median')
+    axes[0].fill_between(yearly['year'], yearly['mean'], alpha=0.3, color=COLORS['primary'])
+    axes[0].axhline(y=0, color='gray', linestyle='--', alpha=0.5)
+    axes[0].set_title(f"Average Temperature Change Over Time "
+                      f"({yearly['year'].min()}-{yearly['year'].max()})",
+                      fontweight='bold', fontsize=13)
+    axes[0].set_xlabel('Year')
+    axes[0].set_ylabel('Temperature Change (°C)')
+    axes[0].legend()
+    axes[0].grid(True, alpha=0.3)
+
+    axes[1].fill_between(yearly['year'], yearly['min'], yearly['max'], alpha=0.4,
+                         color=COLORS['warning'], label='Min-Max Range')
+    axes[1].plot(yearly['year'], yearly['mean'], color=COLORS['danger'], linewidth=2, label='Mean')
+    axes[1].axhline(y=0, color='gray', linestyle='--', alpha=0.5)
+    axes[1].set_title('Temperature Change Range by Year', fontweight='bold', fontsize=13)
+    axes[1].set_xlabel('Year')
+    axes[1].set_ylabel('Temperature Change (°C)')
+    axes[1].legend()
+    axes[1].grid(True, alpha=0.3)
+
+    axes[2].bar(yearly['year'], yearly['std'], color=COLORS['secondary'], alpha=0.7, width=0.8)
+    axes[2].set_title('Temperature Variability (Standard Deviation) by Year',
+                      fontweight='bold', fontsize=13)
+    axes[2].set_xlabel('Year')
+    axes[2].set_ylabel('Standard Deviation (°C)')
+    axes[2].grid(True, alpha=0.3, axis='y')
+
+    fig.tight_layout()
+    return fig
+
+
+@register("eda_decade_analysis", inputs=["climate_long"])
+def decade_analysis(climate_long):
+    from matplotlib import colormaps
+
+    decade = (climate_long['year'].astype('int32') // 10) * 10
+    temps = climate_long['temperature_change'].astype('float64')
+    decade_means = temps.groupby(decade).mean()
+    fig, axes = _new_figure(1, 2, figsize=(14, 6))
+
+    colors_gradient = colormaps['Reds'](decade_means.values / decade_means.max())
+    bars = axes[0].bar(decade_means.index, decade_means.values, width=8, alpha=0.7,
+                       edgecolor='black')
+    for bar, color in zip(bars, colors_gradient):
+        bar.set_color(color)
+    axes[0].axhline(y=0, color='gray', linestyle='--', alpha=0.5)
+    axes[0].set_title('Average Temperature Change by Decade', fontweight='bold', fontsize=13)
+    axes[0].set_xlabel('Decade')
+    axes[0].set_ylabel('Average Temperature Change (°C)')
+    axes[0].grid(True, alpha=0.3, axis='y')
+    for dec, temp in decade_means.items():
+        axes[0].text(dec, temp + 0.05, f'{temp:.2f}°C', ha='center', va='bottom',
+                     fontsize=9, fontweight='bold')
+
+    decade_data = [group.dropna().values for _, group in temps.groupby(decade)]
+    bp = axes[1].boxplot(decade_data, patch_artist=True, showfliers=False)
+    axes[1].set_xticklabels(decade_means.index.tolist())
+    for patch, color in zip(bp['boxes'], colors_gradient):
+        patch.set_facecolor(color)
+        patch.set_alpha(0.7)
+    axes[1].axhline(y=0, color='gray', linestyle='--', alpha=0.5)
+    axes[1].set_title('Temperature Distribution by Decade', fontweight='bold', fontsize=13)
+    axes[1].set_xlabel('Decade')
+    axes[1].set_ylabel('Temperature Change (°C)')
+    axes[1].grid(True, alpha=0.3, axis='y')
+    axes[1].tick_params(axis='x', rotation=45)
+
+    fig.tight_layout()
+    return fig
+
+
+@register("eda_top_countries", inputs=["climate_long"])
+def top_countries(climate_long, n=15, min_years=40):
+    country_stats = (climate_long.groupby('country', observed=True)['temperature_change']
+                     .agg(['mean', 'count']))
+    country_stats = country_stats[country_stats['count'] >= min_years]
+    country_stats = country_stats.sort_values('mean', ascending=False)
+    fig, axes = _new_figure(1, 2, figsize=(16, 8))
+
+    panels = [
+        (country_stats.head(n), COLORS['danger'], 'Highest', 0.02, 'left'),
+        (country_stats.tail(n), COLORS['secondary'], 'Lowest', -0.02, 'right'),
+    ]
+    for ax, (subset, color, label, offset, ha) in zip(axes, panels):
+        temps = subset['mean'].values[::-1]
+        ax.barh(range(len(subset)), temps, alpha=0.7, color=color)
+        ax.set_yticks(range(len(subset)))
+        ax.set_yticklabels(subset.index.values[::-1])
+        ax.set_title(f'Top {n} Countries - {label} Temperature Change',
+                     fontweight='bold', fontsize=13)
+        ax.set_xlabel('Average Temperature Change (°C)')
+        ax.grid(True, alpha=0.3, axis='x')
+        for i, temp in enumerate(temps):
+            ax.text(temp + offset, i, f'{temp:.3f}°C', va='center', ha=ha, fontsize=9)
+
+    fig.tight_layout()
+    return fig
+
+
+@register("eda_case_studies", inputs=["climate_long"])
+def case_studies(climate_long):
+    fig, axes = _new_figure(2, 2, figsize=(14, 10))
+
+    for ax, (category, countries) in zip(axes.flatten(), CASE_STUDIES.items()):
+        for country in countries:
+            country_data = climate_long[climate_long['country'] == country]
+            if len(country_data) > 0:
+                # 5-year centred moving average to smooth the series
+                country_yearly = country_data.groupby('year')['temperature_change'].mean()
+                rolling_mean = country_yearly.rolling(window=5, center=True).mean()
+                ax.plot(rolling_mean.index, rolling_mean.values, marker='o', linewidth=2,
+                        markersize=3, label=country, alpha=0.7)
+        ax.set_title(f'{category} Countries', fontweight='bold', fontsize=11)
+        ax.set_xlabel('Year')
+        ax.set_ylabel('Temperature Change (°C) - 5yr MA')
+        ax.legend(fontsize=8)
+        ax.grid(True, alpha=0.3)
+        ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
+
+    fig.tight_layout()
+    return fig
+
+
+# ============================================
+# Clustering figures (notebooks/07_clustering_phase5.ipynb)
+# ============================================
+
+CLUSTERING_FEATURES = [
+    'mean_temp', 'std_temp', 'warming_rate', 'recent_mean', 'period_change', 'acceleration',
+]
+
+
+@register("clustering_feature_distributions", inputs=["clustering_results_named"])
+def cluster_feature_distributions(clustering_results_named):
+    features_df = clustering_results_named
+    clusters = sorted(features_df['cluster'].unique())
+    viz_features = [
+        ('mean_temp', 'Average Temperature Change (°C)'),
+        ('warming_rate', 'Warming Rate (°C/year)'),
+        ('recent_mean', 'Recent Period Average (°C)'),
+        ('period_change', 'Early to Recent Change (°C)'),
+        ('std_temp', 'Temperature Volatility (°C)'),
+        ('acceleration', 'Warming Acceleration (°C/year²)')
+    ]
+    fig, axes = _new_figure(2, 3, figsize=(16, 10))
+
+    for ax, (feature, label) in zip(axes.flatten(), viz_features):
+        data_by_cluster = [features_df.loc[features_df['cluster'] == c, feature].values
+                           for c in clusters]
+        bp = ax.boxplot(data_by_cluster, patch_artist=True, showfliers=True)
+        ax.set_xticklabels([f'C{c}' for c in clusters])
+        for patch, color in zip(bp['boxes'], CLUSTER_COLORS):
+            patch.set_facecolor(color)
+            patch.set_alpha(0.7)
+        ax.set_title(label, fontweight='bold', fontsize=11)
+        ax.set_xlabel('Cluster')
+        ax.set_ylabel(label)
+        ax.grid(True, alpha=0.3, axis='y')
+
+    fig.tight_layout()
+    return fig
+
+
+@register("clustering_pca_visualization", inputs=["clustering_results_named"])
+def cluster_pca(clustering_results_named):
+    from sklearn.decomposition import PCA
+    from sklearn.preprocessing import StandardScaler
+
+    features_df = clustering_results_named
+    X = features_df[CLUSTERING_FEATURES].to_numpy(dtype=np.float64)
+    X = np.where(np.isnan(X), np.nanmedian(X, axis=0), X)
+    X_scaled = StandardScaler().fit_transform(X)
+    clusters = features_df['cluster'].to_numpy()
+    cluster_ids = np.unique(clusters)
+
+    pca = PCA(n_components=2, random_state=42)
+    X_pca = pca.fit_transform(X_scaled)
+    explained_var = pca.explained_variance_ratio_
+    # K-means centres are the cluster means in scaled space
+    centers = np.vstack([X_scaled[clusters == c].mean(axis=0) for c in cluster_ids])
+    centers_pca = pca.transform(centers)
+
+    fig, ax = _new_figure(figsize=(14, 10))
+    for cluster_id, color in zip(cluster_ids, CLUSTER_COLORS):
+        mask = clusters == cluster_id
+        ax.scatter(X_pca[mask, 0], X_pca[mask, 1], c=color,
+                   label=f'Cluster {cluster_id} (n={mask.sum()})',
+                   alpha=0.6, s=100, edgecolors='black', linewidth=0.5)
+    ax.scatter(centers_pca[:, 0], centers_pca[:, 1], c='red', marker='X', s=500,
+               edgecolors='black', linewidth=2, label='Cluster Centers', zorder=5)
+
+    ax.set_title('Countries Grouped by Temperature Warming Patterns (PCA Projection)',
+                 fontweight='bold', fontsize=14)
+    ax.set_xlabel(f'First Principal Component ({explained_var[0]*100:.1f}% variance)', fontsize=12)
+    ax.set_ylabel(f'Second Principal Component ({explained_var[1]*100:.1f}% variance)', fontsize=12)
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    return fig
+
+
+# ============================================
+# Keys and manifest
+# ============================================
+
+_digests = {}  # file signature -> content digest
+
+
+def _file_digest(path):
+    signature = file_signature(path)
+    digest = _digests.get(signature)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        digest = _digests[signature] = h.hexdigest()
+    return digest
+
+
+_code_digests = {}
+
+
+def _code_digest(name):
+    # Source of the drawing function plus everything it shares with the others
+    if name not in _code_digests:
+        h = hashlib.sha256()
+        h.update(inspect.getsource(FIGURES[name].draw).encode())
+        h.update(inspect.getsource(_new_figure).encode())
+        h.update(repr((COLORS, CLUSTER_COLORS, RC_PARAMS, DPI)).encode())
+        _code_digests[name] = h.hexdigest()
+    return _code_digests[name]
+
+
+def figure_key(name, reports_dir=REPORTS_DIR):
+    """Hash of the inputs + code of figure ``name`` (None if an input is missing)."""
+    h = hashlib.sha256(_code_digest(name).encode())
+    for input_name in FIGURES[name].inputs:
+        source = artifact_source(input_name, reports_dir)
+        if source is None:
+            return None
+        h.update(f'{input_name}:{_file_digest(source)}'.encode())
+    return h.hexdigest()
+
+
+def _figures_dir(reports_dir):
+    return Path(reports_dir) / "figures"
+
+
+def read_manifest(reports_dir=REPORTS_DIR):
+    """Return ``{figure: {"key", "rendered_at"}}`` from ``figures/manifest.json``."""
+    path = _figures_dir(reports_dir) / MANIFEST_NAME
+    manifest = load_cached(path, lambda p: json.loads(Path(p).read_text()))
+    return dict(manifest or {})
+
+
+_manifest_lock = threading.Lock()
+
+
+def _update_manifest(entries, reports_dir):
+    path = _figures_dir(reports_dir) / MANIFEST_NAME
+    with _manifest_lock:
+        manifest = read_manifest(reports_dir)
+        manifest.update(entries)
+        tmp = path.with_suffix('.json.tmp')
+        tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        os.replace(tmp, path)
+
+
+def stale_figures(names=None, reports_dir=REPORTS_DIR):
+    """Registered figures whose PNG is missing or was drawn from other inputs/code.
+
+    Figures with a missing input artifact cannot be rebuilt and are skipped.
+    """
+    names = list(FIGURES) if names is None else list(names)
+    manifest = read_manifest(reports_dir)
+    stale = []
+    for name in names:
+        key = figure_key(name, reports_dir)
+        if key is None:
+            continue
+        png = _figures_dir(reports_dir) / f"{name}.png"
+        if manifest.get(name, {}).get('key') != key or not png.exists():
+            stale.append(name)
+    return stale
+
+
+# ============================================
+# Rendering
+# ============================================
+
+def _init_worker():
+    import matplotlib
+
+    matplotlib.use('Agg')
+
+
+def _render(task):
+    """Draw figure ``name`` and atomically replace its PNG. Runs in a worker."""
+    name, key, reports_dir = task
+    import matplotlib
+    import seaborn as sns
+
+    spec = FIGURES[name]
+    frames = {input_name: read_artifact(input_name, reports_dir=reports_dir)
+              for input_name in spec.inputs}
+    with matplotlib.rc_context({**sns.axes_style("whitegrid"), **RC_PARAMS}):
+        fig = spec.draw(**frames)
+        png = _figures_dir(reports_dir) / f"{name}.png"
+        tmp = png.with_name(f".{png.name}.tmp")
+        fig.savefig(tmp, format='png', dpi=DPI, bbox_inches='tight')
+    os.replace(tmp, png)
+    return name, key
+
+
+def build_figures(names=None, force=False, n_jobs=None, reports_dir=REPORTS_DIR):
+    """Re-render the stale figures (all of ``names`` with ``force``); return their names.
+
+    Figures render in parallel on a process pool (``n_jobs=1`` stays
+    in-process). The manifest is updated once every render has finished.
+    """
+    if force:
+        names = list(FIGURES) if names is None else list(names)
+    else:
+        names = stale_figures(names, reports_dir)
+    tasks = [(name, key, reports_dir) for name in names
+             if (key := figure_key(name, reports_dir)) is not None]
+    if not tasks:
+        return []
+
+    _figures_dir(reports_dir).mkdir(parents=True, exist_ok=True)
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(tasks))
+    if n_jobs == 1:
+        rendered = [_render(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker) as pool:
+            rendered = list(pool.map(_render, tasks))
+
+    now = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    _update_manifest({name: {'key': key, 'rendered_at': now} for name, key in rendered},
+                     reports_dir)
+    return [name for name, _ in rendered]
+
+
+_figure_locks = {}
+_figure_locks_lock = threading.Lock()
+
+
+def figure_path(name, reports_dir=REPORTS_DIR):
+    """Path of ``<name>.png``, re-rendered first if it was built here and is stale.
+
+    Unregistered figures, figures without a manifest entry (never built by
+    ``build_figures``) and figures whose inputs are missing are served as
+    they are on disk. Returns None when there is no PNG.
+    """
+    png = _figures_dir(reports_dir) / f"{name}.png"
+    if name in FIGURES and name in read_manifest(reports_dir):
+        # One render per figure: concurrent sessions wait for the first one
+        with _figure_locks_lock:
+            lock = _figure_locks.setdefault(name, threading.Lock())
+        with lock:
+            if stale_figures([name], reports_dir):
+                build_figures([name], n_jobs=1, reports_dir=reports_dir)
+    return png if png.exists() else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-render the stale figures of reports/figures/.")
+    parser.add_argument('names', nargs='*', help="figures to consider (default: all registered)")
+    parser.add_argument('--force', action='store_true', help="render even if up to date")
+    parser.add_argument('--jobs', type=int, default=None)
+    args = parser.parse_args()
+
+    rendered = build_figures(args.names or None, force=args.force, n_jobs=args.jobs)
+    for name in FIGURES:
+        status = "rendered" if name in rendered else (
+            "up to date" if figure_key(name) is not None else "inputs missing")
+        print(f"{'✅' if status != 'inputs missing' else '⚠️ '} {name}: {status}")
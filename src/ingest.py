@@ -0,0 +1,189 @@
+"""
+Incremental (delta) ingestion of the long ``climate_indicators`` table.
+
+When FAO publishes a new year, ``climate_change_indicators.csv`` gains one
+``F<year>`` column and a few earlier values may be revised. Instead of
+re-loading the whole table, ``incremental_load``:
+
+1. hashes every incoming row (``src.db_loader.content_hash``),
+2. reads the stored ``(iso3, year, row_hash)`` keys (a primary-key scan),
+3. upserts only the rows that are new or whose hash changed, with
+   ``INSERT ... ON CONFLICT (iso3, year) DO UPDATE``, then refreshes the
+   rollup tables (``src.rollups``),
+4. records a watermark (latest year, row count, affected countries) under
+   ``"ingestion"`` in ``reports/dataset_metadata.json``,
+5. updates the saved OLS trend state (``src.trend_state``) with the same
+   rows, so ``warming_rate`` / ``trend_r2`` / ``acceleration`` need no full
+   recompute.
+
+Downstream steps read ``affected_countries()`` and only recompute those
+countries (see ``src.features.refresh_country_features``).
+
+Rows that disappear from the source file are kept: FAO revises values but
+does not withdraw country-years. Run ``load_climate_indicators`` for a full
+rebuild.
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pandas as pd
+from sqlalchemy import inspect, text
+
+from src.data_loader import REPORTS_DIR
+from src.db_loader import (
+    COLUMNS, PRIMARY_KEY, TABLE, create_table_sql, load_climate_indicators,
+    prepare_frame, write_rows,
+)
+from src.rollups import refresh_rollups
+from src.trend_state import TREND_STATE_PATH, TrendState
+
+METADATA_PATH = REPORTS_DIR / 'dataset_metadata.json'
+
+
+# ============================================
+# Watermark (reports/dataset_metadata.json)
+# ============================================
+
+def read_watermark(path=METADATA_PATH):
+    """Return the ``"ingestion"`` entry of the metadata file, or None."""
+    try:
+        with open(path) as f:
+            return json.load(f).get('ingestion')
+    except FileNotFoundError:
+        return None
+
+
+def write_watermark(watermark, path=METADATA_PATH):
+    """Store ``watermark`` under ``"ingestion"``, keeping the other metadata keys."""
+    try:
+        with open(path) as f:
+            metadata = json.load(f)
+    except FileNotFoundError:
+        metadata = {}
+    metadata['ingestion'] = watermark
+    with open(path, 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+
+def affected_countries(path=METADATA_PATH):
+    """Countries touched by the last load (None after a full load or if unknown)."""
+    watermark = read_watermark(path)
+    if watermark is None or watermark['mode'] == 'full':
+        return None
+    return watermark['affected_countries']
+
+
+# ============================================
+# Delta detection and upsert
+# ============================================
+
+def diff_rows(df, stored):
+    """Split prepared rows into new and changed ones.
+
+    ``stored`` holds the ``iso3``, ``year`` and ``row_hash`` already in the
+    table. Returns ``(new_rows, changed_rows)``.
+    """
+    keys = list(PRIMARY_KEY)
+    merged = df.merge(
+        stored[keys + ['row_hash']].rename(columns={'row_hash': 'stored_hash'}),
+        on=keys, how='left',
+    )
+    is_new = merged['stored_hash'].isna()
+    is_changed = ~is_new & (merged['stored_hash'] != merged['row_hash'])
+    columns = list(df.columns)
+    return merged.loc[is_new, columns], merged.loc[is_changed, columns]
+
+
+def _upsert_sql(table, source):
+    names = [name for name, _ in COLUMNS]
+    updates = ', '.join(f'{name} = EXCLUDED.{name}' for name in names if name not in PRIMARY_KEY)
+    # "WHERE true" lets SQLite parse ON CONFLICT after INSERT ... SELECT
+    return (
+        f'INSERT INTO {table} ({", ".join(names)}) '
+        f'SELECT {", ".join(names)} FROM {source} WHERE true '
+        f'ON CONFLICT ({", ".join(PRIMARY_KEY)}) DO UPDATE SET {updates}'
+    )
+
+
+def upsert_rows(df, engine, table=TABLE):
+    """Insert or update prepared rows in ``table`` in one transaction."""
+    if df.empty:
+        return 0
+    delta = f'{table}_delta'
+    with engine.begin() as conn:
+        conn.execute(text(f'DROP TABLE IF EXISTS {delta}'))
+        conn.execute(text(create_table_sql(delta)))
+        write_rows(conn, df, delta)
+        conn.execute(text(_upsert_sql(table, delta)))
+        conn.execute(text(f'DROP TABLE {delta}'))
+    if table == TABLE:
+        refresh_rollups(engine, table)
+    return len(df)
+
+
+def _has_row_hash(engine, table):
+    inspector = inspect(engine)
+    if not inspector.has_table(table):
+        return False
+    return 'row_hash' in {col['name'] for col in inspector.get_columns(table)}
+
+
+def update_trend_state(rows, engine, table=TABLE, path=TREND_STATE_PATH):
+    """Apply loaded rows to the saved trend state (built from ``table`` if missing)."""
+    if path.exists():
+        state = TrendState.load(path)
+        state.update(rows)
+    else:
+        with engine.connect() as conn:
+            state = TrendState.from_frame(pd.read_sql(
+                text(f'SELECT country, iso3, year, temperature_change FROM {table}'), conn
+            ))
+    state.save(path)
+    return state
+
+
+def incremental_load(df, engine, table=TABLE, metadata_path=METADATA_PATH,
+                     trend_state_path=TREND_STATE_PATH):
+    """Load only the new or revised rows of ``df`` into ``table``.
+
+    Falls back to a full ``load_climate_indicators`` when the table does not
+    exist yet or predates ``row_hash``. ``trend_state_path=None`` skips the
+    trend state update. Returns the watermark that was written.
+    """
+    prepared = prepare_frame(df)
+
+    if not _has_row_hash(engine, table):
+        load_climate_indicators(df, engine, table=table)
+        new_rows, changed_rows = prepared, prepared.iloc[:0]
+        mode = 'full'
+    else:
+        with engine.connect() as conn:
+            stored = pd.read_sql(text(f'SELECT iso3, year, row_hash FROM {table}'), conn)
+        new_rows, changed_rows = diff_rows(prepared, stored)
+        upsert_rows(pd.concat([new_rows, changed_rows]), engine, table=table)
+        mode = 'delta'
+
+    with engine.connect() as conn:
+        max_year, total = conn.execute(text(f'SELECT MAX(year), COUNT(*) FROM {table}')).one()
+
+    touched = pd.concat([new_rows['country'], changed_rows['country']])
+    watermark = {
+        'table': table,
+        'mode': mode,
+        'max_year': int(max_year) if max_year is not None else None,
+        'rows': int(total),
+        'inserted': len(new_rows),
+        'updated': len(changed_rows),
+        'new_years': sorted(int(y) for y in new_rows['year'].unique()),
+        'affected_countries': sorted(touched.unique().tolist()),
+        'loaded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+    write_watermark(watermark, metadata_path)
+
+    if trend_state_path is not None:
+        if mode == 'full':
+            TrendState.from_frame(prepared).save(trend_state_path)
+        else:
+            update_trend_state(pd.concat([new_rows, changed_rows]), engine, table, trend_state_path)
+    return watermark
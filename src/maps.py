@@ -0,0 +1,243 @@
+"""
+Choropleth maps of the dashboard, built once per data version.
+
+The Country Clustering page rebuilt its world map with ``px.choropleth`` on
+every rerun, including every change of the "Find Your Country" selectbox.
+Here:
+
+- ``cluster_map`` builds the base map (one trace per cluster). Offline it is
+  cached per version of the ``clustering_results_named`` artifact
+  (``load_cluster_map``); the live page caches it in ``src.db`` like a query.
+  Reruns re-use the same figure object,
+- ``highlight_trace`` / ``country_map`` draw only the selected country, so a
+  country search ships one small trace instead of the whole world,
+- geometry is either Plotly's built-in Natural Earth countries, drawn at
+  ``resolution=110`` (coarse, the default) or 50 (detailed), or a countries
+  GeoJSON (``GEOJSON_PATH`` or any path) simplified with Douglas-Peucker
+  (``simplify_geojson``) and rounded to ``COORD_DECIMALS`` before it is
+  embedded in the figure, since custom geometry travels with the figure JSON.
+  The resolution only applies to the built-in shapes; cached maps are keyed
+  by the GeoJSON file version (``geojson_version``), so a replaced file is
+  picked up without restarting.
+
+    fig = load_cluster_map()
+    fig = cluster_map(df, geojson=load_geojson(GEOJSON_PATH))
+    country_map(df, 'ESP')
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+from src.artifacts import artifact_source, read_artifact
+from src.data_loader import PROJECT_ROOT, file_signature, load_cached
+
+GEOJSON_PATH = PROJECT_ROOT / "data" / "countries.geojson"
+GEOJSON_ID = "properties.ISO_A3"   # feature key matched against ``iso3``
+SIMPLIFY_TOLERANCE = 0.05          # degrees (~5 km at the equator)
+COORD_DECIMALS = 3
+RESOLUTIONS = {'simplified': 110, 'detailed': 50}
+
+HOVER_DATA = {
+    "iso3": False,
+    "cluster_name": True,
+    "mean_temp": ":.2f",
+    "warming_rate": ":.4f",
+    "cluster_description": True,
+}
+
+
+# ============================================
+# GeoJSON simplification
+# ============================================
+
+def douglas_peucker(points, tolerance):
+    """Vertices of ``points`` (n, 2) kept by Douglas-Peucker within ``tolerance``.
+
+    The end points are always kept. Works on closed rings (first == last): the
+    farthest vertex from the closing point splits the ring first.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    if n < 3:
+        return points
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j <= i + 1:
+            continue
+        segment = points[j] - points[i]
+        offsets = points[i + 1:j] - points[i]
+        length = np.hypot(*segment)
+        if length == 0:
+            distance = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            distance = np.abs(segment[0] * offsets[:, 1] - segment[1] * offsets[:, 0]) / length
+        k = int(np.argmax(distance))
+        if distance[k] > tolerance:
+            split = i + 1 + k
+            keep[split] = True
+            stack.extend([(i, split), (split, j)])
+    return points[keep]
+
+
+def _simplify_ring(ring, tolerance, decimals):
+    simplified = douglas_peucker(ring, tolerance)
+    if len(simplified) < 4:
+        # A ring needs 4 positions; small islands keep their original outline
+        simplified = np.asarray(ring, dtype=np.float64)
+    return np.round(simplified, decimals).tolist()
+
+
+def simplify_geojson(geojson, tolerance=SIMPLIFY_TOLERANCE, decimals=COORD_DECIMALS):
+    """Copy of a FeatureCollection with every (Multi)Polygon ring simplified.
+
+    Other geometry types are passed through. Returns a new dict; ``geojson``
+    is not modified.
+    """
+    features = []
+    for feature in geojson['features']:
+        geometry = feature.get('geometry') or {}
+        if geometry.get('type') == 'Polygon':
+            coordinates = [_simplify_ring(ring, tolerance, decimals) for ring in geometry['coordinates']]
+        elif geometry.get('type') == 'MultiPolygon':
+            coordinates = [
+                [_simplify_ring(ring, tolerance, decimals) for ring in polygon]
+                for polygon in geometry['coordinates']
+            ]
+        else:
+            features.append(feature)
+            continue
+        features.append({**feature, 'geometry': {**geometry, 'coordinates': coordinates}})
+    return {**geojson, 'features': features}
+
+
+def load_geojson(path=GEOJSON_PATH, tolerance=SIMPLIFY_TOLERANCE):
+    """Parsed (and simplified unless ``tolerance`` is None) GeoJSON, cached per file version.
+
+    Returns None when the file does not exist.
+    """
+    def load(p):
+        with open(p, encoding="utf-8") as f:
+            geojson = json.load(f)
+        return geojson if tolerance is None else simplify_geojson(geojson, tolerance)
+
+    return load_cached(path, load, variant=('geojson', tolerance))
+
+
+def geojson_version(path=GEOJSON_PATH):
+    """File signature of the GeoJSON at ``path``, or None when there is none (built-in shapes)."""
+    if path is None or not Path(path).exists():
+        return None
+    return file_signature(path)
+
+
+# ============================================
+# Figures
+# ============================================
+
+def _geometry(geojson, iso3=None):
+    """Geometry arguments of a trace; with ``iso3``, only the features of those countries."""
+    if geojson is None:
+        return {}
+    if iso3 is not None:
+        path = GEOJSON_ID.split('.')
+        wanted = set(iso3)
+
+        def key(feature):
+            for part in path:
+                feature = (feature or {}).get(part)
+            return feature
+
+        geojson = {**geojson, 'features': [f for f in geojson['features'] if key(f) in wanted]}
+    return {'geojson': geojson, 'featureidkey': GEOJSON_ID}
+
+
+def cluster_map(df, geojson=None, detail='simplified'):
+    """World map of ``df`` coloured by ``cluster_name`` (one trace per cluster).
+
+    ``geojson`` replaces Plotly's built-in country shapes; ``detail`` picks the
+    resolution of the built-in ones (``RESOLUTIONS``).
+    """
+    fig = px.choropleth(
+        data_frame=df,
+        locations="iso3",
+        color="cluster_name",
+        hover_name="country",
+        hover_data={k: v for k, v in HOVER_DATA.items() if k in df.columns},
+        projection="natural earth",
+        title="Countries Colored by Climate Change Cluster",
+        height=600,
+        color_discrete_sequence=px.colors.qualitative.Bold,  # Distinct colors for clusters
+        **_geometry(geojson),
+    )
+    fig.update_layout(
+        margin={"r": 0, "t": 40, "l": 0, "b": 0},
+        legend_title_text='Cluster Group',
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="left",
+            x=0.01,
+            bgcolor="rgba(255, 255, 255, 0.8)"
+        )
+    )
+    if geojson is None:
+        fig.update_geos(resolution=RESOLUTIONS[detail])
+    else:
+        fig.update_geos(showcountries=False, showframe=False)
+    return fig
+
+
+def highlight_trace(df, iso3, geojson=None, color='#f1c40f'):
+    """``go.Choropleth`` of country ``iso3`` alone, filled with ``color`` and outlined."""
+    row = df[df['iso3'] == iso3].iloc[:1]
+    return go.Choropleth(
+        locations=row['iso3'],
+        z=np.zeros(len(row)),
+        colorscale=[[0, color], [1, color]],
+        showscale=False,
+        marker_line_color='black',
+        marker_line_width=1.5,
+        text=row['country'],
+        customdata=row[['cluster_name']].to_numpy(),
+        hovertemplate="%{text}<br>%{customdata[0]}<extra></extra>",
+        name="Selected",
+        **_geometry(geojson, row['iso3'].tolist()),
+    )
+
+
+def country_map(df, iso3, geojson=None, detail='simplified', height=300):
+    """Small map of the selected country only, zoomed to it."""
+    fig = go.Figure(highlight_trace(df, iso3, geojson))
+    fig.update_geos(
+        fitbounds="locations", projection_type="natural earth", showcountries=True,
+        countrycolor="lightgray", **({} if geojson is not None else {'resolution': RESOLUTIONS[detail]}),
+    )
+    fig.update_layout(height=height, margin={"r": 0, "t": 0, "l": 0, "b": 0})
+    return fig
+
+
+def load_cluster_map(detail='simplified', geojson_path=GEOJSON_PATH):
+    """Base cluster map of the ``clustering_results_named`` artifact, built once per file version.
+
+    None if the artifact is missing. The shapes come from ``geojson_path``
+    (simplified, see ``load_geojson``) when that file exists, otherwise from
+    Plotly's built-in countries at ``detail``. A new version of either file
+    builds a new map.
+    """
+    source = artifact_source('clustering_results_named')
+    if source is None:
+        return None
+    version = geojson_version(geojson_path)
+    geojson = load_geojson(geojson_path) if version is not None else None
+    return load_cached(
+        source,
+        lambda p: cluster_map(read_artifact('clustering_results_named'), geojson, detail),
+        variant=('cluster_map', detail if geojson is None else None, version),
+    )
@@ -0,0 +1,244 @@
+"""
+Streaming wide-to-long conversion of FAO indicator files.
+
+``notebooks/02_data_transformation.ipynb`` reads the whole wide CSV and calls
+``pd.melt`` on it, so memory grows with the file (all indicators, sub-national
+rows, ...). ``iter_long_batches`` reads the wide file ``batch_rows`` rows at a
+time and turns each batch into long format with plain array operations:
+
+- the ``F<year>`` columns are parsed once from the header into a fixed
+  column -> year mapping (no per-row regex / ``str.extract``),
+- each batch's year block is flattened row-major, so every row of the long
+  batch is (identifier columns, year, value),
+- text identifiers are categorical (one code per long row), ``year`` is int16
+  and the value float32 (float64 for the database sink).
+
+Batches go straight into a sink, so peak memory is one batch:
+
+    with ParquetSink('reports/climate_long_all.parquet') as sink:
+        melt_to_sink(csv_path, sink)
+
+    with SqlSink(engine) as sink:          # staging table + swap (src.db_loader)
+        melt_to_sink(csv_path, sink)
+
+``ParquetSink`` keeps every row of the file. ``SqlSink`` fills
+``climate_indicators``, whose primary key is ``(iso3, year)``: it keeps only
+the temperature change indicator (``TEMPERATURE_INDICATOR``), and the
+remaining rows must still be one per country and year. A file with
+sub-national rows fails with a duplicate-key error and leaves the live table
+untouched.
+
+From the command line:
+
+    python -m src.melt climate_change_indicators.csv climate_long.parquet
+"""
+
+import argparse
+import re
+
+import numpy as np
+import pandas as pd
+
+from src.db_loader import TABLE, create_staging, drop_staging, prepare_frame, swap_staging, write_rows
+
+YEAR_PATTERN = re.compile(r'^F(\d{4})$')
+BATCH_ROWS = 10_000  # wide rows per batch (x number of years long rows)
+SAMPLE_ROWS = 1_000  # wide rows read up front to fix the identifier dtypes
+
+# ``Indicator`` of the rows loaded into ``climate_indicators`` (FAOSTAT ET domain)
+TEMPERATURE_INDICATOR = (
+    'Temperature change with respect to a baseline climatology, corresponding to the period 1951-1980'
+)
+
+
+def year_column_map(columns):
+    """Return ``{column: year}`` for the ``F<year>`` columns of a header."""
+    mapping = {}
+    for column in columns:
+        match = YEAR_PATTERN.match(column)
+        if match:
+            mapping[column] = int(match.group(1))
+    return mapping
+
+
+def melt_batch(chunk, year_map, value_name='temperature_change', value_dtype=np.float32,
+               dropna=True):
+    """Convert one wide batch to long format (lowercase column names).
+
+    ``year_map`` is the output of ``year_column_map`` for the file header.
+    Rows come out ordered by wide row, then year. Missing values are dropped
+    unless ``dropna`` is False.
+    """
+    year_columns = list(year_map)
+    years = np.fromiter(year_map.values(), dtype=np.int16, count=len(year_map))
+    values = chunk[year_columns].to_numpy(dtype=np.float64)
+    n_rows, n_years = values.shape
+
+    flat = values.ravel()
+    rows = np.repeat(np.arange(n_rows), n_years)
+    year = np.tile(years, n_rows)
+    if dropna:
+        keep = ~np.isnan(flat)
+        flat, rows, year = flat[keep], rows[keep], year[keep]
+
+    data = {}
+    for column in chunk.columns:
+        if column in year_map:
+            continue
+        ids = chunk[column]
+        if pd.api.types.is_numeric_dtype(ids):
+            data[column.lower()] = ids.to_numpy()[rows]
+        else:
+            categories = pd.Categorical(ids)
+            data[column.lower()] = pd.Categorical.from_codes(
+                categories.codes[rows], categories.categories
+            )
+    data['year'] = year
+    data[value_name] = flat.astype(value_dtype)
+    return pd.DataFrame(data)
+
+
+def iter_long_batches(path, batch_rows=BATCH_ROWS, value_name='temperature_change',
+                      value_dtype=np.float32, dropna=True):
+    """Yield long-format DataFrames for ``batch_rows`` wide rows of ``path`` at a time."""
+    # Fix the column types from a sample so every batch parses the same way
+    # (a batch where ISO2 is all empty would otherwise come back as float)
+    sample = pd.read_csv(path, nrows=SAMPLE_ROWS)
+    year_map = year_column_map(sample.columns)
+    if not year_map:
+        raise ValueError(f"No F<year> columns found in {path}")
+
+    dtypes = {column: np.float64 for column in year_map}
+    for column in sample.columns:
+        if column not in year_map and not pd.api.types.is_numeric_dtype(sample[column]):
+            dtypes[column] = str
+    with pd.read_csv(path, chunksize=batch_rows, dtype=dtypes) as reader:
+        for chunk in reader:
+            yield melt_batch(chunk, year_map, value_name, value_dtype, dropna)
+
+
+# ============================================
+# Sinks
+# ============================================
+
+class ParquetSink:
+    """Append long batches to one Parquet file (one row group per batch)."""
+
+    value_dtype = np.float32
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+        self._writer = None
+        self._schema = None
+
+    def write(self, batch):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(batch, preserve_index=False)
+        if self._writer is None:
+            # Category code width depends on the batch; fix int32 indices for the file
+            fields = [
+                pa.field(f.name, pa.dictionary(pa.int32(), f.type.value_type))
+                if pa.types.is_dictionary(f.type) else f
+                for f in table.schema
+            ]
+            self._schema = pa.schema(fields, metadata=table.schema.metadata)
+            self._writer = pq.ParquetWriter(self.path, self._schema)
+        self._writer.write_table(table.cast(self._schema))
+        self.rows += len(batch)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def abort(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class SqlSink:
+    """Stream long batches into ``climate_indicators`` through its staging table.
+
+    Only rows of ``indicator`` are written (all rows with ``indicator=None``);
+    they must be unique per ``(iso3, year)``, the table's primary key, or the
+    load fails with a duplicate-key error. The staging table is swapped in on
+    ``close()``; an error while writing drops it and leaves the live table
+    untouched.
+    """
+
+    # Full precision for the database (values are stored as DOUBLE PRECISION)
+    value_dtype = np.float64
+
+    def __init__(self, engine, table=TABLE, indicator=TEMPERATURE_INDICATOR):
+        self.engine = engine
+        self.table = table
+        self.indicator = indicator
+        self.rows = 0
+        self._staging = None
+
+    def write(self, batch):
+        if self.indicator is not None and 'indicator' in batch.columns:
+            batch = batch[batch['indicator'] == self.indicator]
+            if batch.empty:
+                return
+        if self._staging is None:
+            self._staging = create_staging(self.engine, self.table)
+        with self.engine.begin() as conn:
+            write_rows(conn, prepare_frame(batch), self._staging)
+        self.rows += len(batch)
+
+    def close(self):
+        if self._staging is not None:
+            swap_staging(self.engine, self.table)
+            self._staging = None
+
+    def abort(self):
+        if self._staging is not None:
+            drop_staging(self.engine, self.table)
+            self._staging = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def melt_to_sink(path, sink, batch_rows=BATCH_ROWS, **kwargs):
+    """Stream ``path`` through ``iter_long_batches`` into ``sink``; return the row count.
+
+    The value dtype is the sink's (``float32`` for Parquet, ``float64`` for SQL).
+    The caller closes the sink (use it as a context manager).
+    """
+    kwargs.setdefault('value_dtype', sink.value_dtype)
+    for batch in iter_long_batches(path, batch_rows=batch_rows, **kwargs):
+        sink.write(batch)
+    return sink.rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a wide F<year> CSV to long Parquet.")
+    parser.add_argument('source', help="wide CSV file")
+    parser.add_argument('target', help="Parquet file to write")
+    parser.add_argument('--batch-rows', type=int, default=BATCH_ROWS)
+    parser.add_argument('--value-name', default='temperature_change')
+    args = parser.parse_args()
+
+    with ParquetSink(args.target) as sink:
+        rows = melt_to_sink(args.source, sink, batch_rows=args.batch_rows,
+                            value_name=args.value_name)
+    print(f"✅ {rows:,} long rows written to {args.target}")
@@ -0,0 +1,155 @@
+"""
+Versioned on-disk registry of fitted models.
+
+Notebook 08 trains the logistic risk classifier and the model used to vanish
+with the kernel, so the dashboard hard-coded its metrics and approximated it
+with a hand-written sigmoid. Fitted estimators are now saved with everything
+needed to use them again:
+
+    models/<name>/<version>/model.joblib    {"model": ..., "scaler": ...}
+    models/<name>/<version>/metadata.json   features, feature spec, metrics, ...
+
+Versions are ``v1``, ``v2``, ... and never overwritten; ``load_model(name)``
+returns the latest one. A version is written in a temporary directory and
+renamed into place once both files exist, so readers never see a partial one. Loaded models go through the process-wide cache of
+``src.data_loader`` (keyed on the file signature), so the app deserialises a
+model once per process and every session shares it.
+"""
+
+import json
+import os
+import re
+import shutil
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import PROJECT_ROOT, load_cached
+
+MODELS_DIR = PROJECT_ROOT / "models"
+VERSION_PATTERN = re.compile(r'^v(\d+)$')
+
+
+def _fitted_input(estimator, X):
+    # Named columns if the estimator was fitted on a DataFrame, a plain array otherwise
+    if isinstance(X, pd.DataFrame) and not hasattr(estimator, 'feature_names_in_'):
+        return X.to_numpy()
+    return X
+
+
+class RegisteredModel:
+    """A fitted (scaler, model) pair with its metadata."""
+
+    def __init__(self, model, scaler, metadata):
+        self.model = model
+        self.scaler = scaler
+        self.metadata = metadata
+
+    @property
+    def features(self):
+        return self.metadata['features']
+
+    @property
+    def metrics(self):
+        return self.metadata.get('metrics', {})
+
+    def _prepare(self, X):
+        if not hasattr(X, 'loc'):
+            X = pd.DataFrame(np.asarray(X, dtype=np.float64), columns=self.features)
+        X = X[self.features]
+        if self.scaler is not None:
+            X = self.scaler.transform(_fitted_input(self.scaler, X))
+        return _fitted_input(self.model, X)
+
+    def predict_proba(self, X):
+        """Positive-class probability for every row of ``X`` (one batched call)."""
+        return self.model.predict_proba(self._prepare(X))[:, 1]
+
+    def predict(self, X):
+        return self.model.predict(self._prepare(X))
+
+    def __repr__(self):
+        return f"RegisteredModel({self.metadata['name']!r}, {self.metadata['version']!r})"
+
+
+def list_versions(name, models_dir=MODELS_DIR):
+    """Registered versions of ``name``, oldest first."""
+    model_dir = models_dir / name
+    if not model_dir.is_dir():
+        return []
+    versions = [p.name for p in model_dir.iterdir() if VERSION_PATTERN.match(p.name)]
+    return sorted(versions, key=lambda v: int(VERSION_PATTERN.match(v).group(1)))
+
+
+def save_model(name, model, scaler=None, features=None, feature_spec=None, metrics=None,
+               params=None, models_dir=MODELS_DIR):
+    """Register a fitted model as the next version of ``name``; return the metadata.
+
+    ``features`` are the input column names in order, ``feature_spec`` whatever
+    is needed to rebuild them (windows, year range, thresholds, ...), and
+    ``metrics`` the evaluation results. All three must be JSON serialisable.
+    """
+    import joblib
+    import sklearn
+
+    model_dir = models_dir / name
+    model_dir.mkdir(parents=True, exist_ok=True)
+    metadata = {
+        'name': name,
+        'version': None,
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'estimator': type(model).__name__,
+        'features': list(features or []),
+        'feature_spec': feature_spec or {},
+        'metrics': metrics or {},
+        'params': params or {},
+        'sklearn_version': sklearn.__version__,
+    }
+
+    # Not a version name, so list_versions ignores it until the rename
+    tmp_dir = model_dir / f'.tmp-{os.getpid()}-{uuid.uuid4().hex}'
+    tmp_dir.mkdir()
+    try:
+        joblib.dump({'model': model, 'scaler': scaler}, tmp_dir / 'model.joblib')
+        while True:
+            versions = list_versions(name, models_dir)
+            number = int(VERSION_PATTERN.match(versions[-1]).group(1)) + 1 if versions else 1
+            metadata['version'] = f'v{number}'
+            with open(tmp_dir / 'metadata.json', 'w') as f:
+                json.dump(metadata, f, indent=2)
+            try:
+                os.replace(tmp_dir, model_dir / metadata['version'])
+                return metadata
+            except OSError:
+                # Another process registered this version first: take the next one
+                if not (model_dir / metadata['version']).is_dir():
+                    raise
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+def read_metadata(name, version=None, models_dir=MODELS_DIR):
+    """Metadata of ``name`` (latest version by default), or None if not registered."""
+    version = version or (list_versions(name, models_dir) or [None])[-1]
+    if version is None:
+        return None
+    path = models_dir / name / version / 'metadata.json'
+    return load_cached(path, lambda p: json.loads(p.read_text()))
+
+
+def load_model(name, version=None, models_dir=MODELS_DIR):
+    """Load a registered model (latest version by default), or None if not registered."""
+    import joblib
+
+    metadata = read_metadata(name, version, models_dir)
+    if metadata is None:
+        return None
+    path = models_dir / name / metadata['version'] / 'model.joblib'
+    return load_cached(
+        path,
+        lambda p: RegisteredModel(metadata=metadata, **joblib.load(p)),
+        variant='registered_model',
+    )
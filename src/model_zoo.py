@@ -0,0 +1,404 @@
+"""
+Time-series model zoo for the per-country projections.
+
+``src.projections`` fits polynomial trends only. The zoo puts other model
+families behind one interface so they can be compared country by country:
+
+- ``linear`` / ``quadratic``: the polynomial OLS trends of ``src.projections``,
+- ``holt``: Holt's linear trend (additive ETS, ``statsmodels``),
+- ``segmented``: continuous piecewise-linear trend with one breakpoint chosen
+  by least squares (the acceleration the dashboard describes),
+- ``local_linear_trend``: local linear trend state-space model
+  (``statsmodels`` unobserved components).
+
+Every model implements ``fit(years, values)`` and
+``forecast(future, confidence) -> (mean, lower, upper)``; ``@register`` adds a
+new one to ``MODEL_ZOO``. ``run_zoo`` schedules every (model, country) task:
+
+- tasks run on a process pool (``n_jobs=1`` keeps them in-process), each under
+  a ``timeout`` (SIGALRM inside the worker, so a stuck optimiser only loses
+  its own task),
+- results are cached on disk under a hash of the model code, its parameters
+  and the country's series, so a rerun only fits the countries whose data
+  changed,
+- failures and timeouts are reported in the task table instead of aborting
+  the run.
+
+The output is one tidy table (``FORECAST_COLUMNS``) with every model side by
+side, stored as the ``model_zoo_forecasts`` artifact:
+
+    forecasts, tasks = run_zoo(df, n_jobs=None)
+    write_artifact(forecasts, 'model_zoo_forecasts')
+"""
+
+import hashlib
+import inspect
+import os
+import signal
+import threading
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from src.data_loader import REPORTS_DIR
+from src.features import MIN_YEARS
+from src.projections import (
+    CONFIDENCE, HORIZON, YEAR_SCALE, country_year_matrix, design_matrix, fit_polynomial, predict,
+)
+
+TASK_TIMEOUT = 30            # seconds per (model, country) fit
+CACHE_DIR = REPORTS_DIR / 'cache' / 'model_zoo'
+
+FORECAST_COLUMNS = ['country', 'iso3', 'model', 'year', 'forecast', 'lower', 'upper']
+TASK_COLUMNS = ['country', 'model', 'status', 'seconds', 'message']
+
+MODEL_ZOO = {}
+
+
+def register(cls):
+    """Class decorator: make a ``ForecastModel`` available to ``run_zoo`` by its ``name``."""
+    MODEL_ZOO[cls.name] = cls
+    return cls
+
+
+class ForecastModel:
+    """Common interface: ``fit`` one series, then ``forecast`` any future years.
+
+    ``values`` may contain NaN (missing years); ``years`` are consecutive.
+    """
+
+    name = None
+
+    def __init__(self, **params):
+        self.params = params
+
+    def fit(self, years, values):
+        raise NotImplementedError
+
+    def forecast(self, future, confidence=CONFIDENCE):
+        raise NotImplementedError
+
+    def __repr__(self):
+        params = ', '.join(f'{k}={v!r}' for k, v in sorted(self.params.items()))
+        return f'{type(self).__name__}({params})'
+
+
+def _observed(years, values):
+    keep = ~np.isnan(values)
+    return np.asarray(years, dtype=np.float64)[keep], values[keep]
+
+
+# ============================================
+# Models
+# ============================================
+
+class PolynomialTrend(ForecastModel):
+    """OLS polynomial trend with prediction intervals (``src.projections``)."""
+
+    degree = 1
+
+    def fit(self, years, values):
+        years, values = _observed(years, values)
+        self.center = years.mean()
+        self._fit = fit_polynomial(years, values[None], self.degree, self.center)
+        return self
+
+    def forecast(self, future, confidence=CONFIDENCE):
+        mean, lower, upper = predict(self._fit, future, self.degree, self.center, confidence)
+        return mean[0], lower[0], upper[0]
+
+
+@register
+class LinearTrend(PolynomialTrend):
+    name = 'linear'
+    degree = 1
+
+
+@register
+class QuadraticTrend(PolynomialTrend):
+    name = 'quadratic'
+    degree = 2
+
+
+@register
+class HoltTrend(ForecastModel):
+    """Holt's linear trend: additive-error ETS(A, A, N); gaps are interpolated."""
+
+    name = 'holt'
+
+    def fit(self, years, values):
+        from statsmodels.tsa.exponential_smoothing.ets import ETSModel
+
+        observed = ~np.isnan(values)
+        filled = np.interp(years, years[observed], values[observed])
+        model = ETSModel(pd.Series(filled), error='add', trend='add',
+                         damped_trend=self.params.get('damped', False))
+        self._result = model.fit(disp=False)
+        self.last_year = int(years[-1])
+        self._n = len(filled)
+        return self
+
+    def forecast(self, future, confidence=CONFIDENCE):
+        steps = np.asarray(future) - self.last_year
+        frame = self._result.get_prediction(start=self._n, end=self._n + int(steps.max()) - 1) \
+            .summary_frame(alpha=1 - confidence)
+        rows = steps - 1
+        return (frame['mean'].to_numpy()[rows], frame['pi_lower'].to_numpy()[rows],
+                frame['pi_upper'].to_numpy()[rows])
+
+
+@register
+class LocalLinearTrend(ForecastModel):
+    """Local linear trend state-space model (level and slope follow random walks)."""
+
+    name = 'local_linear_trend'
+
+    def fit(self, years, values):
+        from statsmodels.tsa.statespace.structural import UnobservedComponents
+
+        self._result = UnobservedComponents(values, level='local linear trend').fit(disp=False)
+        self.last_year = int(years[-1])
+        return self
+
+    def forecast(self, future, confidence=CONFIDENCE):
+        steps = np.asarray(future) - self.last_year
+        frame = self._result.get_forecast(int(steps.max())).summary_frame(alpha=1 - confidence)
+        rows = steps - 1
+        return (frame['mean'].to_numpy()[rows], frame['mean_ci_lower'].to_numpy()[rows],
+                frame['mean_ci_upper'].to_numpy()[rows])
+
+
+@register
+class SegmentedTrend(ForecastModel):
+    """Continuous piecewise-linear trend ``a + b·t + c·max(0, t - τ)`` with one breakpoint.
+
+    Every year leaving ``min_segment`` points on each side is tried as ``τ``
+    (one batched least-squares solve); the one with the smallest residual sum
+    of squares wins. After fitting, ``breakpoint`` is the break year and
+    ``slopes`` the (before, after) slopes per year. Intervals are conditional
+    on the chosen breakpoint.
+    """
+
+    name = 'segmented'
+
+    def fit(self, years, values):
+        years, values = _observed(years, values)
+        min_segment = self.params.get('min_segment', 10)
+        candidates = years[min_segment - 1:len(years) - min_segment]
+        if len(candidates) == 0:
+            raise ValueError(f'segmented trend needs at least {2 * min_segment} observed years')
+
+        self.center = years.mean()
+        X = self._design(years, candidates)                     # (candidates, n, 3)
+        xtx_inv = np.linalg.inv(np.einsum('kni,knj->kij', X, X))
+        beta = np.einsum('kij,knj,n->ki', xtx_inv, X, values)
+        sse = ((values - np.einsum('kni,ki->kn', X, beta)) ** 2).sum(axis=1)
+
+        best = int(np.argmin(sse))
+        self.breakpoint = int(candidates[best])
+        self._beta, self._xtx_inv = beta[best], xtx_inv[best]
+        self._dof = len(years) - 3
+        self._s2 = sse[best] / self._dof
+        slope = self._beta[1] / YEAR_SCALE
+        self.slopes = (slope, slope + self._beta[2] / YEAR_SCALE)
+        return self
+
+    def _design(self, years, breakpoints):
+        t = design_matrix(years, 1, self.center)[:, 1]
+        tau = design_matrix(breakpoints, 1, self.center)[:, 1]
+        hinge = np.maximum(t[None, :] - tau[:, None], 0)
+        base = np.broadcast_to(np.column_stack([np.ones_like(t), t]), (len(tau), len(t), 2))
+        return np.concatenate([base, hinge[..., None]], axis=2)
+
+    def forecast(self, future, confidence=CONFIDENCE):
+        X0 = self._design(np.asarray(future, dtype=np.float64), np.array([self.breakpoint]))[0]
+        mean = X0 @ self._beta
+        leverage = np.einsum('fi,ij,fj->f', X0, self._xtx_inv, X0)
+        half_width = stats.t.ppf(0.5 + confidence / 2, self._dof) * np.sqrt(self._s2 * (1 + leverage))
+        return mean, mean - half_width, mean + half_width
+
+
+DEFAULT_MODELS = tuple(MODEL_ZOO)
+
+
+# ============================================
+# Tasks: timeout and cache
+# ============================================
+
+class TaskTimeout(Exception):
+    pass
+
+
+class _time_limit:
+    """Raise ``TaskTimeout`` after ``seconds`` (main thread on POSIX only; no-op elsewhere)."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.active = (
+            bool(seconds) and hasattr(signal, 'SIGALRM')
+            and threading.current_thread() is threading.main_thread()
+        )
+
+    def _expire(self, signum, frame):
+        raise TaskTimeout(f'exceeded {self.seconds}s')
+
+    def __enter__(self):
+        if self.active:
+            self._previous = signal.signal(signal.SIGALRM, self._expire)
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)
+
+    def __exit__(self, *exc):
+        if self.active:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous)
+        return False
+
+
+_code_digests = {}
+
+
+def _code_digest(name):
+    if name not in _code_digests:
+        cls = MODEL_ZOO[name]
+        h = hashlib.sha256()
+        for klass in cls.__mro__[:-1]:
+            h.update(inspect.getsource(klass).encode())
+        _code_digests[name] = h.hexdigest()
+    return _code_digests[name]
+
+
+def task_key(name, params, years, values, future, confidence):
+    """Cache key of one (model, series) fit: model code + parameters + data."""
+    h = hashlib.sha256(_code_digest(name).encode())
+    h.update(repr(sorted(params.items())).encode())
+    h.update(np.asarray(years, dtype=np.int64).tobytes())
+    h.update(np.asarray(values, dtype=np.float64).tobytes())
+    h.update(np.asarray(future, dtype=np.int64).tobytes())
+    h.update(repr(confidence).encode())
+    return h.hexdigest()
+
+
+def _read_cache(cache_dir, key):
+    if cache_dir is None:
+        return None
+    path = os.path.join(cache_dir, key + '.npy')
+    try:
+        return np.load(path, allow_pickle=False)
+    except (FileNotFoundError, ValueError, OSError):
+        return None
+
+
+def _write_cache(cache_dir, key, result):
+    if cache_dir is None:
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, key + '.npy')
+    tmp = f'{path}.{os.getpid()}.tmp.npy'
+    np.save(tmp, result)
+    os.replace(tmp, path)
+
+
+def run_task(task):
+    """Fit one model to one series; returns ``(status, seconds, message, (3, future) array)``."""
+    name, params, years, values, future, confidence, timeout, cache_dir = task
+    key = task_key(name, params, years, values, future, confidence)
+    cached = _read_cache(cache_dir, key)
+    if cached is not None:
+        return 'cached', 0.0, '', cached
+
+    start = time.perf_counter()
+    try:
+        with warnings.catch_warnings(), _time_limit(timeout):
+            warnings.simplefilter('ignore')
+            model = MODEL_ZOO[name](**params).fit(years, values)
+            result = np.vstack(model.forecast(future, confidence)).astype(np.float64)
+    except TaskTimeout as exc:
+        return 'timeout', time.perf_counter() - start, str(exc), None
+    except Exception as exc:
+        return 'failed', time.perf_counter() - start, f'{type(exc).__name__}: {exc}', None
+    _write_cache(cache_dir, key, result)
+    return 'ok', time.perf_counter() - start, '', result
+
+
+def _init_worker():
+    # One BLAS thread per worker: the pool provides the parallelism
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(1)
+    except ImportError:
+        pass
+
+
+# ============================================
+# Scheduler
+# ============================================
+
+def run_zoo(df, models=DEFAULT_MODELS, horizon=HORIZON, confidence=CONFIDENCE, countries=None,
+            n_jobs=None, timeout=TASK_TIMEOUT, cache_dir=CACHE_DIR, min_years=MIN_YEARS,
+            params=None):
+    """Fit every model to every country and forecast to ``horizon``.
+
+    Parameters
+    ----------
+    df : long table with ``country``, ``iso3``, ``year`` and ``temperature_change``.
+    models : names in ``MODEL_ZOO``; ``params`` maps a name to its keyword arguments.
+    countries : restrict to these countries (default: all with ``min_years``).
+    n_jobs : worker processes (None for all cores, 1 runs in-process).
+    timeout : seconds per task (None disables it).
+    cache_dir : directory of cached task results (None disables the cache).
+
+    Returns ``(forecasts, tasks)``: ``FORECAST_COLUMNS`` for the years after
+    the last year of ``df``, ordered by country, model and year, and one
+    ``TASK_COLUMNS`` row per (country, model) with its status (``ok``,
+    ``cached``, ``timeout`` or ``failed``).
+    """
+    params = params or {}
+    all_countries, iso3, years, values = country_year_matrix(df)
+    future = np.arange(years.max() + 1, horizon + 1)
+    observed = ~np.isnan(values)
+    selected = observed.sum(axis=1) >= min_years
+    if countries is not None:
+        selected &= np.isin(all_countries, list(countries))
+    rows = np.flatnonzero(selected)
+    cache_dir = os.fspath(cache_dir) if cache_dir is not None else None
+
+    tasks, labels = [], []
+    for row in rows:
+        # Consecutive years from the first to the last observation (NaN = gap)
+        span = np.flatnonzero(observed[row])
+        lo, hi = span[0], span[-1] + 1
+        for name in models:
+            tasks.append((name, params.get(name, {}), years[lo:hi], values[row, lo:hi],
+                          future, confidence, timeout, cache_dir))
+            labels.append((row, name))
+
+    n_jobs = min(n_jobs or os.cpu_count() or 1, max(len(tasks), 1))
+    if n_jobs == 1:
+        results = [run_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker) as pool:
+            results = list(pool.map(run_task, tasks, chunksize=max(1, len(tasks) // (n_jobs * 8))))
+
+    frames, status = [], []
+    for (row, name), (state, seconds, message, result) in zip(labels, results):
+        status.append((all_countries[row], name, state, seconds, message))
+        if result is None:
+            continue
+        frames.append(pd.DataFrame({
+            'country': all_countries[row],
+            'iso3': iso3[row],
+            'model': name,
+            'year': future,
+            'forecast': result[0],
+            'lower': result[1],
+            'upper': result[2],
+        }))
+
+    tasks_table = pd.DataFrame(status, columns=TASK_COLUMNS)
+    if not frames:
+        return pd.DataFrame(columns=FORECAST_COLUMNS), tasks_table
+    return pd.concat(frames, ignore_index=True)[FORECAST_COLUMNS], tasks_table
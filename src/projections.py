@@ -0,0 +1,183 @@
+"""
+Per-country trend projections for the Future Projections page.
+
+``notebooks/05_regression_phase4.ipynb`` fits one ``LinearRegression`` and one
+quadratic model on the global yearly mean and extrapolates to 2030. This
+module fits the same two models to every country at once and projects each
+of them to ``HORIZON`` with prediction intervals:
+
+- the long table is laid out as a dense ``(countries, years)`` matrix with a
+  missing-value mask, so every country shares one design matrix
+  ``[1, t, t²]`` (``t`` is the centred, rescaled year),
+- the weighted normal equations ``XᵀWX β = XᵀWy`` of all countries are built
+  with one ``einsum`` and solved through a batched ``np.linalg.inv`` (the
+  inverse is needed again for the intervals),
+- the prediction interval of a future year ``x₀`` is
+  ``ŷ ± t(dof) · s · sqrt(1 + x₀ᵀ(XᵀWX)⁻¹x₀)``, again for all countries at once.
+
+The result is one tidy table (``PROJECTION_COLUMNS``), one row per country,
+model and future year, stored as the ``country_projections`` artifact:
+
+    projections = compute_country_projections(df)
+    write_artifact(projections, 'country_projections')
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from src.features import MIN_YEARS
+
+HORIZON = 2050
+CONFIDENCE = 0.95
+MODELS = {'linear': 1, 'quadratic': 2}  # model name -> polynomial degree
+YEAR_SCALE = 10.0                       # t is in decades, keeps XᵀX well conditioned
+
+PROJECTION_COLUMNS = [
+    'country', 'iso3', 'model', 'year', 'projection', 'pi_lower', 'pi_upper',
+]
+
+
+def country_year_matrix(df):
+    """Lay out a long table as a ``(countries, years)`` matrix.
+
+    Returns ``(countries, iso3, years, values)``; ``values`` is NaN where a
+    country has no observation. Countries keep their order of first appearance.
+    """
+    codes, countries = pd.factorize(df['country'], sort=False)
+    year_codes, years = pd.factorize(df['year'], sort=True)
+    values = np.full((len(countries), len(years)), np.nan)
+    values[codes, year_codes] = df['temperature_change'].to_numpy(dtype=np.float64)
+
+    first_row = np.zeros(len(countries), dtype=np.int64)
+    first_row[codes[::-1]] = np.arange(len(codes))[::-1]
+    iso3 = df['iso3'].to_numpy()[first_row]
+    return np.asarray(countries), iso3, np.asarray(years, dtype=np.int64), values
+
+
+def design_matrix(years, degree, center):
+    """Polynomial design matrix ``[1, t, ..., t^degree]`` with ``t = (year - center) / 10``."""
+    t = (np.asarray(years, dtype=np.float64) - center) / YEAR_SCALE
+    return np.vander(t, degree + 1, increasing=True)
+
+
+def fit_polynomial(years, values, degree, center):
+    """Least-squares polynomial fit of every row of ``values`` (NaN = missing).
+
+    Returns a dict of per-country arrays: ``beta`` (countries, p),
+    ``xtx_inv`` (countries, p, p), residual variance ``s2``, degrees of freedom
+    ``dof`` and number of observations ``n``. Rows with ``dof < 1`` are NaN.
+    """
+    X = design_matrix(years, degree, center)
+    observed = ~np.isnan(values)
+    y = np.where(observed, values, 0.0)
+    w = observed.astype(np.float64)
+    n = observed.sum(axis=1)
+    p = X.shape[1]
+    dof = n - p
+    ok = dof >= 1
+
+    xtx = np.einsum('cy,yi,yj->cij', w, X, X)
+    xty = y @ X
+
+    beta = np.full((len(values), p), np.nan)
+    xtx_inv = np.full((len(values), p, p), np.nan)
+    xtx_inv[ok] = np.linalg.inv(xtx[ok])
+    beta[ok] = np.einsum('cij,cj->ci', xtx_inv[ok], xty[ok])
+
+    residuals = (y - beta @ X.T) * w
+    s2 = np.full(len(values), np.nan)
+    s2[ok] = (residuals[ok] ** 2).sum(axis=1) / dof[ok]
+    return {'beta': beta, 'xtx_inv': xtx_inv, 's2': s2, 'dof': dof, 'n': n}
+
+
+def predict(fit, years, degree, center, confidence=CONFIDENCE):
+    """Point predictions and prediction intervals at ``years`` for every country.
+
+    Returns ``(mean, lower, upper)``, each ``(countries, len(years))``.
+    """
+    X0 = design_matrix(years, degree, center)
+    mean = fit['beta'] @ X0.T
+    leverage = np.einsum('fi,cij,fj->cf', X0, fit['xtx_inv'], X0)
+    se = np.sqrt(fit['s2'][:, None] * (1 + leverage))
+    dof = np.where(fit['dof'] >= 1, fit['dof'], np.nan)
+    t_crit = stats.t.ppf(0.5 + confidence / 2, dof)[:, None]
+    return mean, mean - t_crit * se, mean + t_crit * se
+
+
+def compute_country_projections(df, horizon=HORIZON, models=MODELS, confidence=CONFIDENCE,
+                                min_years=MIN_YEARS, last_year=None):
+    """Fit every model to every country and project to ``horizon``.
+
+    Parameters
+    ----------
+    df : long table with ``country``, ``iso3``, ``year`` and ``temperature_change``.
+    horizon : last projected year; projections start the year after
+        ``last_year`` (default: the latest year in ``df``).
+    models : ``{name: polynomial degree}``.
+    confidence : coverage of the prediction interval.
+    min_years : countries with fewer observed years are skipped.
+
+    Returns a DataFrame with ``PROJECTION_COLUMNS``, ordered by country (first
+    appearance), model and year.
+    """
+    countries, iso3, years, values = country_year_matrix(df)
+    keep = (~np.isnan(values)).sum(axis=1) >= min_years
+    countries, iso3, values = countries[keep], iso3[keep], values[keep]
+    if len(countries) == 0:
+        return pd.DataFrame(columns=PROJECTION_COLUMNS)
+
+    last_year = years.max() if last_year is None else last_year
+    future = np.arange(last_year + 1, horizon + 1)
+    center = years.mean()
+    n_countries, n_future = len(countries), len(future)
+
+    frames = []
+    for model_order, (name, degree) in enumerate(models.items()):
+        fit = fit_polynomial(years, values, degree, center)
+        mean, lower, upper = predict(fit, future, degree, center, confidence)
+        frames.append(pd.DataFrame({
+            'country': np.repeat(countries, n_future),
+            'iso3': np.repeat(iso3, n_future),
+            'model': name,
+            'year': np.tile(future, n_countries),
+            'projection': mean.ravel(),
+            'pi_lower': lower.ravel(),
+            'pi_upper': upper.ravel(),
+            '_model_order': model_order,
+        }))
+
+    projections = pd.concat(frames, ignore_index=True)
+    order = {country: i for i, country in enumerate(countries)}
+    rows = np.lexsort((
+        projections['year'].to_numpy(),
+        projections['_model_order'].to_numpy(),
+        projections['country'].map(order).to_numpy(),
+    ))
+    return projections.iloc[rows].reset_index(drop=True)[PROJECTION_COLUMNS]
+
+
+def refresh_country_projections(projections, df, countries, **kwargs):
+    """Recompute the projections of ``countries`` only (see ``refresh_country_features``).
+
+    Other countries keep their rows, refreshed countries replace their old
+    rows in place and new countries are appended; ``countries=None``
+    recomputes everything. Extra keyword arguments go to
+    ``compute_country_projections``.
+    """
+    if countries is None:
+        return compute_country_projections(df, **kwargs)
+
+    countries = set(countries)
+    # Same projection years as the untouched countries
+    kwargs.setdefault('last_year', int(df['year'].max()))
+    fresh = compute_country_projections(df[df['country'].isin(countries)], **kwargs)
+
+    kept = projections[~projections['country'].isin(countries)]
+    order = {country: i for i, country in enumerate(dict.fromkeys(projections['country']))}
+    fresh_old = fresh[fresh['country'].isin(order)]
+    fresh_new = fresh[~fresh['country'].isin(order)]
+
+    merged = pd.concat([kept, fresh_old])
+    merged = merged.iloc[merged['country'].map(order).argsort(kind='stable')]
+    return pd.concat([merged, fresh_new], ignore_index=True)[PROJECTION_COLUMNS]
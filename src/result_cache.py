@@ -0,0 +1,265 @@
+"""
+Derived tables shared by every session of the dashboard.
+
+Artifacts and queries are cached process-wide (``src.data_loader``,
+``src.db``), but what the pages compute from them (the risk scoring of the
+Logistic page, the cluster profiles of the Clustering page, ...) was redone by
+every session on every rerun. ``cached_result`` computes such a result once
+per (name, data version, parameters):
+
+- memory layer: thread-safe LRU bounded by entries and bytes, shared by all
+  sessions of the process. Concurrent sessions missing the same key wait for
+  the first computation instead of repeating it,
+- disk layer (optional): pickles under ``RESULT_CACHE_DIR`` so several worker
+  processes serving the app share results. Files are written atomically and
+  the directory is trimmed to ``max_disk_bytes`` (least recently used first).
+  Enable it by setting the ``RESULT_CACHE_DIR`` environment variable; only
+  point it at a directory the app alone writes to (pickles are trusted),
+- ``cache_info()`` reports hits (memory and disk), misses, evictions and sizes.
+
+The version part of the key says which data a result was computed from:
+``artifact_version(...)`` (file signatures of the artifacts) offline, and
+``src.db.data_version()`` in live mode. Keys must be built from plain values
+(str, int, float, bool, None, tuples of them).
+
+    version = artifact_version('clustering_results_named')
+    profiles = cached_result('cluster_profiles', lambda: cluster_profiles(df), version)
+
+Cached results are shared: copy them before modifying.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+
+from src.artifacts import artifact_source
+from src.data_loader import file_signature
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 512 * 1024 * 1024
+DISK_SUFFIX = '.pkl'
+
+
+def _nbytes(obj):
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, dict):
+        return sum(_nbytes(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(_nbytes(value) for value in obj)
+    return 0
+
+
+def key_digest(key):
+    """Stable hex digest of a key made of plain values (same in every process)."""
+    return hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+
+
+def artifact_version(*names):
+    """Version token of artifacts: ``(name, suffix, mtime_ns, size)`` per name (``(name, None)`` if missing)."""
+    version = []
+    for name in names:
+        source = artifact_source(name)
+        if source is None:
+            version.append((name, None))
+        else:
+            version.append((name, source.suffix, *file_signature(source)[1:]))
+    return tuple(version)
+
+
+class ResultCache:
+    """Thread-safe LRU of computed results, optionally backed by a directory of pickles."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES,
+                 disk_dir=None, max_disk_bytes=DEFAULT_MAX_DISK_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()  # digest -> (value, nbytes)
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_errors = 0
+
+    def _lookup(self, digest):
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return True, entry[0]
+            return False, None
+
+    def get(self, key, compute):
+        """Return the result cached for ``key``, calling ``compute()`` on a miss."""
+        digest = key_digest(key)
+        found, value = self._lookup(digest)
+        if found:
+            return value
+
+        # One computation per key: concurrent sessions wait for the first one
+        with self._lock:
+            key_lock = self._key_locks.setdefault(digest, threading.Lock())
+        with key_lock:
+            found, value = self._lookup(digest)
+            if found:
+                return value
+            found, value = self._read_disk(digest)
+            if found:
+                with self._lock:
+                    self.disk_hits += 1
+            else:
+                value = compute()
+                with self._lock:
+                    self.misses += 1
+                self._write_disk(digest, value)
+            self._store(digest, value)
+            return value
+
+    def _store(self, digest, value):
+        nbytes = _nbytes(value)
+        with self._lock:
+            old = self._entries.pop(digest, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[digest] = (value, nbytes)
+            self._bytes += nbytes
+            # Always keep the entry just stored, even if it alone exceeds the budget
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                evicted, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._bytes -= evicted_bytes
+                self._key_locks.pop(evicted, None)
+                self.evictions += 1
+
+    # --------------------------------------------
+    # Disk layer
+    # --------------------------------------------
+
+    def _disk_path(self, digest):
+        return self.disk_dir / f"{digest}{DISK_SUFFIX}"
+
+    def _read_disk(self, digest):
+        if self.disk_dir is None:
+            return False, None
+        path = self._disk_path(digest)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except Exception:
+            # Truncated or unreadable (e.g. written by another library version): recompute
+            with self._lock:
+                self.disk_errors += 1
+            path.unlink(missing_ok=True)
+            return False, None
+        try:
+            os.utime(path)          # recently used: trimmed last
+        except OSError:
+            pass
+        return True, value
+
+    def _write_disk(self, digest, value):
+        if self.disk_dir is None:
+            return
+        path = self._disk_path(digest)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+            self._trim_disk()
+        except Exception:
+            # Unpicklable result or unwritable directory: keep serving from memory
+            with self._lock:
+                self.disk_errors += 1
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def _trim_disk(self):
+        files = []
+        for path in self.disk_dir.glob(f"*{DISK_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue        # removed by another process
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def disk_usage(self):
+        """``(files, bytes)`` of the disk layer (``(0, 0)`` when disabled)."""
+        if self.disk_dir is None or not self.disk_dir.exists():
+            return 0, 0
+        sizes = [path.stat().st_size for path in self.disk_dir.glob(f"*{DISK_SUFFIX}")]
+        return len(sizes), sum(sizes)
+
+    def clear(self, disk=False):
+        """Drop the memory layer (and the pickles too with ``disk``)."""
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+            self._bytes = 0
+        if disk and self.disk_dir is not None and self.disk_dir.exists():
+            for path in self.disk_dir.glob(f"*{DISK_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    def info(self):
+        """Hit/miss counters and current size of both layers."""
+        disk_files, disk_bytes = self.disk_usage()
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_errors": self.disk_errors,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "disk_dir": str(self.disk_dir) if self.disk_dir is not None else None,
+                "disk_files": disk_files,
+                "disk_bytes": disk_bytes,
+            }
+
+
+# Shared by every session of the Streamlit process
+_cache = ResultCache(disk_dir=os.environ.get('RESULT_CACHE_DIR') or None)
+
+
+def cached_result(name, compute, version=(), params=None):
+    """``compute()`` through the shared cache, keyed by ``(name, version, params)``."""
+    return _cache.get((name, version, params), compute)
+
+
+def cache_info():
+    """Counters of the shared result cache."""
+    return _cache.info()
+
+
+def clear_cache(disk=False):
+    """Empty the shared result cache (and its disk layer with ``disk``)."""
+    _cache.clear(disk)
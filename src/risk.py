@@ -0,0 +1,106 @@
+"""
+Climate risk scoring with the logistic model of notebook 08.
+
+``notebooks/08_logistic_regression_phase5.ipynb`` classifies a country-year
+as high risk (temperature change above 1.5°C) from five features:
+
+- ``temperature_change`` and ``year_scaled`` (year mapped to [0, 1] over the
+  training years),
+- ``temp_5yr_avg`` / ``temp_10yr_avg``: trailing rolling means per country,
+- ``temp_change_rate``: year-over-year difference per country.
+
+``risk_features`` rebuilds exactly those columns with ``src.rolling`` for any
+long table, using the windows and year range stored with the registered
+model, and ``score_risk`` scores all countries x years with one batched
+``predict_proba`` call. Future values (projections) can be scored with the
+observed history in front of them so the rolling windows are complete.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.model_registry import load_model
+from src.rolling import RollingKernel
+
+MODEL_NAME = 'logistic_risk'
+RISK_FEATURES = [
+    'temperature_change', 'year_scaled', 'temp_5yr_avg', 'temp_10yr_avg', 'temp_change_rate',
+]
+DEFAULT_FEATURE_SPEC = {
+    'short_window': 5,
+    'long_window': 10,
+    'year_range': [1961, 2022],
+    'threshold': 1.5,
+}
+
+
+def risk_features(df, feature_spec=None):
+    """Build ``RISK_FEATURES`` for the rows of a long table (same row order).
+
+    The first change rate of each country is back-filled from the next year,
+    like the notebook's ``fillna(method='bfill')``.
+    """
+    spec = {**DEFAULT_FEATURE_SPEC, **(feature_spec or {})}
+    short_w, long_w = spec['short_window'], spec['long_window']
+    kernel = RollingKernel(df)
+    X, names = kernel.features(windows=(short_w, long_w), stats=('mean',), diffs=(1,))
+
+    year_min, year_max = spec['year_range']
+    features = pd.DataFrame({
+        'temperature_change': df['temperature_change'].to_numpy(dtype=np.float64),
+        'year_scaled': (df['year'].to_numpy(dtype=np.float64) - year_min) / (year_max - year_min),
+        'temp_5yr_avg': X[:, names.index(f'mean_{short_w}')],
+        'temp_10yr_avg': X[:, names.index(f'mean_{long_w}')],
+        'temp_change_rate': X[:, names.index('diff_1')],
+    }, index=df.index)
+
+    # Back-fill inside each country (in year order), then anything left with 0
+    rate = features['temp_change_rate'].to_numpy().copy()
+    sorted_rate = rate[kernel.order]
+    first = np.flatnonzero(kernel.position == 0)
+    first = first[first + 1 < kernel.n_rows]
+    first = first[kernel.position[first + 1] == 1]      # country has a second year
+    sorted_rate[first] = sorted_rate[first + 1]
+    rate[kernel.order] = sorted_rate
+    features['temp_change_rate'] = np.nan_to_num(rate)
+    return features[RISK_FEATURES].astype(np.float64)
+
+
+def load_risk_model(version=None):
+    """The registered risk model (latest version), or None if notebook 08 has not registered one."""
+    return load_model(MODEL_NAME, version)
+
+
+def score_risk(df, model=None, history=None):
+    """Add ``risk_probability`` and ``high_risk`` to a long table.
+
+    ``df`` has ``country``, ``year`` and ``temperature_change``. ``history``
+    (same columns, earlier years) is put in front of it for the rolling
+    windows but not returned. Returns None when no model is registered.
+    """
+    model = model or load_risk_model()
+    if model is None:
+        return None
+
+    columns = ['country', 'year', 'temperature_change']
+    frame = df[columns]
+    if history is not None and len(history) > 0:
+        frame = pd.concat([history[columns], frame], ignore_index=True)
+    frame = frame.assign(country=frame['country'].astype(str))
+
+    features = risk_features(frame, model.metadata.get('feature_spec'))
+    probability = model.predict_proba(features.iloc[len(frame) - len(df):])
+
+    scored = df.copy()
+    scored['risk_probability'] = probability
+    scored['high_risk'] = probability > 0.5
+    return scored
+
+
+def score_projections(projections, model=None, history=None, value_column='projection'):
+    """Score projected values (e.g. the ``country_projections`` artifact, one model)."""
+    future = projections.rename(columns={value_column: 'temperature_change'})
+    scored = score_risk(future, model, history)
+    if scored is None:
+        return None
+    return scored.rename(columns={'temperature_change': value_column})
@@ -0,0 +1,153 @@
+"""
+Rolling-window and lag features over a long (country, year) table.
+
+``notebooks/08_logistic_regression_phase5.ipynb`` builds its features with
+``groupby('country').rolling(w).mean().reset_index(0, drop=True)`` and a
+separate ``groupby().diff()``: every feature re-sorts the table and realigns
+the index. ``RollingKernel`` sorts the table once and keeps prefix sums of the
+sorted values, after which every window is O(rows) array arithmetic:
+
+- rolling sum over ``[i - w + 1, i]`` = ``cumsum[i + 1] - cumsum[max(i + 1 - w, start)]``
+  with the window clipped at the start of the country,
+- rolling mean / std from the prefix sums of ``x``, ``x²`` and the count of
+  non-missing values (values are centred per country first, so the ``x²``
+  sums do not lose precision),
+- exceedance counts from the prefix sum of ``x > threshold``,
+- lags and differences by shifting inside each country.
+
+Windows are counted in rows, like pandas' ``rolling(w, min_periods=...)`` on
+the sorted rows. ``features()`` returns a float32 matrix aligned with the rows
+of the input frame, so window sizes can be swept during tuning without
+rebuilding any DataFrame:
+
+    kernel = RollingKernel(df)
+    for w in (3, 5, 10, 20):
+        X, names = kernel.features(windows=(w,), stats=('mean', 'std'), diffs=(1,))
+"""
+
+import numpy as np
+
+from src.features import group_offsets, sort_by_group
+
+
+def _prefix(values):
+    out = np.zeros(len(values) + 1)
+    np.cumsum(values, out=out[1:])
+    return out
+
+
+class RollingKernel:
+    """Sorted layout and prefix sums of one long table, reusable for any window."""
+
+    def __init__(self, df, value='temperature_change', group='country', year='year'):
+        codes, self.groups, self.order = sort_by_group(df, group, year)
+        starts, counts = group_offsets(codes, len(self.groups))
+        self.n_rows = len(codes)
+        self.start = starts[codes]                          # first row of each row's group
+        self.position = np.arange(self.n_rows) - self.start  # row index within the group
+
+        values = df[value].to_numpy(dtype=np.float64)[self.order]
+        self.values = values
+        valid = ~np.isnan(values)
+
+        # Centre each group on its own mean so x² prefix sums stay well conditioned
+        group_sum = np.bincount(codes, weights=np.where(valid, values, 0), minlength=len(self.groups))
+        group_n = np.bincount(codes, weights=valid, minlength=len(self.groups))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            group_mean = np.where(group_n > 0, group_sum / group_n, 0)
+        centred = np.where(valid, values - group_mean[codes], 0)
+
+        self._count = _prefix(valid.astype(np.float64))
+        self._sum = _prefix(centred)
+        self._sum_sq = _prefix(centred * centred)
+        self._offset = group_mean[codes]
+
+    # ----------------------------------------
+    # Window primitives (rows in sorted order)
+    # ----------------------------------------
+
+    def _window(self, prefix, window):
+        hi = np.arange(1, self.n_rows + 1)
+        lo = np.maximum(hi - window, self.start)
+        return prefix[hi] - prefix[lo]
+
+    def rolling_count(self, window):
+        """Number of non-missing values in the trailing ``window`` rows."""
+        return self._window(self._count, window)
+
+    def rolling_mean(self, window, min_periods=1):
+        count = self.rolling_count(window)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = self._window(self._sum, window) / count + self._offset
+        return np.where(count >= min_periods, mean, np.nan)
+
+    def rolling_std(self, window, min_periods=1, ddof=1):
+        """Sample standard deviation (``ddof=1`` like pandas); NaN below ``ddof + 1`` values."""
+        count = self.rolling_count(window)
+        s = self._window(self._sum, window)
+        s2 = self._window(self._sum_sq, window)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            var = (s2 - s * s / count) / (count - ddof)
+        std = np.sqrt(np.maximum(var, 0))
+        return np.where((count >= max(min_periods, ddof + 1)), std, np.nan)
+
+    def exceedance_count(self, window, threshold):
+        """Number of values above ``threshold`` in the trailing ``window`` rows."""
+        above = np.nan_to_num(self.values, nan=-np.inf) > threshold
+        return self._window(_prefix(above.astype(np.float64)), window)
+
+    def lag(self, periods=1):
+        """Value ``periods`` rows earlier in the same group (NaN before the first)."""
+        out = np.full(self.n_rows, np.nan)
+        ok = self.position >= periods
+        out[ok] = self.values[np.flatnonzero(ok) - periods]
+        return out
+
+    def diff(self, periods=1):
+        return self.values - self.lag(periods)
+
+    # ----------------------------------------
+    # Feature matrix
+    # ----------------------------------------
+
+    def features(self, windows=(5, 10), stats=('mean',), lags=(), diffs=(1,),
+                 exceedance=(), min_periods=1):
+        """Build a float32 feature matrix aligned with the rows of the input frame.
+
+        Parameters
+        ----------
+        windows : window sizes (rows) for the rolling ``stats`` and ``exceedance``.
+        stats : any of ``'mean'``, ``'std'``, ``'count'``.
+        lags, diffs : periods for lagged values and differences.
+        exceedance : thresholds; one count column per (window, threshold).
+        min_periods : minimum non-missing values for a rolling mean/std.
+
+        Returns ``(X, names)``; column names look like ``mean_5``, ``std_10``,
+        ``lag_1``, ``diff_1`` and ``exceed_10_1.5``.
+        """
+        columns, names = [], []
+        for window in windows:
+            for stat in stats:
+                if stat == 'mean':
+                    columns.append(self.rolling_mean(window, min_periods))
+                elif stat == 'std':
+                    columns.append(self.rolling_std(window, min_periods))
+                elif stat == 'count':
+                    columns.append(self.rolling_count(window))
+                else:
+                    raise ValueError(f"Unknown rolling statistic '{stat}'")
+                names.append(f'{stat}_{window}')
+            for threshold in exceedance:
+                columns.append(self.exceedance_count(window, threshold))
+                names.append(f'exceed_{window}_{threshold:g}')
+        for periods in lags:
+            columns.append(self.lag(periods))
+            names.append(f'lag_{periods}')
+        for periods in diffs:
+            columns.append(self.diff(periods))
+            names.append(f'diff_{periods}')
+
+        X = np.empty((self.n_rows, len(columns)), dtype=np.float32)
+        for j, column in enumerate(columns):
+            X[self.order, j] = column
+        return X, names
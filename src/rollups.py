@@ -0,0 +1,131 @@
+"""
+Pre-aggregated rollup tables over ``climate_indicators``.
+
+The dashboards of ``notebooks/03_sql_queries_phase2.ipynb`` and the app's live
+mode group the whole base table for every chart (per decade, per year, per
+country). The rollups store those aggregates once per load:
+
+- ``climate_yearly``          one row per year (global mean across countries)
+- ``climate_decade``          one row per decade
+- ``climate_country_summary`` one row per country (1961-2022 statistics)
+- ``climate_country_decade``  one row per country and decade
+
+Each rollup carries ``sum_temp`` and ``sum_sq_temp`` next to the averages, so
+standard deviations (and coarser rollups) can be derived without touching the
+base table.
+
+They are plain tables rather than materialized views: the loader swaps
+``climate_indicators`` by dropping and renaming it, which a dependent view
+would block. ``refresh_rollups`` rebuilds all of them in one transaction
+(``DELETE`` + ``INSERT ... SELECT``), so readers always see a consistent set.
+It runs after every load (``src.db_loader`` and ``src.ingest``). Rebuild by
+hand with:
+
+    python -m src.rollups
+"""
+
+from sqlalchemy import inspect, text
+
+SOURCE_TABLE = 'climate_indicators'
+
+_STATS = [
+    ('avg_temp', 'DOUBLE PRECISION', 'AVG(temperature_change)'),
+    ('min_temp', 'DOUBLE PRECISION', 'MIN(temperature_change)'),
+    ('max_temp', 'DOUBLE PRECISION', 'MAX(temperature_change)'),
+    ('sum_temp', 'DOUBLE PRECISION', 'SUM(temperature_change)'),
+    ('sum_sq_temp', 'DOUBLE PRECISION', 'SUM(temperature_change * temperature_change)'),
+]
+
+# Each rollup: GROUP BY columns, extra per-group columns, row-count column and unique key.
+# Columns are (name, SQL type, expression over the base table).
+ROLLUPS = {
+    'climate_yearly': {
+        'group': [('year', 'SMALLINT NOT NULL', 'year')],
+        'extra': [],
+        'count': 'num_countries',
+        'key': ('year',),
+    },
+    'climate_decade': {
+        'group': [('decade', 'SMALLINT NOT NULL', '(year / 10) * 10')],
+        'extra': [],
+        'count': 'num_records',
+        'key': ('decade',),
+    },
+    'climate_country_summary': {
+        'group': [('country', 'TEXT NOT NULL', 'country'), ('iso3', 'TEXT NOT NULL', 'iso3')],
+        'extra': [('first_year', 'SMALLINT', 'MIN(year)'), ('last_year', 'SMALLINT', 'MAX(year)')],
+        'count': 'num_years',
+        'key': ('iso3',),
+    },
+    'climate_country_decade': {
+        'group': [('country', 'TEXT NOT NULL', 'country'), ('iso3', 'TEXT NOT NULL', 'iso3'),
+                  ('decade', 'SMALLINT NOT NULL', '(year / 10) * 10')],
+        'extra': [],
+        'count': 'num_years',
+        'key': ('iso3', 'decade'),
+    },
+}
+
+# Extra lookup indexes (the unique key index is always created)
+ROLLUP_INDEXES = {
+    'climate_country_summary': [('country',), ('avg_temp',)],
+    'climate_country_decade': [('decade',)],
+}
+
+
+def _columns(name):
+    spec = ROLLUPS[name]
+    return spec['group'] + spec['extra'] + [(spec['count'], 'INTEGER NOT NULL', 'COUNT(*)')] + _STATS
+
+
+def create_sql(name):
+    """``CREATE TABLE IF NOT EXISTS`` statement of rollup ``name``."""
+    columns = ',\n    '.join(f'{column} {sql_type}' for column, sql_type, _ in _columns(name))
+    return f'CREATE TABLE IF NOT EXISTS {name} (\n    {columns}\n)'
+
+
+def select_sql(name, source=SOURCE_TABLE):
+    """``SELECT`` computing rollup ``name`` from the base table."""
+    groups = [expr for _, _, expr in ROLLUPS[name]['group']]
+    expressions = ', '.join(expr for _, _, expr in _columns(name))
+    return f'SELECT {expressions} FROM {source} GROUP BY {", ".join(groups)}'
+
+
+def _index_statements(name):
+    key = ROLLUPS[name]['key']
+    yield f'CREATE UNIQUE INDEX IF NOT EXISTS {name}_key ON {name} ({", ".join(key)})'
+    for columns in ROLLUP_INDEXES.get(name, []):
+        yield (f'CREATE INDEX IF NOT EXISTS {name}_{"_".join(columns)} '
+               f'ON {name} ({", ".join(columns)})')
+
+
+def refresh_rollups(engine, source=SOURCE_TABLE, names=None):
+    """Rebuild the rollup tables from ``source`` in a single transaction."""
+    names = list(ROLLUPS) if names is None else list(names)
+    with engine.begin() as conn:
+        for name in names:
+            conn.execute(text(create_sql(name)))
+            for statement in _index_statements(name):
+                conn.execute(text(statement))
+            columns = ', '.join(column for column, _, _ in _columns(name))
+            conn.execute(text(f'DELETE FROM {name}'))
+            conn.execute(text(f'INSERT INTO {name} ({columns}) {select_sql(name, source)}'))
+    return names
+
+
+def ensure_rollups(engine, source=SOURCE_TABLE):
+    """Build the rollups if any of them is missing (databases loaded before they existed)."""
+    inspector = inspect(engine)
+    if not inspector.has_table(source):
+        return []
+    missing = [name for name in ROLLUPS if not inspector.has_table(name)]
+    if missing:
+        refresh_rollups(engine, source)
+    return missing
+
+
+if __name__ == "__main__":
+    from src.db import get_engine
+
+    for name in refresh_rollups(get_engine()):
+        print(f"✅ {name}")
@@ -0,0 +1,229 @@
+"""
+What-if projections for the Future Projections page, computed on request.
+
+The page used to show the fixed numbers of notebook 05 (a quadratic trend of
+the global mean, trained on one window, read against 1.5°C). A scenario lets
+the reader choose them: training window, polynomial degree, threshold, target
+year and a set of countries (``World`` is the yearly mean of all countries,
+the series of notebook 05).
+
+Refitting from the raw table on every widget change would be wasteful, so
+``ScenarioEngine`` keeps the sufficient statistics of a polynomial fit as
+prefix sums along the year axis, for every country:
+
+- ``Σ tᵏ`` for ``k = 0 ... 2·MAX_DEGREE`` and ``Σ y·tᵏ`` for ``k = 0 ... MAX_DEGREE``,
+  plus ``Σ y²`` (``t`` is the centred year in decades, as in ``src.projections``),
+- the Gram matrix ``XᵀX`` of any window and degree is a Hankel matrix of
+  ``Σ tᵏ`` over the window: two prefix-sum lookups, whatever the window
+  length. ``Xᵀy`` and the residual sum of squares follow the same way,
+- the fit is a batched solve over the selected countries, and the intervals
+  come from ``src.projections.predict``.
+
+A scenario takes a few milliseconds, most of it building the result frames.
+Recent scenarios are kept in an LRU cache, so moving a slider back and forth
+does not repeat the work:
+
+    engine = ScenarioEngine.from_frame(df)
+    curves, summary = engine.run(('World', 'Spain'), start=1961, end=2015, degree=2)
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from src.artifacts import artifact_source, read_artifact
+from src.data_loader import load_cached
+from src.projections import CONFIDENCE, HORIZON, YEAR_SCALE, country_year_matrix, predict
+
+MAX_DEGREE = 3
+DEGREES = {'linear': 1, 'quadratic': 2, 'cubic': 3}  # model name -> polynomial degree
+THRESHOLD = 1.5                                       # Paris Agreement target, °C
+TARGET_YEAR = 2030
+CACHE_SIZE = 64                                       # scenarios kept per engine
+WORLD, WORLD_ISO3 = 'World', 'WLD'
+
+CURVE_COLUMNS = [
+    'country', 'iso3', 'year', 'observed', 'in_window', 'projection', 'pi_lower', 'pi_upper',
+]
+SUMMARY_COLUMNS = [
+    'country', 'iso3', 'n_years', 'r2', 'rate', 'target_projection', 'target_lower',
+    'target_upper', 'crossing_year', 'exceeds_threshold',
+]
+
+
+class ScenarioEngine:
+    """Prefix sums of the polynomial-fit statistics of every country (plus ``World``)."""
+
+    def __init__(self, countries, iso3, years, values, cache_size=CACHE_SIZE):
+        self.countries = np.asarray(countries, dtype=object)
+        self.iso3 = np.asarray(iso3, dtype=object)
+        self.years = np.asarray(years, dtype=np.int64)
+        self.values = values                          # (countries, years), NaN = not observed
+        self.center = float(self.years.mean())
+        self.index = {country: i for i, country in enumerate(self.countries)}
+
+        observed = ~np.isnan(values)
+        t = (self.years - self.center) / YEAR_SCALE
+        powers = t[:, None] ** np.arange(2 * MAX_DEGREE + 1)      # (years, 2D + 1)
+        y = np.where(observed, values, 0.0)
+        w = observed.astype(np.float64)
+
+        def prefix(terms):
+            out = np.zeros((terms.shape[0], terms.shape[1] + 1) + terms.shape[2:])
+            np.cumsum(terms, axis=1, out=out[:, 1:])
+            return out
+
+        self.moments = prefix(w[..., None] * powers)                          # Σ tᵏ
+        self.cross = prefix(y[..., None] * powers[:, :MAX_DEGREE + 1])        # Σ y·tᵏ
+        self.sum_y = prefix(y)                                               # Σ y
+        self.sum_yy = prefix(y * y)                                          # Σ y²
+
+        self._cached_run = lru_cache(maxsize=cache_size)(self._run)
+
+    @classmethod
+    def from_frame(cls, df, cache_size=CACHE_SIZE):
+        """Build the engine of a long table (``country``, ``iso3``, ``year``, ``temperature_change``)."""
+        countries, iso3, years, values = country_year_matrix(df)
+        with np.errstate(invalid='ignore'):
+            world = np.nanmean(values, axis=0) if len(values) else np.full(len(years), np.nan)
+        return cls(
+            np.append(np.asarray(countries, dtype=object), WORLD),
+            np.append(np.asarray(iso3, dtype=object), WORLD_ISO3),
+            years,
+            np.vstack([values, world[None, :]]),
+            cache_size,
+        )
+
+    @property
+    def first_year(self):
+        return int(self.years[0])
+
+    @property
+    def last_year(self):
+        return int(self.years[-1])
+
+    # ----------------------------------------
+    # Fitting
+    # ----------------------------------------
+
+    def _window(self, start, end):
+        """Prefix-sum positions ``(lo, hi)`` of the years ``start ... end``."""
+        lo = int(np.searchsorted(self.years, start, side='left'))
+        hi = int(np.searchsorted(self.years, end, side='right'))
+        return lo, hi
+
+    def fit(self, rows, start, end, degree):
+        """Polynomial fit of ``rows`` over the years ``start ... end`` from the prefix sums.
+
+        Returns the dict of ``src.projections.fit_polynomial`` plus ``r2``;
+        rows with ``dof < 1`` are NaN.
+        """
+        if not 1 <= degree <= MAX_DEGREE:
+            raise ValueError(f"degree must be between 1 and {MAX_DEGREE}, got {degree}")
+        lo, hi = self._window(start, end)
+        p = degree + 1
+        moments = self.moments[rows, hi] - self.moments[rows, lo]
+        xty = (self.cross[rows, hi] - self.cross[rows, lo])[:, :p]
+        sy = self.sum_y[rows, hi] - self.sum_y[rows, lo]
+        syy = self.sum_yy[rows, hi] - self.sum_yy[rows, lo]
+
+        hankel = np.add.outer(np.arange(p), np.arange(p))
+        xtx = moments[:, hankel]                                   # (rows, p, p)
+        n = moments[:, 0]
+        dof = n - p
+        ok = dof >= 1        # distinct years: XᵀX is invertible once n > p
+
+        beta = np.full((len(rows), p), np.nan)
+        xtx_inv = np.full((len(rows), p, p), np.nan)
+        xtx_inv[ok] = np.linalg.inv(xtx[ok])
+        beta[ok] = np.einsum('cij,cj->ci', xtx_inv[ok], xty[ok])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sse = np.maximum(syy - np.einsum('ci,ci->c', beta, xty), 0.0)
+            sst = syy - sy * sy / n
+            s2 = np.where(ok, sse / dof, np.nan)
+            r2 = np.where(ok & (sst > 0), 1 - sse / sst, np.nan)
+        return {'beta': beta, 'xtx_inv': xtx_inv, 's2': s2, 'dof': dof, 'n': n, 'r2': r2}
+
+    def _run(self, countries, start, end, degree, threshold, target_year, horizon, confidence):
+        rows = np.array([self.index[c] for c in countries if c in self.index], dtype=np.int64)
+        fit = self.fit(rows, start, end, degree)
+        years = np.concatenate([self.years, np.arange(self.last_year + 1, horizon + 1)])
+        mean, lower, upper = predict(fit, years, degree, self.center, confidence)
+
+        observed = np.full((len(rows), len(years)), np.nan)
+        observed[:, :len(self.years)] = self.values[rows]     # observed years come first
+        n_rows, n_years = len(rows), len(years)
+        curves = pd.DataFrame({
+            'country': np.repeat(self.countries[rows], n_years),
+            'iso3': np.repeat(self.iso3[rows], n_years),
+            'year': np.tile(years, n_rows),
+            'observed': observed.ravel(),
+            'in_window': np.tile((years >= start) & (years <= end), n_rows),
+            'projection': mean.ravel(),
+            'pi_lower': lower.ravel(),
+            'pi_upper': upper.ravel(),
+        })[CURVE_COLUMNS]
+
+        # Slope of the trend at the end of the window: d/dyear of Σ βₖ tᵏ
+        t_end = (end - self.center) / YEAR_SCALE
+        k = np.arange(1, degree + 1)
+        rate = (fit['beta'][:, 1:] * k * t_end ** (k - 1)).sum(axis=1) / YEAR_SCALE
+
+        target = min(int(np.searchsorted(years, target_year)), len(years) - 1)
+        after = years > end
+        above = (mean >= threshold) & after
+        crossing = np.where(above.any(axis=1), years[np.argmax(above, axis=1)], np.nan)
+        summary = pd.DataFrame({
+            'country': self.countries[rows],
+            'iso3': self.iso3[rows],
+            'n_years': fit['n'].astype(np.int64),
+            'r2': fit['r2'],
+            'rate': rate,
+            'target_projection': mean[:, target],
+            'target_lower': lower[:, target],
+            'target_upper': upper[:, target],
+            'crossing_year': crossing,
+            'exceeds_threshold': lower[:, target] > threshold,
+        })[SUMMARY_COLUMNS]
+        return curves, summary
+
+    def run(self, countries, start, end, degree=2, threshold=THRESHOLD,
+            target_year=TARGET_YEAR, horizon=HORIZON, confidence=CONFIDENCE):
+        """Fit and project one scenario, through the engine's LRU cache.
+
+        Parameters
+        ----------
+        countries : tuple of country names (``WORLD`` for the global mean);
+            unknown names are skipped.
+        start, end : training window (inclusive years).
+        degree : polynomial degree, 1 to ``MAX_DEGREE``.
+        threshold : °C level for ``crossing_year`` (first projected year the
+            trend reaches it) and ``exceeds_threshold`` (lower bound above it
+            at ``target_year``).
+        target_year, horizon, confidence : summary year, last projected year
+            and coverage of the prediction interval.
+
+        Returns ``(curves, summary)`` with ``CURVE_COLUMNS`` (observed values
+        and the fitted/projected trend from the first year to ``horizon``) and
+        ``SUMMARY_COLUMNS`` (one row per country). Both are shared by the
+        cache: copy them before modifying.
+        """
+        return self._cached_run(tuple(countries), int(start), int(end), int(degree), float(threshold),
+                                int(target_year), int(horizon), float(confidence))
+
+    def cache_info(self):
+        return self._cached_run.cache_info()
+
+
+def load_scenario_engine():
+    """Engine over the ``climate_long`` artifact, built once per file version (None if missing)."""
+    source = artifact_source('climate_long')
+    if source is None:
+        return None
+    return load_cached(
+        source,
+        lambda p: ScenarioEngine.from_frame(read_artifact('climate_long')),
+        variant='scenario_engine',
+    )
@@ -0,0 +1,342 @@
+"""
+Incremental OLS state behind ``warming_rate``, ``trend_r2`` and ``acceleration``.
+
+The three trend features of the clustering phase are ordinary least-squares
+fits of temperature on year: over the whole series, and over its two halves
+(split at the truncated mean year) for the acceleration. An OLS fit only
+needs the sums ``n, Σx, Σy, Σxy, Σx², Σy²``, so ``TrendState`` keeps them per
+country for the full series and for each half:
+
+- ``update(rows)`` adds new country-years (or replaces revised ones) by adding
+  and subtracting their terms, O(1) per row; slope and r² are a few
+  arithmetic operations on the sums,
+- appending a year moves the split point by at most one year, so at most one
+  observation changes halves. The observed values are kept in a
+  ``(countries, years)`` grid for that lookup,
+- ``x`` is counted from ``base_year``, which keeps the raw sums well
+  conditioned (slopes and r² agree with ``stats.linregress`` to ~1e-14
+  relative, not bit for bit).
+
+The state is saved next to the artifacts (``reports/trend_state.npz``).
+Delta loads (``src.ingest``) update it in place of recomputing every
+country, the clustering stage (``src.features``) and the dashboard read the
+features from it. A saved state is only valid for the data it was built
+from: ``fingerprint()`` hashes its observed values, so a reader can check it
+against the current table (``frame_fingerprint``) before using it.
+``sync_trend_state`` does both for a consumer holding the full table: it
+applies the rows that differ from the saved state with ``update`` and only
+rebuilds when rows were removed:
+
+    state = TrendState.from_frame(df)
+    state.update(new_year_rows)
+    state.trend_features()
+    state.fingerprint() == frame_fingerprint(df)
+
+    state = sync_trend_state(df)     # saved state + update(state.changed_rows(df))
+"""
+
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import REPORTS_DIR, load_cached
+
+TREND_STATE_PATH = REPORTS_DIR / 'trend_state.npz'
+TREND_COLUMNS = ['country', 'iso3', 'warming_rate', 'trend_r2', 'acceleration', 'years_data']
+
+# Accumulators: parts x statistics
+FULL, FIRST, SECOND = 0, 1, 2
+N, SX, SY, SXY, SXX, SYY = range(6)
+
+
+def _terms(x, y):
+    return np.stack([np.ones_like(x), x, y, x * y, x * x, y * y], axis=-1)
+
+
+def ols_from_sums(sums):
+    """Slope and r² from ``(..., 6)`` accumulators; 0 for fewer than two points.
+
+    Same conventions as ``stats.linregress``: r is 0 when either variance is 0.
+    """
+    n, sx, sy, sxy, sxx, syy = np.moveaxis(sums, -1, 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ssxm = sxx - sx * sx / n
+        ssxym = sxy - sx * sy / n
+        ssym = np.maximum(syy - sy * sy / n, 0)
+        slope = ssxym / ssxm
+        r_den = np.sqrt(ssxm * ssym)
+        r = np.clip(np.where(r_den == 0.0, 0.0, ssxym / r_den), -1.0, 1.0)
+    enough = n > 1
+    return np.where(enough, slope, 0.0), np.where(enough, r * r, 0.0)
+
+
+def _fingerprint(countries, years, values):
+    order = np.lexsort((years, countries))
+    h = hashlib.sha256()
+    h.update('\x1f'.join(countries[order]).encode('utf-8'))
+    h.update(np.ascontiguousarray(years[order], dtype=np.int64).tobytes())
+    h.update(np.ascontiguousarray(values[order], dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+def frame_fingerprint(df):
+    """SHA-256 of the observed ``(country, year, temperature_change)`` of a long table.
+
+    Independent of row order; equal to ``TrendState.fingerprint()`` of the
+    state built from the same rows.
+    """
+    df = df.dropna(subset=['temperature_change'])
+    return _fingerprint(df['country'].to_numpy(dtype=str), df['year'].to_numpy(dtype=np.int64),
+                        df['temperature_change'].to_numpy(dtype=np.float64))
+
+
+class TrendState:
+    """Per-country OLS accumulators (full series and both halves) plus the observed grid."""
+
+    def __init__(self, countries, iso3, first_year, base_year, values, sums, mid):
+        self.countries = np.asarray(countries, dtype=object)
+        self.iso3 = np.asarray(iso3, dtype=object)
+        self.first_year = int(first_year)    # year of column 0 of ``values``
+        self.base_year = int(base_year)      # x = year - base_year
+        self.values = values                 # (countries, years), NaN = not observed
+        self.sums = sums                     # (3, countries, 6)
+        self.mid = mid                       # split year: first half is year <= mid
+
+    @property
+    def years(self):
+        return np.arange(self.first_year, self.first_year + self.values.shape[1])
+
+    @property
+    def n_observations(self):
+        return int(self.sums[FULL, :, N].sum())
+
+    def fingerprint(self):
+        """SHA-256 of the observed values (see ``frame_fingerprint``)."""
+        rows, cols = np.nonzero(~np.isnan(self.values))
+        return _fingerprint(self.countries.astype(str)[rows], self.years[cols], self.values[rows, cols])
+
+    def changed_rows(self, df):
+        """Rows of a long table that are new to the state or hold a different value."""
+        df = df.dropna(subset=['temperature_change'])
+        index = {country: i for i, country in enumerate(self.countries)}
+        c = df['country'].map(index).to_numpy(dtype=np.float64)
+        col = df['year'].to_numpy(dtype=np.int64) - self.first_year
+        known = ~np.isnan(c) & (col >= 0) & (col < self.values.shape[1])
+        stored = np.full(len(df), np.nan)
+        stored[known] = self.values[c[known].astype(np.int64), col[known]]
+        return df[stored != df['temperature_change'].to_numpy(dtype=np.float64)]
+
+    def copy(self):
+        return TrendState(self.countries.copy(), self.iso3.copy(), self.first_year,
+                          self.base_year, self.values.copy(), self.sums.copy(), self.mid.copy())
+
+    # ----------------------------------------
+    # Construction
+    # ----------------------------------------
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build the state of a long table (``country``, ``iso3``, ``year``, ``temperature_change``)."""
+        df = df.dropna(subset=['temperature_change'])
+        codes, countries = pd.factorize(df['country'], sort=False)
+        years = df['year'].to_numpy(dtype=np.int64)
+        first_year = int(years.min()) if len(years) else 0
+
+        first_row = np.zeros(len(countries), dtype=np.int64)
+        first_row[codes[::-1]] = np.arange(len(codes))[::-1]
+        iso3 = df['iso3'].to_numpy()[first_row]
+
+        values = np.full((len(countries), int(years.max()) - first_year + 1 if len(years) else 0), np.nan)
+        values[codes, years - first_year] = df['temperature_change'].to_numpy(dtype=np.float64)
+        state = cls(np.asarray(countries), iso3, first_year, first_year, values,
+                    np.zeros((3, len(countries), 6)), np.zeros(len(countries), dtype=np.int64))
+        state._recompute()
+        return state
+
+    def _recompute(self):
+        """Rebuild every accumulator from the observed grid."""
+        observed = ~np.isnan(self.values)
+        x = np.broadcast_to((self.years - self.base_year).astype(np.float64), self.values.shape)
+        y = np.where(observed, self.values, 0.0)
+        terms = _terms(x, y) * observed[..., None]
+
+        self.sums[FULL] = terms.sum(axis=1)
+        self.mid = self._split_year(self.sums[FULL])
+        first = observed & (self.years[None, :] <= self.mid[:, None])
+        self.sums[FIRST] = (terms * first[..., None]).sum(axis=1)
+        self.sums[SECOND] = self.sums[FULL] - self.sums[FIRST]
+
+    def _split_year(self, full):
+        # Truncated mean year of the observed years (``np.trunc(years.mean())``)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_year = self.base_year + full[:, SX] / full[:, N]
+        return np.where(full[:, N] > 0, np.trunc(mean_year), 0).astype(np.int64)
+
+    # ----------------------------------------
+    # Incremental updates
+    # ----------------------------------------
+
+    def _grow(self, countries, iso3, years):
+        """Add rows for unseen countries and columns for years outside the grid."""
+        known = set(self.countries)
+        added, added_iso3 = [], []
+        for country, code in zip(countries, iso3):
+            if country not in known:
+                known.add(country)
+                added.append(country)
+                added_iso3.append(code)
+        if added:
+            self.countries = np.concatenate([self.countries, np.asarray(added, dtype=object)])
+            self.iso3 = np.concatenate([self.iso3, np.asarray(added_iso3, dtype=object)])
+            self.values = np.vstack([self.values, np.full((len(added), self.values.shape[1]), np.nan)])
+            self.sums = np.concatenate([self.sums, np.zeros((3, len(added), 6))], axis=1)
+            self.mid = np.concatenate([self.mid, np.zeros(len(added), dtype=np.int64)])
+
+        if self.values.shape[1] == 0:
+            self.first_year = self.base_year = int(years.min())
+        before = max(self.first_year - int(years.min()), 0)
+        after = max(int(years.max()) - (self.first_year + self.values.shape[1] - 1), 0)
+        if before or after:
+            self.values = np.pad(self.values, ((0, 0), (before, after)), constant_values=np.nan)
+            self.first_year -= before
+
+    def update(self, rows):
+        """Add or revise country-years; returns the countries that changed.
+
+        ``rows`` has ``country``, ``iso3``, ``year`` and ``temperature_change``.
+        Each row costs O(1): its terms are added to the accumulators (after
+        subtracting the old value of a revised year), and observations that
+        cross a moved split point change halves.
+        """
+        rows = rows.dropna(subset=['temperature_change']).drop_duplicates(['country', 'year'], keep='last')
+        if rows.empty:
+            return []
+        countries = rows['country'].to_numpy(dtype=object)
+        years = rows['year'].to_numpy(dtype=np.int64)
+        temps = rows['temperature_change'].to_numpy(dtype=np.float64)
+        self._grow(countries, rows['iso3'].to_numpy(dtype=object), years)
+
+        index = {country: i for i, country in enumerate(self.countries)}
+        c = np.fromiter((index[country] for country in countries), dtype=np.int64, count=len(countries))
+        col = years - self.first_year
+        x = (years - self.base_year).astype(np.float64)
+        old_mid = self.mid.copy()
+        was_empty = self.sums[FULL, :, N] == 0
+
+        # Take out the old value of revised years
+        old = self.values[c, col]
+        revised = ~np.isnan(old)
+        if revised.any():
+            terms = _terms(x[revised], old[revised])
+            first = years[revised] <= old_mid[c[revised]]
+            np.subtract.at(self.sums[FULL], c[revised], terms)
+            np.subtract.at(self.sums[FIRST], c[revised][first], terms[first])
+            np.subtract.at(self.sums[SECOND], c[revised][~first], terms[~first])
+
+        self.values[c, col] = temps
+        terms = _terms(x, temps)
+        np.add.at(self.sums[FULL], c, terms)
+
+        touched = np.unique(c)
+        new_mid = self.mid.copy()
+        new_mid[touched] = self._split_year(self.sums[FULL, touched])
+        old_mid[was_empty] = new_mid[was_empty]
+        self.mid = new_mid
+
+        first = years <= new_mid[c]
+        np.add.at(self.sums[FIRST], c[first], terms[first])
+        np.add.at(self.sums[SECOND], c[~first], terms[~first])
+
+        # Older observations between the old and the new split change halves
+        written = np.zeros(self.values.shape, dtype=bool)
+        written[c, col] = True
+        shift = new_mid - old_mid
+        for step in range(int(np.abs(shift).max())):
+            moving = np.flatnonzero(np.abs(shift) > step)
+            # Years (old_mid, new_mid] join the first half; (new_mid, old_mid] leave it
+            year = np.where(shift[moving] > 0, old_mid[moving] + 1 + step, old_mid[moving] - step)
+            column = year - self.first_year
+            inside = (column >= 0) & (column < self.values.shape[1])
+            moving, year, column = moving[inside], year[inside], column[inside]
+            value = self.values[moving, column]
+            keep = ~np.isnan(value) & ~written[moving, column]
+            moving, year, value = moving[keep], year[keep], value[keep]
+            terms = _terms((year - self.base_year).astype(np.float64), value)
+            sign = np.sign(shift[moving])[:, None]
+            self.sums[FIRST, moving] += sign * terms
+            self.sums[SECOND, moving] -= sign * terms
+
+        return self.countries[touched].tolist()
+
+    # ----------------------------------------
+    # Features
+    # ----------------------------------------
+
+    def trend_features(self):
+        """``TREND_COLUMNS`` for every country in the state, in state order."""
+        slope, r2 = ols_from_sums(self.sums[FULL])
+        slope1, _ = ols_from_sums(self.sums[FIRST])
+        slope2, _ = ols_from_sums(self.sums[SECOND])
+        both = (self.sums[FIRST, :, N] > 1) & (self.sums[SECOND, :, N] > 1)
+        return pd.DataFrame({
+            'country': self.countries,
+            'iso3': self.iso3,
+            'warming_rate': slope,
+            'trend_r2': r2,
+            'acceleration': np.where(both, slope2 - slope1, 0.0),
+            'years_data': self.sums[FULL, :, N].astype(np.int64),
+        })[TREND_COLUMNS]
+
+    # ----------------------------------------
+    # Persistence
+    # ----------------------------------------
+
+    def save(self, path=TREND_STATE_PATH):
+        """Write the state to a ``.npz`` file (atomically)."""
+        path = os.fspath(path)
+        tmp = path + '.tmp.npz'
+        np.savez_compressed(
+            tmp,
+            countries=self.countries.astype(str),
+            iso3=self.iso3.astype(str),
+            first_year=self.first_year,
+            base_year=self.base_year,
+            values=self.values,
+            sums=self.sums,
+            mid=self.mid,
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=TREND_STATE_PATH):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data['countries'], data['iso3'], data['first_year'], data['base_year'],
+                       data['values'], data['sums'], data['mid'])
+
+
+def load_trend_state(path=TREND_STATE_PATH):
+    """The saved state through the process-wide cache (None if not saved yet).
+
+    The returned object is shared: ``copy()`` it before calling ``update``.
+    """
+    return load_cached(path, TrendState.load)
+
+
+def sync_trend_state(df, path=TREND_STATE_PATH):
+    """Bring the saved state up to date with the long table ``df`` and save it.
+
+    New and revised country-years go through ``update``; the state is only
+    rebuilt with ``from_frame`` when nothing is saved yet or ``df`` lacks rows
+    the state holds (fingerprint mismatch after the update).
+    """
+    if not os.path.exists(path):
+        state = TrendState.from_frame(df)
+    else:
+        state = TrendState.load(path)
+        state.update(state.changed_rows(df))
+        if state.fingerprint() != frame_fingerprint(df):
+            state = TrendState.from_frame(df)
+    state.save(path)
+    return state
@@ -0,0 +1,59 @@
+"""
+Shared fixtures: small synthetic long tables shaped like ``climate_indicators``.
+
+Every engine is checked against its straightforward reference (a per-country
+loop, ``np.polyfit``, ``stats.linregress`` ...) on the same data.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+FIRST_YEAR, LAST_YEAR = 1961, 2022
+
+
+def make_long(n_countries=12, first_year=FIRST_YEAR, last_year=LAST_YEAR, gaps=True, seed=0):
+    """Long table of quadratic trends plus noise, one row per observed country-year.
+
+    With ``gaps`` some countries start late, end early or miss single years.
+    """
+    rng = np.random.default_rng(seed)
+    years = np.arange(first_year, last_year + 1)
+    t = (years - years.mean()) / 10
+    frames = []
+    for i in range(n_countries):
+        b0, b1, b2 = rng.normal(0.5, 0.3), rng.normal(0.25, 0.1), rng.normal(0.02, 0.03)
+        values = b0 + b1 * t + b2 * t * t + rng.normal(0, 0.3, len(years))
+        keep = np.ones(len(years), dtype=bool)
+        if gaps and i % 3 == 1:
+            keep[:rng.integers(1, 15)] = False                        # late start
+        if gaps and i % 3 == 2:
+            keep[rng.choice(len(years), 6, replace=False)] = False    # missing years
+        frames.append(pd.DataFrame({
+            'country': f'Country {i:02d}',
+            'iso3': f'C{i:02d}',
+            'year': years[keep],
+            'temperature_change': values[keep],
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def empty_long():
+    """A long table with the right columns and no rows."""
+    return pd.DataFrame({
+        'country': pd.Series([], dtype=object),
+        'iso3': pd.Series([], dtype=object),
+        'year': pd.Series([], dtype=np.int64),
+        'temperature_change': pd.Series([], dtype=np.float64),
+    })
+
+
+@pytest.fixture
+def long_df():
+    return make_long()
+
+
+@pytest.fixture
+def short_df():
+    """Every country has fewer than ``MIN_YEARS`` observed years."""
+    return make_long(n_countries=3, first_year=2001, last_year=2010, gaps=False)
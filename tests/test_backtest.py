@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest import ERROR_COLUMNS, backtest_risk, backtest_trends, horizon_pairs
+from tests.conftest import make_long
+
+KEYS = ['model', 'country', 'cutoff', 'horizon']
+
+
+@pytest.fixture
+def risk_df():
+    # Shifted so that the 1.5°C outcome has both classes
+    df = make_long(n_countries=12, first_year=1961, last_year=2012)
+    return df.assign(temperature_change=df['temperature_change'] + 1.3)
+
+
+def test_horizon_pairs_match_merge(long_df):
+    frame = long_df.reset_index(drop=True)
+    year = frame['year'].to_numpy(dtype=np.int64)
+    for horizon, (source, dest) in enumerate(horizon_pairs(frame['country'], year, 3), start=1):
+        expected = (
+            frame.reset_index()
+            .merge(frame.reset_index().assign(year=frame['year'] - horizon), on=['country', 'year'])
+        )
+        assert sorted(zip(source, dest)) == sorted(zip(expected['index_x'], expected['index_y']))
+        assert (np.diff(year[dest]) >= 0).all()
+
+
+@pytest.mark.parametrize('backtest', [backtest_risk, backtest_trends])
+def test_forecasts_do_not_see_past_the_cutoff(risk_df, backtest):
+    risk_df = risk_df[risk_df['year'] <= 2004]
+    errors = backtest(risk_df, first_cutoff=1990)
+    assert list(errors.columns) == ERROR_COLUMNS
+    assert len(errors) > 0
+
+    # Rewriting every value after 1998 must not change any forecast made up to 1998
+    revised = risk_df.copy()
+    revised.loc[revised['year'] > 1998, 'temperature_change'] *= -3
+    again = backtest(revised, first_cutoff=1990)
+
+    before = errors[errors['cutoff'] <= 1998].sort_values(KEYS).reset_index(drop=True)
+    after = again[again['cutoff'] <= 1998].sort_values(KEYS).reset_index(drop=True)
+    pd.testing.assert_series_equal(before['forecast'], after['forecast'])
+
+
+def test_risk_forecasts_use_the_cutoff_year(risk_df):
+    errors = backtest_risk(risk_df, first_cutoff=2000)
+    np.testing.assert_array_equal(errors['year'], errors['cutoff'] + errors['horizon'])
+    assert errors['horizon'].between(1, 10).all()
+    assert errors['forecast'].between(0, 1).all()
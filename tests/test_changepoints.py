@@ -0,0 +1,92 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from src.changepoints import (
+    CHANGEPOINT_COLUMNS, detect_changepoints, optimal_partitions, prefix_sums, segment_costs,
+)
+from src.projections import country_year_matrix
+from tests.conftest import empty_long, make_long
+
+MIN_SEGMENT = 10
+
+
+def segment_sse(x, y):
+    slope, intercept = np.polyfit(x, y, 1)
+    return ((y - (intercept + slope * x)) ** 2).sum(), slope
+
+
+def brute_force(years, values, n_breaks, min_segment=MIN_SEGMENT):
+    """Lowest total SSE over every split of the observed years into ``n_breaks + 1`` lines.
+
+    Returns ``(sse, edges)`` with edges as positions in ``years`` (first year of each new segment).
+    """
+    observed = np.flatnonzero(~np.isnan(values))
+    best = (np.inf, None)
+    for cuts in itertools.combinations(range(1, len(observed)), n_breaks):
+        bounds = (0, *cuts, len(observed))
+        parts = [observed[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+        if min(len(part) for part in parts) < min_segment:
+            continue
+        sse = sum(segment_sse(years[part].astype(float), values[part])[0] for part in parts)
+        if sse < best[0]:
+            best = (sse, [part[0] for part in parts[1:]])
+    return best
+
+
+@pytest.fixture
+def small_df():
+    return make_long(n_countries=4, first_year=1971, last_year=2010, seed=3)
+
+
+def test_partitions_match_brute_force(small_df):
+    _, _, years, values = country_year_matrix(small_df)
+    sse, edges = optimal_partitions(segment_costs(prefix_sums(years, values), MIN_SEGMENT), 2)
+    for c in range(len(values)):
+        observed = np.flatnonzero(~np.isnan(values[c]))
+        for m in (0, 1, 2):
+            expected_sse, expected_edges = brute_force(years, values[c], m)
+            assert sse[m, c] == pytest.approx(expected_sse, rel=1e-9)
+            if expected_edges is None:                  # too few years for m breaks
+                assert np.all(edges[m][c] == -1)
+                continue
+            # Same split of the observed years (an edge inside a run of missing years is equivalent)
+            split = np.searchsorted(observed, edges[m][c])
+            np.testing.assert_array_equal(split, np.searchsorted(observed, expected_edges))
+
+
+def test_single_break_matches_brute_force(long_df):
+    result = detect_changepoints(long_df, min_segment=MIN_SEGMENT)
+    assert list(result.columns) == CHANGEPOINT_COLUMNS
+    for row in result.itertuples():
+        series = long_df[long_df['country'] == row.country].sort_values('year')
+        years = series['year'].to_numpy()
+        values = series['temperature_change'].to_numpy()
+        split_sse, (edge,) = brute_force(years, values, 1)
+
+        before = years < years[edge]
+        _, pre_slope = segment_sse(years[before].astype(float), values[before])
+        _, post_slope = segment_sse(years[~before].astype(float), values[~before])
+        assert row.break_year == years[edge - 1]
+        assert row.pre_slope == pytest.approx(pre_slope, rel=1e-8)
+        assert row.post_slope == pytest.approx(post_slope, rel=1e-8)
+
+        # Chow test of the split against one line
+        line_sse, _ = segment_sse(years.astype(float), values)
+        n = len(years)
+        f_stat = ((line_sse - split_sse) / 2) / (split_sse / (n - 4))
+        assert row.f_stat == pytest.approx(f_stat, rel=1e-8)
+        assert row.p_value == pytest.approx(stats.f.sf(f_stat, 2, n - 4), rel=1e-6)
+        assert row.significant == (row.p_value < 0.05)
+
+
+@pytest.mark.parametrize('frame', ['empty', 'short'])
+def test_no_qualifying_country_gives_empty_table(frame, short_df):
+    df = empty_long() if frame == 'empty' else short_df
+    result = detect_changepoints(df)
+    assert isinstance(result, pd.DataFrame)
+    assert result.empty
+    assert list(result.columns) == CHANGEPOINT_COLUMNS
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.exceedance import (
+    EXCEEDANCE_COLUMNS, compute_exceedance, crossing_status, crossing_times, exceedance_lookup,
+)
+from tests.conftest import empty_long
+
+THRESHOLDS = np.array([-0.5, 0.0, 0.5, 1.0, 2.0, 5.0])
+
+
+def upward_root(b0, b1, b2, h):
+    """Real root of ``b2 t² + b1 t + b0 - h`` where the polynomial rises (NaN if none), via ``np.roots``."""
+    roots = np.roots([b2, b1, b0 - h])
+    roots = roots[np.abs(roots.imag) < 1e-9].real
+    rising = roots[b1 + 2 * b2 * roots > 0]
+    assert len(rising) <= 1
+    return rising[0] if len(rising) else np.nan
+
+
+def test_crossing_times_match_np_roots():
+    rng = np.random.default_rng(0)
+    beta = np.column_stack([
+        rng.normal(0.5, 1.0, 200),
+        rng.normal(0.0, 1.0, 200),                                 # rising and falling
+        rng.choice([-1, 1], 200) * rng.uniform(1e-3, 1.0, 200),    # both curvatures
+    ])
+    result = crossing_times(beta, THRESHOLDS)
+    assert result.shape == (200, len(THRESHOLDS))
+    expected = np.array([[upward_root(*b, h) for h in THRESHOLDS] for b in beta])
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-9)
+
+
+def test_linear_trend_and_vanishing_curvature():
+    # β₂ = 0: the linear root when rising, never when falling
+    beta = np.array([[0.2, 0.5, 0.0], [0.2, -0.5, 0.0]])
+    result = crossing_times(beta, [1.0])
+    assert result[0, 0] == pytest.approx(1.6)
+    assert np.isnan(result[1, 0])
+
+    # β₂ → 0 tends to the linear root without cancellation
+    for b2 in (1e-4, 1e-8, 1e-12):
+        t = crossing_times(np.array([[0.2, 0.5, b2]]), [1.0])[0, 0]
+        assert t == pytest.approx(1.6, rel=10 * b2)
+
+
+def test_batched_shapes():
+    beta = np.random.default_rng(1).normal(size=(4, 3, 3))      # (draws, countries, p)
+    result = crossing_times(beta, THRESHOLDS)
+    assert result.shape == (4, 3, len(THRESHOLDS))
+    np.testing.assert_array_equal(result[2], crossing_times(beta[2], THRESHOLDS))
+
+
+def test_crossing_years_match_polyfit_per_country(long_df):
+    table = compute_exceedance(long_df, thresholds=(0.5, 1.0, 2.0), n_resamples=200)
+    assert list(table.columns) == EXCEEDANCE_COLUMNS
+    for row in table.itertuples():
+        series = long_df[long_df['country'] == row.country]
+        # Quadratic in the year itself, shifted to a nearby origin for conditioning
+        b2, b1, b0 = np.polyfit(series['year'] - 2000, series['temperature_change'], 2)
+        expected = 2000 + upward_root(b0, b1, b2, row.threshold)
+        if np.isnan(expected):
+            assert np.isnan(row.crossing_year)
+        else:
+            assert row.crossing_year == pytest.approx(expected, abs=1e-6)
+
+
+def test_bands_and_status_are_consistent(long_df):
+    table = compute_exceedance(long_df, n_resamples=200, horizon=2050)
+    finite = table.dropna(subset=['boot_lower', 'boot_median', 'boot_upper'])
+    assert (finite['boot_lower'] <= finite['boot_median']).all()
+    assert (finite['boot_median'] <= finite['boot_upper']).all()
+    assert table['p_by_horizon'].between(0, 1).all()
+    np.testing.assert_array_equal(
+        table['status'], crossing_status(table['crossing_year'].to_numpy(), 2022, 2050)
+    )
+
+    lookup = exceedance_lookup(table)
+    first = table.iloc[3]
+    assert lookup.loc[(first['country'], first['threshold']), 'crossing_year'] == pytest.approx(
+        first['crossing_year'], nan_ok=True)
+
+
+def test_crossing_status():
+    status = crossing_status(np.array([2000.5, 2030.0, 2070.0, np.nan]), 2022, 2050)
+    assert list(status) == ['crossed', 'projected', 'later', 'never']
+
+
+@pytest.mark.parametrize('frame', ['empty', 'short'])
+def test_no_qualifying_country_gives_empty_table(frame, short_df):
+    df = empty_long() if frame == 'empty' else short_df
+    table = compute_exceedance(df, n_resamples=10)
+    assert isinstance(table, pd.DataFrame)
+    assert table.empty
+    assert list(table.columns) == EXCEEDANCE_COLUMNS
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from src.features import FEATURE_COLUMNS, compute_country_features, refresh_country_features
+from src.trend_state import TrendState
+from tests.conftest import make_long
+
+TREND_FEATURES = ['warming_rate', 'trend_r2', 'acceleration']
+
+
+def notebook_features(df, early_period=(1961, 1980), recent_period=(2010, 2022)):
+    """The FEATURE ENGINEERING loop of notebooks/07_clustering_phase5.ipynb."""
+    features_list = []
+    for country in df['country'].unique():
+        country_data = df[df['country'] == country].copy()
+        if len(country_data) < 30:
+            continue
+        temps = country_data['temperature_change'].values
+        years = country_data['year'].values
+        mean_temp, std_temp = temps.mean(), temps.std()
+
+        slope, _, r_value, _, _ = stats.linregress(years, temps)
+
+        period = country_data['year'].between(*early_period)
+        early_data = country_data.loc[period, 'temperature_change']
+        early_mean, early_std = (early_data.mean(), early_data.std()) if len(early_data) else (0, 0)
+        period = country_data['year'].between(*recent_period)
+        recent_data = country_data.loc[period, 'temperature_change']
+        recent_mean, recent_std = (
+            (recent_data.mean(), recent_data.std()) if len(recent_data) else (mean_temp, std_temp)
+        )
+
+        mid_year = int(years.mean())
+        first_half = country_data[country_data['year'] <= mid_year]
+        second_half = country_data[country_data['year'] > mid_year]
+        if len(first_half) > 1 and len(second_half) > 1:
+            slope1 = stats.linregress(first_half['year'], first_half['temperature_change'])[0]
+            slope2 = stats.linregress(second_half['year'], second_half['temperature_change'])[0]
+            acceleration = slope2 - slope1
+        else:
+            acceleration = 0
+
+        features_list.append({
+            'country': country,
+            'iso3': country_data['iso3'].iloc[0],
+            'mean_temp': mean_temp,
+            'std_temp': std_temp,
+            'median_temp': np.median(temps),
+            'max_temp': temps.max(),
+            'min_temp': temps.min(),
+            'warming_rate': slope,
+            'trend_r2': r_value ** 2,
+            'early_mean': early_mean,
+            'early_std': early_std,
+            'recent_mean': recent_mean,
+            'recent_std': recent_std,
+            'period_change': recent_mean - early_mean,
+            'acceleration': acceleration,
+            'years_data': len(country_data),
+        })
+    return pd.DataFrame(features_list)
+
+
+@pytest.fixture
+def shuffled_df():
+    # Rows out of (country, year) order and a country with no recent years
+    df = make_long(n_countries=15)
+    df = df[~((df['country'] == 'Country 03') & (df['year'] >= 2005))]
+    return df.sample(frac=1, random_state=1).reset_index(drop=True)
+
+
+def test_features_match_notebook_loop(shuffled_df):
+    expected = notebook_features(shuffled_df.sort_values(['country', 'year'], kind='stable'))
+    result = compute_country_features(shuffled_df)
+    result = result.set_index('country').loc[expected['country']].reset_index()
+
+    assert list(result.columns) == FEATURE_COLUMNS
+    # Same arithmetic as the loop: equal value for value
+    exact = [c for c in FEATURE_COLUMNS if c not in TREND_FEATURES]
+    pd.testing.assert_frame_equal(result[exact], expected[exact], check_dtype=False,
+                                  check_exact=True)
+    # OLS from running sums agrees with linregress to rounding
+    pd.testing.assert_frame_equal(result[TREND_FEATURES], expected[TREND_FEATURES],
+                                  rtol=1e-9, atol=1e-13)
+
+
+def test_countries_in_order_of_first_appearance(shuffled_df):
+    result = compute_country_features(shuffled_df)
+    assert list(result['country']) == list(dict.fromkeys(shuffled_df['country']))
+
+
+def test_saved_trend_state_gives_same_features(shuffled_df):
+    state = TrendState.from_frame(shuffled_df)
+    pd.testing.assert_frame_equal(compute_country_features(shuffled_df, trend_state=state),
+                                  compute_country_features(shuffled_df))
+
+
+def test_refresh_matches_full_recompute(shuffled_df):
+    features = compute_country_features(shuffled_df)
+    revised = shuffled_df.copy()
+    revised.loc[revised['country'] == 'Country 05', 'temperature_change'] += 0.25
+    refreshed = refresh_country_features(features, revised, ['Country 05'])
+    pd.testing.assert_frame_equal(refreshed, compute_country_features(revised))
@@ -0,0 +1,84 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.model_zoo import (
+    FORECAST_COLUMNS, TASK_COLUMNS, SegmentedTrend, TaskTimeout, _time_limit, run_zoo,
+)
+
+FUTURE = np.arange(2023, 2031)
+
+
+def test_polynomial_forecasts_match_polyfit(long_df):
+    forecasts, tasks = run_zoo(long_df, models=('linear', 'quadratic'), horizon=2030,
+                               n_jobs=1, cache_dir=None)
+    assert list(forecasts.columns) == FORECAST_COLUMNS
+    assert set(tasks['status']) == {'ok'}
+    for (country, model), result in forecasts.groupby(['country', 'model']):
+        series = long_df[long_df['country'] == country]
+        degree = {'linear': 1, 'quadratic': 2}[model]
+        coefficients = np.polyfit(series['year'] - 2000, series['temperature_change'], degree)
+        np.testing.assert_array_equal(result['year'], FUTURE)
+        np.testing.assert_allclose(result['forecast'], np.polyval(coefficients, FUTURE - 2000), rtol=1e-9)
+        assert (result['lower'] < result['forecast']).all()
+        assert (result['forecast'] < result['upper']).all()
+
+
+def test_segmented_trend_matches_exhaustive_search(long_df):
+    series = long_df[long_df['country'] == 'Country 02']       # has missing years
+    years = np.arange(1961, 2023)
+    values = series.set_index('year')['temperature_change'].reindex(years).to_numpy()
+    model = SegmentedTrend(min_segment=10).fit(years, values)
+
+    observed_years = series['year'].to_numpy(dtype=np.float64)
+    y = series['temperature_change'].to_numpy()
+    best = None
+    for tau in observed_years[9:len(observed_years) - 10]:
+        X = np.column_stack([np.ones_like(observed_years), observed_years,
+                             np.maximum(observed_years - tau, 0)])
+        beta, *_ = np.linalg.lstsq(X, y, rcond=None)
+        sse = ((y - X @ beta) ** 2).sum()
+        if best is None or sse < best[0]:
+            best = (sse, tau, beta)
+
+    _, tau, beta = best
+    assert model.breakpoint == tau
+    assert model.slopes == pytest.approx((beta[1], beta[1] + beta[2]), rel=1e-9)
+    mean, _, _ = model.forecast(FUTURE)
+    expected = beta[0] + beta[1] * FUTURE + beta[2] * np.maximum(FUTURE - tau, 0)
+    np.testing.assert_allclose(mean, expected, rtol=1e-9)
+
+
+def test_cached_rerun_returns_same_forecasts(long_df, tmp_path):
+    first, tasks = run_zoo(long_df, models=('linear', 'segmented'), horizon=2030,
+                           n_jobs=1, cache_dir=tmp_path)
+    assert set(tasks['status']) == {'ok'}
+
+    # One country revised: only its tasks are refitted
+    revised = long_df.copy()
+    revised.loc[revised['country'] == 'Country 04', 'temperature_change'] += 0.1
+    second, tasks = run_zoo(revised, models=('linear', 'segmented'), horizon=2030,
+                            n_jobs=1, cache_dir=tmp_path)
+    refitted = tasks.loc[tasks['status'] == 'ok', 'country']
+    assert set(refitted) == {'Country 04'}
+    assert (tasks.loc[tasks['country'] != 'Country 04', 'status'] == 'cached').all()
+
+    unchanged = first['country'] != 'Country 04'
+    np.testing.assert_array_equal(second.loc[unchanged, 'forecast'], first.loc[unchanged, 'forecast'])
+
+
+def test_failures_are_reported_not_raised(long_df):
+    forecasts, tasks = run_zoo(long_df, models=('linear', 'segmented'), horizon=2030, n_jobs=1,
+                               cache_dir=None, params={'segmented': {'min_segment': 40}})
+    assert list(tasks.columns) == TASK_COLUMNS
+    failed = tasks[tasks['model'] == 'segmented']
+    assert (failed['status'] == 'failed').all()
+    assert failed['message'].str.startswith('ValueError').all()
+    assert set(forecasts['model']) == {'linear'}
+
+
+def test_time_limit():
+    with pytest.raises(TaskTimeout):
+        with _time_limit(0.05):
+            time.sleep(1)
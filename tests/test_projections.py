@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+
+from src.projections import (
+    PROJECTION_COLUMNS, compute_country_projections, country_year_matrix, refresh_country_projections,
+)
+from tests.conftest import empty_long, make_long
+
+
+@pytest.mark.parametrize('model, degree', [('linear', 1), ('quadratic', 2)])
+def test_projections_match_statsmodels_per_country(long_df, model, degree):
+    projections = compute_country_projections(long_df, horizon=2040)
+    projections = projections[projections['model'] == model]
+    future = np.arange(2023, 2041)
+    for country, series in long_df.groupby('country'):
+        # Same polynomial in the year shifted to 2000 (any origin gives the same fit)
+        x = series['year'].to_numpy() - 2000.0
+        fit = sm.OLS(series['temperature_change'].to_numpy(), np.vander(x, degree + 1)).fit()
+        expected = fit.get_prediction(np.vander(future - 2000.0, degree + 1)).summary_frame(alpha=0.05)
+
+        result = projections[projections['country'] == country]
+        np.testing.assert_array_equal(result['year'], future)
+        np.testing.assert_allclose(result['projection'], expected['mean'], rtol=1e-9)
+        np.testing.assert_allclose(result['pi_lower'], expected['obs_ci_lower'], rtol=1e-9)
+        np.testing.assert_allclose(result['pi_upper'], expected['obs_ci_upper'], rtol=1e-9)
+
+
+def test_layout(long_df):
+    projections = compute_country_projections(long_df, horizon=2030)
+    assert list(projections.columns) == PROJECTION_COLUMNS
+    countries = list(dict.fromkeys(long_df['country']))
+    expected = pd.MultiIndex.from_product([countries, ['linear', 'quadratic'], range(2023, 2031)])
+    assert list(zip(projections['country'], projections['model'], projections['year'])) == list(expected)
+
+
+def test_country_year_matrix(long_df):
+    countries, iso3, years, values = country_year_matrix(long_df.sample(frac=1, random_state=0))
+    assert list(years) == list(range(1961, 2023))
+    assert set(countries) == set(long_df['country'])
+    for c, country in enumerate(countries):
+        series = long_df[long_df['country'] == country].set_index('year')['temperature_change']
+        np.testing.assert_array_equal(values[c], series.reindex(years).to_numpy())
+        assert iso3[c] == long_df.loc[long_df['country'] == country, 'iso3'].iloc[0]
+
+
+def test_refresh_keeps_order_and_matches_full_recompute(long_df):
+    projections = compute_country_projections(long_df)
+    revised = long_df.copy()
+    revised.loc[revised['country'] == 'Country 03', 'temperature_change'] += 0.2
+    newcomer = make_long(n_countries=1, gaps=False, seed=5).assign(country='Newland', iso3='NEW')
+    revised = pd.concat([revised, newcomer], ignore_index=True)
+
+    refreshed = refresh_country_projections(projections, revised, ['Country 03', 'Newland'])
+    pd.testing.assert_frame_equal(refreshed, compute_country_projections(revised))
+
+
+@pytest.mark.parametrize('frame', ['empty', 'short'])
+def test_no_qualifying_country_gives_empty_projections(frame, short_df):
+    df = empty_long() if frame == 'empty' else short_df
+    projections = compute_country_projections(df)
+    assert isinstance(projections, pd.DataFrame)
+    assert projections.empty
+    assert list(projections.columns) == PROJECTION_COLUMNS
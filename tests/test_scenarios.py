@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from src.projections import YEAR_SCALE
+from src.scenarios import SUMMARY_COLUMNS, WORLD, ScenarioEngine
+
+
+@pytest.fixture
+def engine(long_df):
+    return ScenarioEngine.from_frame(long_df)
+
+
+def polyfit_window(engine, row, start, end, degree):
+    """``np.polyfit`` of one row over the observed years of the window, in the engine's units."""
+    in_window = (engine.years >= start) & (engine.years <= end) & ~np.isnan(engine.values[row])
+    t = (engine.years[in_window] - engine.center) / YEAR_SCALE
+    y = engine.values[row, in_window]
+    coefficients = np.polyfit(t, y, degree)
+    residuals = y - np.polyval(coefficients, t)
+    sse, sst = (residuals ** 2).sum(), ((y - y.mean()) ** 2).sum()
+    return coefficients[::-1], sse / (len(y) - degree - 1), 1 - sse / sst
+
+
+@pytest.mark.parametrize('degree', [1, 2, 3])
+@pytest.mark.parametrize('window', [(1961, 2022), (1961, 1990), (1975, 2015), (2000, 2022)])
+def test_fit_matches_polyfit(engine, degree, window):
+    rows = np.arange(len(engine.countries))
+    fit = engine.fit(rows, *window, degree)
+    # Normal equations: ~1e-14 for lines, ~1e-10 for cubics on short off-centre windows
+    for row in rows:
+        beta, s2, r2 = polyfit_window(engine, row, *window, degree)
+        np.testing.assert_allclose(fit['beta'][row], beta, rtol=1e-8, atol=1e-9)
+        assert fit['s2'][row] == pytest.approx(s2, rel=1e-8)
+        assert fit['r2'][row] == pytest.approx(r2, rel=1e-8)
+
+
+def test_world_is_the_yearly_mean(engine, long_df):
+    world = long_df.groupby('year')['temperature_change'].mean()
+    np.testing.assert_allclose(engine.values[engine.index[WORLD]], world.to_numpy())
+
+
+def test_too_short_window_is_nan(engine):
+    fit = engine.fit(np.array([0]), 2000, 2002, 2)
+    assert np.isnan(fit['beta']).all()
+    with pytest.raises(ValueError):
+        engine.fit(np.array([0]), 1961, 2022, 4)
+
+
+def test_run_summary_and_cache(engine):
+    countries = (WORLD, 'Country 00', 'Unknown')
+    curves, summary = engine.run(countries, 1961, 2015, degree=2, threshold=1.0, target_year=2030)
+    assert list(summary.columns) == SUMMARY_COLUMNS
+    assert list(summary['country']) == [WORLD, 'Country 00']
+
+    beta, _, _ = polyfit_window(engine, engine.index[WORLD], 1961, 2015, 2)
+    t_target = (2030 - engine.center) / YEAR_SCALE
+    world = summary.iloc[0]
+    assert world['target_projection'] == pytest.approx(np.polyval(beta[::-1], t_target), rel=1e-9)
+    assert world['target_lower'] < world['target_projection'] < world['target_upper']
+
+    # Rate: derivative of the fitted polynomial at the end of the window, per year
+    t_end = (2015 - engine.center) / YEAR_SCALE
+    assert world['rate'] == pytest.approx(np.polyval(np.polyder(beta[::-1]), t_end) / YEAR_SCALE, rel=1e-9)
+
+    again = engine.run(countries, 1961, 2015, degree=2, threshold=1.0, target_year=2030)
+    assert again[0] is curves
+    assert engine.cache_info().hits == 1
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from src.trend_state import TREND_COLUMNS, TrendState, frame_fingerprint, sync_trend_state
+from tests.conftest import make_long
+
+
+def assert_same_state(result, expected):
+    pd.testing.assert_frame_equal(result.trend_features(), expected.trend_features(),
+                                  rtol=1e-10, atol=1e-12)
+    np.testing.assert_array_equal(result.mid, expected.mid)
+    np.testing.assert_allclose(result.sums, expected.sums, rtol=1e-10, atol=1e-9)
+
+
+def test_trend_features_match_linregress(long_df):
+    trend = TrendState.from_frame(long_df).trend_features()
+    assert list(trend.columns) == TREND_COLUMNS
+    for row in trend.itertuples():
+        series = long_df[long_df['country'] == row.country]
+        fit = stats.linregress(series['year'], series['temperature_change'])
+        assert row.warming_rate == pytest.approx(fit.slope, rel=1e-10)
+        assert row.trend_r2 == pytest.approx(fit.rvalue ** 2, rel=1e-10)
+        assert row.years_data == len(series)
+
+
+def test_update_with_new_years_matches_from_frame(long_df):
+    state = TrendState.from_frame(long_df[long_df['year'] <= 2015])
+    for year in range(2016, 2023):
+        state.update(long_df[long_df['year'] == year])
+    assert_same_state(state, TrendState.from_frame(long_df))
+
+
+def test_update_with_revisions_and_new_countries_matches_from_frame(long_df):
+    start = long_df[(long_df['year'] <= 2018) & (long_df['country'] != 'Country 07')]
+    state = TrendState.from_frame(start)
+
+    rng = np.random.default_rng(4)
+    final = long_df.copy()
+    revised = final.sample(40, random_state=2).index
+    final.loc[revised, 'temperature_change'] += rng.normal(0, 0.5, len(revised))
+    # Revised old years, appended years and a country new to the state, in one batch
+    delta = pd.concat([final.loc[revised], final[final['year'] > 2018],
+                       final[final['country'] == 'Country 07']]).drop_duplicates()
+    changed = state.update(delta.sample(frac=1, random_state=3))
+
+    assert set(changed) == set(delta['country'])
+    expected = TrendState.from_frame(final)
+    order = pd.Index(state.countries).get_indexer(expected.countries)
+    pd.testing.assert_frame_equal(
+        state.trend_features().iloc[order].reset_index(drop=True), expected.trend_features(),
+        rtol=1e-10, atol=1e-12,
+    )
+
+
+def test_copy_is_independent(long_df):
+    state = TrendState.from_frame(long_df[long_df['year'] <= 2015])
+    before = state.trend_features()
+    state.copy().update(long_df[long_df['year'] > 2015])
+    pd.testing.assert_frame_equal(state.trend_features(), before)
+
+
+def test_save_and_load_round_trip(long_df, tmp_path):
+    state = TrendState.from_frame(long_df)
+    state.save(tmp_path / 'trend_state.npz')
+    loaded = TrendState.load(tmp_path / 'trend_state.npz')
+    pd.testing.assert_frame_equal(loaded.trend_features(), state.trend_features())
+    assert loaded.fingerprint() == state.fingerprint()
+
+
+def test_fingerprint_follows_values_not_row_order(long_df):
+    state = TrendState.from_frame(long_df)
+    assert state.fingerprint() == frame_fingerprint(long_df.sample(frac=1, random_state=5))
+
+    # Same number of observations, one value rewritten
+    revised = long_df.copy()
+    revised.loc[10, 'temperature_change'] += 0.1
+    assert len(revised) == state.n_observations
+    assert frame_fingerprint(revised) != state.fingerprint()
+
+
+def test_sync_updates_the_saved_state(long_df, tmp_path, monkeypatch):
+    path = tmp_path / 'trend_state.npz'
+    TrendState.from_frame(long_df[long_df['year'] <= 2015]).save(path)
+    revised = long_df.copy()
+    revised.loc[revised.index[:3], 'temperature_change'] += 0.5
+
+    changed = TrendState.load(path).changed_rows(revised)
+    assert set(changed.index) == set(revised.index[:3]) | set(revised.index[revised['year'] > 2015])
+
+    # Applied with update, not rebuilt
+    monkeypatch.setattr(TrendState, 'from_frame', classmethod(lambda cls, df: pytest.fail('rebuilt')))
+    state = sync_trend_state(revised, path)
+    monkeypatch.undo()
+    assert state.fingerprint() == frame_fingerprint(revised)
+    assert TrendState.load(path).fingerprint() == frame_fingerprint(revised)
+    assert_same_state(state, TrendState.from_frame(revised))
+
+
+def test_sync_rebuilds_when_rows_were_removed(long_df, tmp_path):
+    path = tmp_path / 'trend_state.npz'
+    TrendState.from_frame(long_df).save(path)
+    fewer = long_df[long_df['country'] != 'Country 05']
+    state = sync_trend_state(fewer, path)
+    assert 'Country 05' not in set(state.countries)
+    assert state.fingerprint() == frame_fingerprint(fewer)
+
+
+def test_empty_frame():
+    empty = make_long(n_countries=1).iloc[:0]
+    state = TrendState.from_frame(empty)
+    assert state.n_observations == 0
+    assert state.trend_features().empty
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.projections import country_year_matrix, design_matrix
+from src.uncertainty import (
+    UNCERTAINTY_COLUMNS, _resample_index, bootstrap_projections, prepare_bootstrap,
+    resample_coefficients, simulate_futures,
+)
+from tests.conftest import empty_long
+
+
+@pytest.mark.parametrize('method', ['residual', 'block'])
+@pytest.mark.parametrize('degree', [1, 2])
+def test_resampled_coefficients_match_explicit_refit(long_df, method, degree):
+    countries, _, years, values = country_year_matrix(long_df)
+    center = years.mean()
+    state = prepare_bootstrap(years, values, degree, np.arange(2023, 2031), center)
+
+    size = 5
+    beta_star = resample_coefficients(state, np.random.default_rng(7), size, method)
+    index = _resample_index(np.random.default_rng(7), size, state['n_obs'],
+                            state['residuals'].shape[1], method, 5)
+
+    X = design_matrix(years, degree, center)
+    for c in range(len(countries)):
+        observed = ~np.isnan(values[c])
+        n = observed.sum()
+        X_c = X[observed]
+        for b in range(size):
+            # Resampled series: fitted trend plus the drawn (inflated) residuals
+            y_star = X_c @ state['beta'][c] + state['residuals'][c, index[b, c, :n]]
+            expected, *_ = np.linalg.lstsq(X_c, y_star, rcond=None)
+            np.testing.assert_allclose(beta_star[b, c], expected, rtol=1e-9, atol=1e-12)
+
+
+def test_draws_do_not_depend_on_n_jobs(long_df):
+    # Chunk seeds are spawned per chunk, so only n_jobs varies (chunk_size is fixed)
+    _, _, years, values = country_year_matrix(long_df)
+    state = prepare_bootstrap(years, values, 2, np.arange(2023, 2031), years.mean())
+    serial = simulate_futures(state, n_resamples=40, seed=3, chunk_size=10, n_jobs=1)
+    parallel = simulate_futures(state, n_resamples=40, seed=3, chunk_size=10, n_jobs=2)
+    np.testing.assert_array_equal(serial, parallel)
+
+
+def test_bands_cover_every_country_model_and_year(long_df):
+    bands = bootstrap_projections(long_df, n_resamples=50, horizon=2030)
+    assert list(bands.columns) == UNCERTAINTY_COLUMNS
+    assert len(bands) == long_df['country'].nunique() * 2 * len(range(2023, 2031))
+    assert (bands['boot_lower'] <= bands['boot_median']).all()
+    assert (bands['boot_median'] <= bands['boot_upper']).all()
+
+
+@pytest.mark.parametrize('frame', ['empty', 'short'])
+def test_no_qualifying_country_gives_empty_bands(frame, short_df):
+    df = empty_long() if frame == 'empty' else short_df
+    bands = bootstrap_projections(df, n_resamples=10)
+    assert isinstance(bands, pd.DataFrame)
+    assert bands.empty
+    assert list(bands.columns) == UNCERTAINTY_COLUMNS